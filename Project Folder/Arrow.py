@@ -7,15 +7,33 @@
 # |                                                                           |
 # \___________________________________________________________________________/
 
-from random import randint
+from Projectile_pool import get_pool, next_attack_identifier
+import Entities
+import Assets
 import pygame
 
 class Arrow():
     ARROW_SPEED = 6
     RANGE = 100
 
+    # -------------------------------------------------------
+    #    Arrows are reused through the pool of their store 
+    #    so they only keep a fixed set of variables. 
+    #    __weakref__ lets the store free the row of dropped
+    #                        arrows.
+    # -------------------------------------------------------
+    __slots__ = (
+        "direction", "damage", "image", "identifier", "num", 
+        "attack_identifier", "store", "entity", "height", "min_value", 
+        "max_value", "__weakref__"
+    )
+
+    # Variables kept in the entity store.
+    pos = Entities.component ("pos")
+
     def __init__(
         self,
+        store: Entities.Store,
         pos: "list[int]",
         damage: int,
         image: pygame.Surface,
@@ -23,6 +41,44 @@ class Arrow():
         identifier: int,
         attack_number: int
     ):
+        """
+        Initialize the arrow. Use the acquire of the pool from 
+        Projectile_pool.get_pool to reuse old arrows.
+
+        Args:
+            store (Entities.Store): The entity store of the match.
+            pos (list[int]): The position of the character shooting.
+            damage (int): The damage the arrow deals.
+            image (pygame.Surface):
+                The arrow image already facing the direction of travel.
+            direction (bool): Is the arrow moving right.
+            identifier (int): The identifier of the character shooting.
+            attack_number (int): The attack number of the arrow.
+        """
+        self.store = store
+        self.entity = store.add (self)
+        self.reset (pos, damage, image, direction, identifier, attack_number)
+
+
+
+    # /////////////////////
+    #   Public functions.
+    # /////////////////////
+
+
+    def reset (
+        self,
+        pos: "list[int]",
+        damage: int,
+        image: pygame.Surface,
+        direction: bool,
+        identifier: int,
+        attack_number: int
+    ) -> None:
+        """
+        Set the arrow up for a new shot. Takes the same arguments as 
+        __init__.
+        """
         # ---------------------
         #   Unseen variables.
         # ---------------------
@@ -31,65 +87,64 @@ class Arrow():
         self.image = image
         self.identifier = identifier
         self.num = attack_number
-        self.attack_identifier = randint (0, 100000000000000000000000000000000)
+        self.attack_identifier = next_attack_identifier ()
+
+        # -------------------------------
+        #   Set the range of the arrow.
+        # -------------------------------
+        self.min_value = pos[0] + 1 - self.RANGE
+        self.max_value = pos[0] + 1 + self.RANGE
 
         # -------------
         #   Movement.
         # -------------
-        self.character_pos = [pos[0] + 1, pos[1] + 1]
-        self.pos = pos
+        self.store.reset (
+            self.entity,
+            pos=pos,
+            vel=[self.ARROW_SPEED if (direction) else -self.ARROW_SPEED, 0],
+            x_range=[self.min_value, self.max_value],
+            projectile=True
+        )
         self.height = self.image.get_height ()
-        self.pos[1] += self.height // 3
-
-        # -------------------------------
-        #   Set the range of the arrow.
-        # -------------------------------
-        self.min_value = self.character_pos[0] - self.RANGE
-        self.max_value = self.character_pos[0] + self.RANGE
         
         # -----------------------------------
         #   Set the direction of the arrow.
         # -----------------------------------
+        pos = self.pos
+        pos[1] += self.height // 3
         if (self.direction):
-            self.pos[0] += self.image.get_width () // 4
+            pos[0] += self.image.get_width () // 4
         
         elif (not self.direction):
-            self.pos[0] -= self.image.get_width () // 4
-            self.image = pygame.transform.flip (image, True, False)
-        
+            pos[0] -= self.image.get_width () // 4
 
+    def release (self) -> None:
+        """
+        Give the arrow back to the pool once it is off the screen.
+        """
+        get_pool (self.store, Arrow).release (self)
 
-    # /////////////////////
-    #   Public functions.
-    # /////////////////////
+    def update (self) -> bool:
+        """
+        Check if the arrow is still flying. Every arrow is moved forward at 
+        once by Entities.Store.update_projectiles.
 
+        Returns:
+            bool: Keep this object or not.
+        """
+        return not self.store.get ("expired")[self.entity]
 
-    def draw (self, window: pygame.surface.Surface) -> bool:
+    def draw (self, window: pygame.surface.Surface) -> None:
         """
         Draw the arrow on the screen.
 
         Args:
             window (pygame.surface.Surface): Main window to draw arrow on.
-
-        Returns:
-            bool: Delete this object or not.
         """
-
-        if (self.direction):
-            value = self.ARROW_SPEED
-
-        else:
-            value = -self.ARROW_SPEED
-
-        if (self.min_value <= self.pos[0] + value <= self.max_value):
-            self.pos[0] += value
-            window.blit (
-                self.image,
-                self.pos
-            )
-            return True
-
-        return False
+        window.blit (
+            self.image,
+            self.pos
+        )
 
     def get_attacking (self) -> int:
         """
@@ -131,6 +186,30 @@ class Arrow():
         else:
             return False
 
+    def get_rect (self) -> pygame.Rect:
+        """
+        Get the rectangle around the arrow. Used to skip 
+        the mask check between objects that are far apart.
+
+        Returns:
+            pygame.Rect: The rectangle.
+        """
+        return pygame.Rect (
+            int (self.pos[0]), 
+            int (self.pos[1]), 
+            self.image.get_width (), 
+            self.image.get_height ()
+        )
+
+    def get_draw_rects (self) -> "list[pygame.Rect]":
+        """
+        Get the area of the screen the arrow is drawn on.
+
+        Returns:
+            list[pygame.Rect]: The rectangle.
+        """
+        return [self.get_rect ()]
+
     def get_mask (self) -> pygame.mask.Mask:
         """
         Gets the mask of the current image on the screen.
@@ -139,8 +218,17 @@ class Arrow():
             pygame.mask.Mask or None:
                 Returns the mask if an image is on the screen.
         """
-        return pygame.mask.from_surface (self.image)
+        return Assets.get_mask (self.image)
     
+    def get_mask_pos (self) -> "list[int]":
+        """
+        Get the top left of the mask, the same as the position.
+
+        Returns:
+            list[int]: The position.
+        """
+        return self.pos
+
     def get_pos (self) -> "list[int]":
         """
         Get the position of the arrow.
@@ -195,7 +283,8 @@ class Arrow():
         Returns:
             list[int]:
                 Returns a list with the difference in
-                x position and y position in a list.
+                x position and y position of the masks in a list.
         """
-        pos = object.get_pos ()
-        return [int (self.pos[0] - pos[0]), int (self.pos[1] - pos[1])]
\ No newline at end of file
+        pos = object.get_mask_pos ()
+        return [int (self.pos[0] - pos[0]), int (self.pos[1] - pos[1])]
+
@@ -0,0 +1,575 @@
+#  ___________________________________________________________________________
+# /                                  Assets                 Date: 2026-10-18 \
+# |                                                                           |
+# |                                Description                                |
+# |                                                                           |
+# | Process wide cache for every image the game loads. Images are decoded and |
+# | converted once per resolved path and the animation frame lists are shared |
+# |                  between every character that uses them.                  |
+# |                                                                           |
+# |  If IMGS.bundle (made with bundle_images.py) is next to the python files  |
+# |  the images are built straight from its memory-mapped raw pixels instead  |
+# | of decoding the PNG/JPG files. Images and manifests changed on disk since |
+# |      the bundle was made are read from disk instead, with a warning.      |
+# |                                                                           |
+# | Functions:                                                                |
+# |     load_image:                                                           |
+# |         - Load (or reuse) a converted pygame.Surface for a path.          |
+# |                                                                           |
+# |     load_scaled_image:                                                    |
+# |         - Load (or reuse) an image scaled to a size.                      |
+# |                                                                           |
+# |     load_flipped_image:                                                   |
+# |         - Load (or reuse) the horizontally mirrored version of an image.  |
+# |                                                                           |
+# |     get_animations:                                                       |
+# |         - Get the cached animations for a character images folder.        |
+# |                                                                           |
+# |     get_flipped_animations:                                               |
+# |         - Get the left facing animations for a character images folder.   |
+# |                                                                           |
+# |     store_animations:                                                     |
+# |         - Freeze and cache the animations for a character images folder.  |
+# |           Both the right and left facing frames are built here.           |
+# |                                                                           |
+# |     get_mask:                                                             |
+# |         - Get the collision mask of a cached surface.                     |
+# |                                                                           |
+# |     get_bottom_rows:                                                      |
+# |         - Get the lowest solid row of each column of a cached surface.    |
+# |                                                                           |
+# |     get_manifest:                                                         |
+# |         - Get the manifest the cached animations were loaded with.        |
+# |                                                                           |
+# |     get_bundled_manifest:                                                 |
+# |         - Get the manifest of a character from the bundle.                |
+# |                                                                           |
+# |     get_source_stamp:                                                     |
+# |         - Get the modified time and size a bundled file is checked by.    |
+# |                                                                           |
+# \___________________________________________________________________________/
+
+import warnings
+import pygame
+import struct
+import json
+import mmap
+import os
+
+# ----------------------------------------------------
+#   Layout of the bundle file:
+#       MAGIC, index length (<Q), JSON index, padding
+#       up to DATA_ALIGN, raw RGBA pixels.
+#   The index holds the stamp of every file that was
+#   bundled so files changed since are read instead.
+# ----------------------------------------------------
+BUNDLE_NAME = "IMGS.bundle"
+BUNDLE_MAGIC = b"SSBPACK1"
+BUNDLE_HEADER = struct.Struct ("<Q")
+DATA_ALIGN = 16
+
+# -------------------------------------------------------
+#   Caches keyed by the resolved path of the image or
+#   images folder. Each value is [data, converted] and
+#   for animations [right, left, converted].
+# -------------------------------------------------------
+_images = {}
+_scaled_images = {}
+_flipped_images = {}
+_animations = {}
+_manifests = {}
+
+# ----------------------------------------------------
+#   Collision masks and the lowest solid row of each
+#   column keyed by the surface they belong to. Cached
+#   surfaces never change so neither do their masks.
+# ----------------------------------------------------
+_masks = {}
+_bottom_rows = {}
+
+# [checked, Bundle or None]
+_bundle = [False, None]
+
+
+class Bundle ():
+    def __init__ (self, path: str):
+        """
+        Open and memory-map a bundle made by bundle_images.py.
+
+        Args:
+            path (str): The path to the bundle file.
+        """
+        self.root = os.path.dirname (os.path.realpath (path))
+        self.file = open (path, "rb")
+        self.data = mmap.mmap (self.file.fileno (), 0, access=mmap.ACCESS_READ)
+        self.view = memoryview (self.data)
+
+        if (self.data[:len (BUNDLE_MAGIC)] != BUNDLE_MAGIC):
+            raise ValueError (f"{path} is not an image bundle.")
+
+        start = len (BUNDLE_MAGIC)
+        index_length = BUNDLE_HEADER.unpack_from (self.data, start)[0]
+        start += BUNDLE_HEADER.size
+        index = json.loads (bytes (self.view[start:start + index_length]))
+        start += index_length
+
+        self.data_start = start + (-start % DATA_ALIGN)
+        self.images = index["images"]
+        self.manifests = index["manifests"]
+        self.sources = index.get ("sources", {}) # {key: stamp when bundled}
+        self.warned = False
+
+
+    # /////////////////////
+    #   Public functions.
+    # /////////////////////
+
+    def get_key (self, path: str) -> str or None:
+        """
+        Get the name used in the bundle for a path.
+
+        Args:
+            path (str): A resolved path.
+
+        Returns:
+            str or None: The key or None if the path is outside the bundle.
+        """
+        key = os.path.relpath (path, self.root)
+        if (key.startswith (os.pardir)):
+            return None
+
+        return key.replace (os.sep, "/")
+
+    def get_image (self, path: str) -> pygame.Surface or None:
+        """
+        Build a surface that reads its pixels from the mapped file.
+
+        Args:
+            path (str): A resolved path.
+
+        Returns:
+            pygame.Surface or None: 
+                The surface or None if it isn't bundled or the file changed 
+                since it was.
+        """
+        key = self.get_key (path)
+        details = self.images.get (key)
+        if (details == None or not self._is_current (key, path)):
+            return None
+
+        offset, width, height = details
+        offset += self.data_start
+        return pygame.image.frombuffer (
+            self.view[offset:offset + (width * height * 4)],
+            (width, height),
+            "RGBA"
+        )
+
+    def get_manifest (self, path: str) -> dict or None:
+        """
+        Get the manifest stored for a manifest file.
+
+        Args:
+            path (str): The resolved path of the manifest file.
+
+        Returns:
+            dict or None: 
+                The manifest or None if it isn't bundled or the file changed 
+                since it was.
+        """
+        key = self.get_key (path)
+        manifest = self.manifests.get (key)
+        if (manifest == None or not self._is_current (key, path)):
+            return None
+
+        return manifest
+
+
+    # //////////////////////
+    #   Private functions.
+    # //////////////////////
+
+    def _is_current (self, key: str, path: str) -> bool:
+        """
+        Is the bundled copy of a file the same as the file on disk? Warns 
+        the first time a file changed since the bundle was made.
+
+        Args:
+            key (str): The key of the file in the bundle.
+            path (str): A resolved path.
+
+        Returns:
+            bool: If the bundled copy can be used.
+        """
+        stamp = get_source_stamp (path)
+        if (stamp == None or self.sources.get (key) == stamp):
+            return True
+
+        if (not self.warned):
+            self.warned = True
+            warnings.warn (
+                f"{BUNDLE_NAME} is out of date, starting with: {key}. "
+                "Changed files are read from disk instead. "
+                "Run bundle_images.py to update it."
+            )
+
+        return False
+
+
+
+def load_image (path: str, convert: bool=True) -> pygame.Surface:
+    """
+    Load an image once per process.
+
+    Args:
+        path (str): The path to the image.
+        convert (bool, optional): 
+            Convert the image if a display is available. Pass False from 
+            any thread other than the main thread since SDL doesn't 
+            promise converting is safe there. Defaults to True.
+
+    Returns:
+        pygame.Surface:
+            The shared surface. It is converted with convert_alpha
+            as soon as a display is available. Do not draw onto it.
+    """
+    key = _resolve (path)
+    if (key not in _images):
+        image = None
+        if (get_bundle () != None):
+            image = get_bundle ().get_image (key)
+
+        if (image == None):
+            image = pygame.image.load (key)
+
+        _images[key] = [image, False]
+
+    data = _images[key]
+    if (convert and not data[1] and _can_convert ()):
+        data[0] = data[0].convert_alpha ()
+        data[1] = True
+
+    return data[0]
+
+def load_scaled_image (path: str, size: "tuple[int]") -> pygame.Surface:
+    """
+    Load an image scaled to a size once per process and size.
+
+    Args:
+        path (str): The path to the image.
+        size (tuple[int]): The (width, height) to scale to.
+
+    Returns:
+        pygame.Surface: The shared scaled surface. Do not draw onto it.
+    """
+    image = load_image (path)
+    key = (_resolve (path), tuple (size))
+    if (key not in _scaled_images or _scaled_images[key][0] is not image):
+        _scaled_images[key] = [image, pygame.transform.scale (image, size)]
+
+    return _scaled_images[key][1]
+
+def load_flipped_image (path: str) -> pygame.Surface:
+    """
+    Load the horizontally mirrored version of an image once per process.
+
+    Args:
+        path (str): The path to the image.
+
+    Returns:
+        pygame.Surface: The shared mirrored surface. Do not draw onto it.
+    """
+    image = load_image (path)
+    key = _resolve (path)
+    if (key not in _flipped_images or _flipped_images[key][0] is not image):
+        _flipped_images[key] = [
+            image,
+            pygame.transform.flip (image, True, False)
+        ]
+
+    return _flipped_images[key][1]
+
+def get_animations (
+    character_images_path: str, 
+    convert: bool=True
+) -> dict or None:
+    """
+    Get the cached animations of a character.
+
+    Args:
+        character_images_path (str): The images folder of the character.
+        convert (bool, optional): 
+            Convert the frames if a display is available. Only the main 
+            thread should convert. Defaults to True.
+
+    Returns:
+        dict or None:
+            {ANIMATION_NAME: (frames, ...)} or None if the
+            folder has not been loaded yet.
+    """
+    data = _get_animation_data (character_images_path, convert)
+    if (data == None):
+        return None
+
+    return data[0]
+
+def get_flipped_animations (character_images_path: str) -> dict or None:
+    """
+    Get the cached left facing animations of a character.
+
+    Args:
+        character_images_path (str): The images folder of the character.
+
+    Returns:
+        dict or None:
+            {ANIMATION_NAME: (mirrored frames, ...)} or None if
+            the folder has not been loaded yet.
+    """
+    data = _get_animation_data (character_images_path)
+    if (data == None):
+        return None
+
+    return data[1]
+
+def get_manifest (character_images_path: str) -> dict or None:
+    """
+    Get the manifest the cached animations of a character were loaded with.
+
+    Args:
+        character_images_path (str): The images folder of the character.
+
+    Returns:
+        dict or None: The manifest or None if the folder isn't loaded.
+    """
+    return _manifests.get (_resolve (character_images_path))
+
+def store_animations (
+    character_images_path: str,
+    animations: dict,
+    manifest: dict,
+    convert: bool=True
+) -> dict:
+    """
+    Cache the animations of a character so other instances can borrow them.
+
+    Args:
+        character_images_path (str): The images folder of the character.
+        animations (dict): {ANIMATION_NAME: [frames, ...]}
+        manifest (dict): The manifest the animations were loaded with.
+        convert (bool, optional): 
+            Convert the frames if a display is available. Only the main 
+            thread should convert. Defaults to True.
+
+    Returns:
+        dict: The cached animations with read-only frame tuples.
+    """
+    key = _resolve (character_images_path)
+    right = {name: tuple (frames) for name, frames in animations.items ()}
+    _animations[key] = [right, None, False]
+    _manifests[key] = manifest
+    return get_animations (character_images_path, convert)
+
+def get_mask (surface: pygame.Surface) -> pygame.mask.Mask:
+    """
+    Get the collision mask of a surface, building it only the first time.
+
+    Args:
+        surface (pygame.Surface): A surface that is never drawn onto.
+
+    Returns:
+        pygame.mask.Mask: The shared mask. Do not modify it.
+    """
+    mask = _masks.get (surface)
+    if (mask == None):
+        mask = pygame.mask.from_surface (surface)
+        _masks[surface] = mask
+
+    return mask
+
+def get_bottom_rows (surface: pygame.Surface) -> "tuple[int or None]":
+    """
+    Get the lowest solid row of every column of a surface, building them 
+    only the first time.
+
+    Args:
+        surface (pygame.Surface): A surface that is never drawn onto.
+
+    Returns:
+        tuple[int or None]: 
+            The row for each column or None for columns with nothing solid.
+    """
+    rows = _bottom_rows.get (surface)
+    if (rows == None):
+        mask = get_mask (surface)
+        width, height = mask.get_size ()
+        rows = []
+        for x in range (width):
+            row = None
+            for y in range (height - 1, -1, -1):
+                if (mask.get_at ((x, y))):
+                    row = y
+                    break
+            rows.append (row)
+
+        rows = tuple (rows)
+        _bottom_rows[surface] = rows
+
+    return rows
+
+def get_bundle () -> Bundle or None:
+    """
+    Get the image bundle, opening it the first time.
+
+    Returns:
+        Bundle or None: The bundle or None if there is no bundle.
+    """
+    if (not _bundle[0]):
+        _bundle[0] = True
+        path = os.path.join (os.getcwd (), BUNDLE_NAME)
+        if (os.path.isfile (path)):
+            _bundle[1] = Bundle (path)
+
+    return _bundle[1]
+
+def get_bundled_manifest (manifest_path: str) -> dict or None:
+    """
+    Get the manifest of a character as stored in the bundle.
+
+    Args:
+        manifest_path (str): The manifest file of the character.
+
+    Returns:
+        dict or None: 
+            The manifest or None if it isn't bundled or the file changed 
+            since it was.
+    """
+    bundle = get_bundle ()
+    if (bundle == None):
+        return None
+
+    return bundle.get_manifest (_resolve (manifest_path))
+
+def get_source_stamp (path: str) -> "list[int]" or None:
+    """
+    Get what a bundled file is compared by to tell if it changed.
+
+    Args:
+        path (str): The path to the file.
+
+    Returns:
+        list[int] or None: 
+            [modified time in nanoseconds, size in bytes] or None if the 
+            file doesn't exist.
+    """
+    try:
+        details = os.stat (path)
+
+    except OSError:
+        return None
+
+    return [details.st_mtime_ns, details.st_size]
+
+def clear () -> None:
+    """
+    Forget every cached image.
+    """
+    _images.clear ()
+    _scaled_images.clear ()
+    _flipped_images.clear ()
+    _animations.clear ()
+    _manifests.clear ()
+    _masks.clear ()
+    _bottom_rows.clear ()
+
+
+# //////////////////////
+#   Private functions.
+# //////////////////////
+
+def _resolve (path: str) -> str:
+    """
+    Get the key used for a path.
+
+    Args:
+        path (str): A relative or absolute path.
+
+    Returns:
+        str: The resolved absolute path.
+    """
+    return os.path.realpath (path)
+
+def _get_animation_data (
+    character_images_path: str, 
+    convert: bool=True
+) -> list or None:
+    """
+    Get the cache entry of a character and convert it if possible.
+
+    Args:
+        character_images_path (str): The images folder of the character.
+        convert (bool, optional): 
+            Convert, mirror and build the masks of the frames. Only the 
+            main thread should convert. Defaults to True.
+
+    Returns:
+        list or None: [right, left, converted] or None.
+    """
+    key = _resolve (character_images_path)
+    if (key not in _animations):
+        return None
+
+    # ------------------------------------------------
+    #   The mirrored frames and the masks are built 
+    #    from the converted frames, so they wait for 
+    #            the main thread as well.
+    # ------------------------------------------------
+    data = _animations[key]
+    if (not convert):
+        return data
+
+    if (not data[2] and _can_convert ()):
+        data[0] = {
+            name: tuple (frame.convert_alpha () for frame in frames)
+            for name, frames in data[0].items ()
+        }
+        data[1] = None
+        data[2] = True
+
+    # ---------------------------------------------
+    #   Mirror the frames once so drawing a left
+    #    facing character never has to flip, and
+    #       build the masks for both facings.
+    # ---------------------------------------------
+    if (data[1] == None):
+        data[1] = _flip_all (data[0])
+        for animations in data[:2]:
+            for frames in animations.values ():
+                for frame in frames:
+                    get_mask (frame)
+
+    return data
+
+def _flip_all (animations: dict) -> dict:
+    """
+    Mirror every frame of every animation.
+
+    Args:
+        animations (dict): {ANIMATION_NAME: (frames, ...)}
+
+    Returns:
+        dict: {ANIMATION_NAME: (mirrored frames, ...)}
+    """
+    return {
+        name: tuple (
+            pygame.transform.flip (frame, True, False) for frame in frames
+        ) for name, frames in animations.items ()
+    }
+
+def _can_convert () -> bool:
+    """
+    Surfaces can only be converted once a display mode is set.
+
+    Returns:
+        bool: If convert_alpha can be used.
+    """
+    return pygame.display.get_init () and pygame.display.get_surface () != None
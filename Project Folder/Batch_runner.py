@@ -0,0 +1,183 @@
+#  ___________________________________________________________________________
+# /                               Batch_runner              Date: 2026-10-18 \
+# |                                                                           |
+# |                                Description                                |
+# |                                                                           |
+# |     Runs many headless matches at once over a pool of processes. Every    |
+# | matchup between the characters is played on every map a number of rounds, |
+# |      each match with its own seed so it can be played again exactly.      |
+# |                                                                           |
+# |  The result of every match is written as one line of JSON to the results  |
+# |   file as soon as it finishes, and the matches per second are printed at  |
+# |                                  the end.                                 |
+# |                                                                           |
+# |    Run this file from the folder containing the python files. Example:    |
+# |   python Batch_runner.py --rounds 20 --workers 8 --output results.jsonl   |
+# |                                                                           |
+# | Functions:                                                                |
+# |     get_jobs:                                                             |
+# |         - Get every match to play.                                        |
+# |                                                                           |
+# |     run_job:                                                              |
+# |         - Play one match inside a worker.                                 |
+# |                                                                           |
+# |     run_batch:                                                            |
+# |         - Play every match over a pool of processes.                      |
+# |                                                                           |
+# \___________________________________________________________________________/
+
+from multiprocessing import Pool
+from time import perf_counter
+import itertools
+import argparse
+import json
+import os
+
+CHARACTERS = ["Link", "Pikachu", "Captain_Falcon"]
+MAPS = 3
+
+
+def get_jobs (rounds: int, first_seed: int=0) -> "list[dict]":
+    """
+    Get every match to play: each matchup on each map, rounds times.
+
+    Args:
+        rounds (int): Matches for each matchup on each map.
+        first_seed (int, optional): The seed of the first match. Defaults to 0.
+
+    Returns:
+        list[dict]: {"characters": [name, name], "map": int, "seed": int}
+    """
+    jobs = []
+    seed = first_seed
+    for characters in itertools.product (CHARACTERS, repeat=2):
+        for map_index in range (MAPS):
+            for round in range (rounds):
+                jobs.append (
+                    {
+                        "characters": list (characters),
+                        "map": map_index,
+                        "seed": seed
+                    }
+                )
+                seed += 1
+
+    return jobs
+
+def run_job (job: dict) -> dict:
+    """
+    Play one match. Runs inside a worker process.
+
+    Args:
+        job (dict): A job from get_jobs.
+
+    Returns:
+        dict: The job along with the result of the match.
+    """
+    import Simulation
+    import random
+
+    random.seed (job["seed"])
+    result = Simulation.run_match (
+        [getattr (Simulation, name) for name in job["characters"]],
+        Simulation.random_inputs (job["seed"]),
+        background_index=job["map"]
+    )
+    result["seconds"] = result["frames"] / Simulation.FPS
+    return dict (job, **result)
+
+def run_batch (jobs: "list[dict]", output: str, workers: int=None) -> dict:
+    """
+    Play every match over a pool of processes, writing each result to the 
+    output file as one line of JSON as soon as it finishes.
+
+    Args:
+        jobs (list[dict]): Jobs from get_jobs.
+        output (str): The results file.
+        workers (int, optional): 
+            Processes to use. Defaults to one per CPU.
+
+    Returns:
+        dict: Matches played, seconds taken and matches per second.
+    """
+    start = perf_counter ()
+    with Pool (workers, initializer=_setup_worker) as pool:
+        with open (output, "w") as file:
+            for result in pool.imap_unordered (run_job, jobs):
+                file.write (json.dumps (result) + "\n")
+                file.flush ()
+
+        # ------------------------------------------------
+        #   Let the workers finish on their own, leaving 
+        #     the block would only terminate them.
+        # ------------------------------------------------
+        pool.close ()
+        pool.join ()
+    elapsed = perf_counter () - start
+
+    return {
+        "matches": len (jobs),
+        "seconds": elapsed,
+        "matches per second": len (jobs) / elapsed
+    }
+
+
+# //////////////////////
+#   Private functions.
+# //////////////////////
+
+def _setup_worker () -> None:
+    """
+    Open the dummy window and load every character once per worker.
+    """
+    # -------------------------------------------------
+    #   Leave SIGINT and SIGTERM to Python, otherwise 
+    #      SDL catches them and the pool can't stop 
+    #                  its workers.
+    # -------------------------------------------------
+    os.environ["SDL_NO_SIGNAL_HANDLERS"] = "1"
+
+    import Simulation
+    import warnings
+
+    warnings.filterwarnings ("ignore")
+    Simulation.initialize (music=False)
+    imgs_path = os.path.join (os.getcwd (), "IMGS")
+    for name in CHARACTERS:
+        getattr (Simulation, name).preload (imgs_path)
+
+
+def main ():
+    parser = argparse.ArgumentParser (
+        description="Play many headless matches over a pool of processes."
+    )
+    parser.add_argument (
+        "--rounds", type=int, default=10, 
+        help="Matches for each matchup on each map."
+    )
+    parser.add_argument (
+        "--workers", type=int, default=None, 
+        help="Processes to use. Defaults to one per CPU."
+    )
+    parser.add_argument (
+        "--seed", type=int, default=0, 
+        help="The seed of the first match."
+    )
+    parser.add_argument (
+        "--output", default="results.jsonl", 
+        help="The file to write the results to."
+    )
+    args = parser.parse_args ()
+
+    jobs = get_jobs (args.rounds, args.seed)
+    results = run_batch (jobs, args.output, args.workers)
+
+    print (f"Played {results['matches']} matches in "
+           f"{round (results['seconds'], 2)} seconds")
+    print (f"Matches per second: {round (results['matches per second'], 2)}")
+    print (f"Results written to: {args.output}")
+
+
+
+if (__name__ == "__main__"):
+    main ()
@@ -0,0 +1,1064 @@
+#  ___________________________________________________________________________
+# /                                Benchmarks               Date: 2026-10-18 \
+# |                                                                           |
+# |                                Description                                |
+# |                                                                           |
+# |     Small benchmarks used to check the performance of the game. Every     |
+# |  benchmark runs without a visible window so it can be run on any machine. |
+# |            Run it from the folder containing the python files.            |
+# |                                                                           |
+# | Functions:                                                                |
+# |     draw_allocations:                                                     |
+# |         - Count the surfaces made by the transform module while drawing.  |
+# |                                                                           |
+# |     collision_masks:                                                      |
+# |         - Count the masks built while checking collisions.                |
+# |                                                                           |
+# |     collision_scaling:                                                    |
+# |         - Time the collision checks as the amount of arrows grows.        |
+# |                                                                           |
+# |     hit_registry:                                                         |
+# |         - Time many attacks hitting one player in the same frame.         |
+# |                                                                           |
+# |     character_loading:                                                    |
+# |         - Time how long it takes to load every character from nothing.    |
+# |                                                                           |
+# |     text_rendering:                                                       |
+# |         - Count the text renders made while drawing the health info.      |
+# |                                                                           |
+# |     font_loading:                                                         |
+# |         - Time making the text and buttons of the menus.                  |
+# |                                                                           |
+# |     entity_physics:                                                       |
+# |         - Time the physics passes as the amount of arrows grows.          |
+# |                                                                           |
+# |     projectile_spam:                                                      |
+# |         - Count the arrows made while one is shot every frame.            |
+# |                                                                           |
+# |     step_allocations:                                                     |
+# |         - Measure the memory allocated by each frame of a match.          |
+# |                                                                           |
+# |     player_scaling:                                                       |
+# |         - Time the frames of a match as the amount of players grows.      |
+# |                                                                           |
+# |     dirty_rendering:                                                      |
+# |         - Compare drawing a match in full with only drawing what changed. |
+# |                                                                           |
+# |     stage_drawing:                                                        |
+# |         - Time loading the maps and drawing them as one stage.            |
+# |                                                                           |
+# |     interleaved_matches:                                                  |
+# |         - Check matches played side by side end like ones played alone.   |
+# |                                                                           |
+# |     eliminated_player:                                                    |
+# |         - Check a player out of the match can't hurt the others.          |
+# |                                                                           |
+# |     batch_runner_exit:                                                    |
+# |         - Run the batch runner and check that it exits.                   |
+# |                                                                           |
+# |     import_time:                                                          |
+# |         - Time importing the game and check that it opens nothing.        |
+# |                                                                           |
+# \___________________________________________________________________________/
+
+import os
+
+os.environ.setdefault ("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault ("SDL_AUDIODRIVER", "dummy")
+
+from time import perf_counter
+import subprocess
+import pygame
+import sys
+
+WIN_SIZE = (800, 800)
+IMPORT_BUDGET_MS = 500 # The longest importing the game should take.
+BATCH_TIMEOUT = 45     # Seconds the batch runner gets before it hung.
+
+
+def draw_allocations (frames: int=300) -> dict:
+    """
+    Count how many surfaces pygame.transform makes while characters draw.
+
+    Args:
+        frames (int, optional): Frames to draw. Defaults to 300.
+
+    Returns:
+        dict: Calls per frame and time per frame in milliseconds.
+    """
+    from Captain_Falcon import Captain_Falcon
+    from Pikachu import Pikachu
+    from Link import Link
+
+    window = _setup_display ()
+    imgs_path = os.path.join (os.getcwd (), "IMGS")
+    characters = [
+        Link (imgs_path, [100, 200], 1),
+        Pikachu (imgs_path, [300, 200], 2),
+        Captain_Falcon (imgs_path, [500, 200], 3)
+    ]
+
+    # ----------------------------------------------------
+    #   Count every call into the transform functions.
+    # ----------------------------------------------------
+    calls = [0]
+    originals = {}
+    for name in ["flip", "scale", "rotate", "rotozoom", "smoothscale"]:
+        originals[name] = getattr (pygame.transform, name)
+
+        def counted (*args, _original=originals[name], **kwargs):
+            calls[0] += 1
+            return _original (*args, **kwargs)
+
+        setattr (pygame.transform, name, counted)
+
+    try:
+        start = perf_counter ()
+        for frame in range (frames):
+            for pos, character in enumerate (characters):
+                # ------------------------------------------
+                #   Face left, and cycle through walking,
+                #         running and attacking.
+                # ------------------------------------------
+                character.set_direction (False)
+                character.moving = (frame // 40 + pos) % 2 == 0
+                character.walking = character.moving
+                if (not character.moving and character.get_attacking () == 0):
+                    character.set_attacking (1 + (frame // 80) % 2)
+
+                character.animate ()
+                character.draw (window)
+        elapsed = perf_counter () - start
+
+    finally:
+        for name, original in originals.items ():
+            setattr (pygame.transform, name, original)
+
+    return {
+        "transform calls per frame": calls[0] / frames,
+        "ms per frame": (elapsed / frames) * 1000
+    }
+
+
+def collision_masks (frames: int=300) -> dict:
+    """
+    Count how many masks are built while two players fight on a platform.
+
+    Args:
+        frames (int, optional): Frames to simulate. Defaults to 300.
+
+    Returns:
+        dict: Masks built per frame and time per frame in milliseconds.
+    """
+    from Super_smash_bros import collision
+    from Platform import Platform
+    import Entities
+    import Assets
+    from Pikachu import Pikachu
+    from Player import Player
+    from Link import Link
+
+    _setup_display ()
+    imgs_path = os.path.join (os.getcwd (), "IMGS")
+    platform = Platform (
+        0, 0,
+        Assets.load_image (
+            os.path.join (imgs_path, "Maps", "Platforms", "Platform_2.png")
+        )
+    )
+    platform.set_pos ([(WIN_SIZE[0] // 2) - (platform.get_width () // 2), 400])
+
+    store = Entities.Store ()
+    players = []
+    for pos, character in enumerate ([Link, Pikachu]):
+        player = Player (0, 0, 0, 0, [0, 0])
+        player.set_character (character (imgs_path, [0, 0], pos + 1, store))
+        player.set_starting_pos (2, WIN_SIZE[0])
+        players.append (player)
+
+    # ------------------------------------
+    #   Count every mask that gets made.
+    # ------------------------------------
+    calls = [0]
+    original = pygame.mask.from_surface
+
+    def counted (*args, **kwargs):
+        calls[0] += 1
+        return original (*args, **kwargs)
+
+    pygame.mask.from_surface = counted
+    try:
+        start = perf_counter ()
+        for frame in range (frames):
+            collision (players, [], [platform])
+            store.apply_gravity ()
+            for player in players:
+                player.move_character ([0, 0])
+        elapsed = perf_counter () - start
+
+    finally:
+        pygame.mask.from_surface = original
+
+    return {
+        "masks built per frame": calls[0] / frames,
+        "ms per frame": (elapsed / frames) * 1000
+    }
+
+
+def collision_scaling (frames: int=100) -> dict:
+    """
+    Time the collision checks of two players standing on a platform while 
+    more and more arrows fly far away from them.
+
+    Args:
+        frames (int, optional): Frames to check. Defaults to 100.
+
+    Returns:
+        dict: The time per frame in milliseconds for each amount of arrows.
+    """
+    from Super_smash_bros import collision
+    from Platform import Platform
+    from Arrow import Arrow
+    import Entities
+    import Assets
+    from Pikachu import Pikachu
+    from Player import Player
+    from Link import Link
+
+    _setup_display ()
+    imgs_path = os.path.join (os.getcwd (), "IMGS")
+    platform = Platform (
+        0, 0,
+        Assets.load_image (
+            os.path.join (imgs_path, "Maps", "Platforms", "Platform_2.png")
+        )
+    )
+    platform.set_pos ([(WIN_SIZE[0] // 2) - (platform.get_width () // 2), 400])
+
+    store = Entities.Store ()
+    players = []
+    for pos, character in enumerate ([Link, Pikachu]):
+        player = Player (0, 0, 0, 0, [0, 0])
+        player.set_character (character (imgs_path, [0, 0], pos + 1, store))
+        player.set_starting_pos (2, WIN_SIZE[0])
+        players.append (player)
+
+    image = pygame.Surface ((20, 5))
+    results = {}
+    for count in [10, 100, 1000]:
+        arrows = [
+            Arrow (
+                store, [10 * (pos % 80), 700], 0, image, True, 0, 1 + pos % 2
+            )
+            for pos in range (count)
+        ]
+
+        start = perf_counter ()
+        for frame in range (frames):
+            collision (players, arrows, [platform])
+        elapsed = perf_counter () - start
+
+        results[f"ms per frame with {count} arrows"] = (
+            (elapsed / frames) * 1000
+        )
+
+    return results
+
+
+def hit_registry (frames: int=100) -> dict:
+    """
+    Time a player being hit by more and more attacks from 8 attackers in 
+    every frame, each attack damaging and knocking the player back.
+
+    Args:
+        frames (int, optional): Frames to hit for. Defaults to 100.
+
+    Returns:
+        dict: The time per frame in milliseconds for each amount of hits.
+    """
+    from Player import Player
+    from Link import Link
+
+    _setup_display ()
+    imgs_path = os.path.join (os.getcwd (), "IMGS")
+    player = Player (0, 0, 0, 0, [0, 0])
+    player.set_character (Link (imgs_path, [0, 0], 1))
+    clock = player.get_character ().get_clock ()
+
+    results = {}
+    for count in [10, 100, 1000]:
+        start = perf_counter ()
+        for frame in range (frames):
+            clock.tick ()
+            for hit in range (count):
+                # Every attack lasts for 10 frames.
+                attack_identifier = (Player.SHOT, hit + count * (frame // 10))
+                player.adjust_health (0, hit % 8, attack_identifier)
+                player.apply_knockback (hit % 8, 0, 0, True, attack_identifier)
+        elapsed = perf_counter () - start
+
+        results[f"ms per frame with {count} hits"] = (
+            (elapsed / frames) * 1000
+        )
+
+    return results
+
+
+def character_loading (rounds: int=5) -> dict:
+    """
+    Time loading every character with an empty asset cache.
+
+    Args:
+        rounds (int, optional): Times to load. Defaults to 5.
+
+    Returns:
+        dict: If the bundle was used and the time per load in milliseconds.
+    """
+    from Captain_Falcon import Captain_Falcon
+    from contextlib import redirect_stdout
+    from Pikachu import Pikachu
+    from Link import Link
+    import Assets
+    import io
+
+    _setup_display ()
+    imgs_path = os.path.join (os.getcwd (), "IMGS")
+
+    elapsed = 0
+    for round in range (rounds):
+        Assets.clear ()
+        start = perf_counter ()
+        with redirect_stdout (io.StringIO ()):
+            for character in [Link, Pikachu, Captain_Falcon]:
+                character (imgs_path, [0, 0], 1)
+        elapsed += perf_counter () - start
+
+    return {
+        "bundle used": Assets.get_bundle () != None,
+        "ms per load": (elapsed / rounds) * 1000
+    }
+
+
+def text_rendering (frames: int=300) -> dict:
+    """
+    Count how many times text is rendered while characters draw their 
+    health info and take damage.
+
+    Args:
+        frames (int, optional): Frames to draw. Defaults to 300.
+
+    Returns:
+        dict: Renders per frame and time per frame in milliseconds.
+    """
+    from Pikachu import Pikachu
+    from Link import Link
+
+    window = _setup_display ()
+    imgs_path = os.path.join (os.getcwd (), "IMGS")
+    characters = [
+        Link (imgs_path, [100, 200], 1),
+        Pikachu (imgs_path, [300, 200], 2)
+    ]
+
+    # ---------------------------------------------------
+    #   Fonts can't be patched so count every render
+    #     through a stand in for the health fonts.
+    # ---------------------------------------------------
+    calls = [0]
+
+    class CountedFont ():
+        def __init__ (self, font: pygame.font.Font):
+            self.font = font
+
+        def render (self, *args, **kwargs) -> pygame.Surface:
+            calls[0] += 1
+            return self.font.render (*args, **kwargs)
+
+    for character in characters:
+        for text in character.text[:2]:
+            text.font = CountedFont (text.font)
+
+    start = perf_counter ()
+    for frame in range (frames):
+        for character in characters:
+            if (frame % 20 == 0):
+                character.adjust_health (-7)
+            character._draw_health_info (window)
+    elapsed = perf_counter () - start
+
+    return {
+        "renders per frame": calls[0] / frames,
+        "ms per frame": (elapsed / frames) * 1000
+    }
+
+
+def font_loading (rounds: int=50) -> dict:
+    """
+    Time making the text and buttons shown on the menus and during a match.
+
+    Args:
+        rounds (int, optional): Times to make them. Defaults to 50.
+
+    Returns:
+        dict: Fonts made and the time per round in milliseconds.
+    """
+    from Button import Button
+    from Text import Text
+    import Fonts
+
+    _setup_display ()
+
+    start = perf_counter ()
+    for round in range (rounds):
+        for size in [18, 30, 60, 100]:
+            Text ("Player 1", [0, 0], (255, 255, 255), font_size=size)
+        for name in ["Link", "Pikachu", "Captain Falcon"]:
+            Button (0, 0, 200, 100, name)
+    elapsed = perf_counter () - start
+
+    return {
+        "fonts made": len (Fonts._fonts),
+        "ms per round": (elapsed / rounds) * 1000
+    }
+
+
+def entity_physics (frames: int=300) -> dict:
+    """
+    Time gravity, speed limits and projectile motion for every entity as 
+    more and more arrows are flying.
+
+    Args:
+        frames (int, optional): Frames to simulate. Defaults to 300.
+
+    Returns:
+        dict: The time per frame in milliseconds for each amount of arrows.
+    """
+    from Arrow import Arrow
+    import Entities
+
+    _setup_display ()
+    image = pygame.Surface ((20, 5))
+
+    results = {}
+    for count in [10, 100, 1000]:
+        store = Entities.Store ()
+        arrows = [
+            Arrow (store, [400, 10 * pos], 10, image, pos % 2 == 0, 0, 2)
+            for pos in range (count)
+        ]
+        # Keep every arrow flying for the whole benchmark.
+        for arrow in arrows:
+            store.get ("x_range")[arrow.entity] = [-10 ** 6, 10 ** 6]
+
+        start = perf_counter ()
+        for frame in range (frames):
+            store.apply_gravity ()
+            store.clamp_velocities ()
+            store.update_projectiles ()
+            arrows = [arrow for arrow in arrows if (arrow.update ())]
+        elapsed = perf_counter () - start
+
+        results[f"ms per frame with {count} arrows"] = (
+            (elapsed / frames) * 1000
+        )
+
+    return results
+
+def projectile_spam (frames: int=300) -> dict:
+    """
+    Shoot an arrow every frame, like holding down the attack, and count 
+    how many arrow objects get made.
+
+    Args:
+        frames (int, optional): Frames to shoot for. Defaults to 300.
+
+    Returns:
+        dict: Arrows shot, arrows made and the time per frame in milliseconds.
+    """
+    from Arrow import Arrow
+    from Link import Link
+
+    _setup_display ()
+    imgs_path = os.path.join (os.getcwd (), "IMGS")
+    link = Link (imgs_path, [400, 200], 1)
+
+    made = [0]
+    original = Arrow.__init__
+
+    def counted (self, *args, **kwargs):
+        made[0] += 1
+        original (self, *args, **kwargs)
+
+    Arrow.__init__ = counted
+    try:
+        attacks = {}
+        start = perf_counter ()
+        for frame in range (frames):
+            arrow = link.attack_2 ()
+            attacks[arrow.get_attack_identifier ()] = arrow
+
+            link.get_store ().update_projectiles ()
+            finished = [
+                attack_identifier 
+                for attack_identifier, attack in attacks.items () 
+                if (not attack.update ())
+            ]
+            for attack_identifier in finished:
+                attacks.pop (attack_identifier).release ()
+        elapsed = perf_counter () - start
+
+    finally:
+        Arrow.__init__ = original
+
+    return {
+        "arrows shot": frames,
+        "arrows made": made[0],
+        "ms per frame": (elapsed / frames) * 1000
+    }
+
+def step_allocations (frames: int=600) -> dict:
+    """
+    Measure with tracemalloc how much memory each frame of a match with 
+    random key presses allocates while it runs and how much it keeps.
+
+    Args:
+        frames (int, optional): Frames to simulate. Defaults to 600.
+
+    Returns:
+        dict: 
+            Peak KiB allocated per frame, KiB kept after every frame and 
+            the time per frame in milliseconds.
+    """
+    from Simulation import random_inputs
+    from Game_state import Game_state
+    from Pikachu import Pikachu
+    from Link import Link
+    import Super_smash_bros
+    import tracemalloc
+    import Entities
+
+    _setup_display ()
+    imgs_path = os.path.join (os.getcwd (), "IMGS")
+    platforms = Super_smash_bros.create_platforms ()
+    store = Entities.Store ()
+    players = Super_smash_bros.create_players ()[:2]
+    for pos, character in enumerate ([Link, Pikachu]):
+        players[pos].set_character (
+            character (imgs_path, [0, 0], pos + 1, store)
+        )
+    for player in players:
+        player.set_starting_pos (len (players), WIN_SIZE[0])
+
+    state = Game_state (players, platforms, store)
+    inputs = random_inputs (0)
+    events = [inputs (frame, players) for frame in range (frames)]
+
+    # -----------------------------------------------
+    #   The peak above the memory in use before a
+    #   frame is what that frame allocated at most.
+    # -----------------------------------------------
+    peaks = 0
+    tracemalloc.start ()
+    first = tracemalloc.get_traced_memory ()[0]
+    start = perf_counter ()
+    for frame in range (frames):
+        before = tracemalloc.get_traced_memory ()[0]
+        tracemalloc.reset_peak ()
+        Super_smash_bros.step (state, events[frame])
+        peaks += tracemalloc.get_traced_memory ()[1] - before
+    elapsed = perf_counter () - start
+    kept = tracemalloc.get_traced_memory ()[0] - first
+    tracemalloc.stop ()
+
+    return {
+        "peak KiB per frame": peaks / frames / 1024,
+        "KiB kept": kept / 1024,
+        "ms per frame": (elapsed / frames) * 1000
+    }
+
+def player_scaling (frames: int=300) -> dict:
+    """
+    Time the frames of a free-for-all with random key presses as the 
+    amount of players grows.
+
+    Args:
+        frames (int, optional): Frames to simulate. Defaults to 300.
+
+    Returns:
+        dict: Time per frame in milliseconds for each amount of players.
+    """
+    from Captain_Falcon import Captain_Falcon
+    from Simulation import random_inputs
+    from Game_state import Game_state
+    from Pikachu import Pikachu
+    from Link import Link
+    import Super_smash_bros
+    import Entities
+
+    window = _setup_display ()
+    imgs_path = os.path.join (os.getcwd (), "IMGS")
+    characters = [Link, Pikachu, Captain_Falcon]
+    platforms = Super_smash_bros.create_platforms ()
+    background = pygame.Surface (WIN_SIZE)
+
+    results = {}
+    for count in [2, 4, Super_smash_bros.MAX_PLAYERS]:
+        store = Entities.Store ()
+        players = Super_smash_bros.create_players (count)
+        for pos, player in enumerate (players):
+            player.set_character (
+                characters[pos % len (characters)] (
+                    imgs_path, [0, 0], pos + 1, store
+                )
+            )
+        for player in players:
+            player.set_starting_pos (len (players), WIN_SIZE[0])
+
+        state = Game_state (players, platforms, store)
+        inputs = random_inputs (0)
+        events = [inputs (frame, players) for frame in range (frames)]
+
+        start = perf_counter ()
+        for frame in range (frames):
+            state = Super_smash_bros.step (state, events[frame])
+            Super_smash_bros.draw_window (window, state, background=background)
+        elapsed = perf_counter () - start
+
+        results[f"{count} players ms per frame"] = (elapsed / frames) * 1000
+
+    return results
+
+def dirty_rendering (frames: int=600) -> dict:
+    """
+    Compare drawing a match in full with only drawing the areas that 
+    changed, counting the pixels each sends to the display.
+
+    Args:
+        frames (int, optional): Frames to simulate. Defaults to 600.
+
+    Returns:
+        dict: 
+            Pixels sent per frame and time per frame in milliseconds 
+            for both ways of drawing.
+    """
+    from Dirty_renderer import Dirty_renderer
+    from Captain_Falcon import Captain_Falcon
+    from Simulation import random_inputs
+    from Game_state import Game_state
+    from Pikachu import Pikachu
+    from Link import Link
+    import Super_smash_bros
+    import Entities
+
+    window = _setup_display ()
+    imgs_path = os.path.join (os.getcwd (), "IMGS")
+    characters = [Link, Pikachu, Captain_Falcon, Link]
+    background = Super_smash_bros.get_background (imgs_path, 0)
+    store = Entities.Store ()
+    players = Super_smash_bros.create_players (len (characters))
+    for pos, character in enumerate (characters):
+        players[pos].set_character (
+            character (imgs_path, [0, 0], pos + 1, store)
+        )
+    for player in players:
+        player.set_starting_pos (len (players), WIN_SIZE[0])
+
+    state = Game_state (
+        players, Super_smash_bros.create_platforms (), store
+    )
+    inputs = random_inputs (0)
+    renderer = Dirty_renderer ()
+
+    # --------------------------------------------
+    #   Count the pixels of every area sent to 
+    #               the display.
+    # --------------------------------------------
+    pixels = [0]
+    original = pygame.display.update
+
+    def counted (rects=None):
+        if (rects == None):
+            pixels[0] += window.get_width () * window.get_height ()
+        else:
+            pixels[0] += sum (rect.width * rect.height for rect in rects)
+        return original (rects)
+
+    pygame.display.update = counted
+
+    results = {"full": [0, 0], "dirty": [0, 0]}
+    try:
+        for frame in range (frames):
+            Super_smash_bros.step (state, inputs (frame, players))
+            for name, used in [("full", None), ("dirty", renderer)]:
+                pixels[0] = 0
+                start = perf_counter ()
+                Super_smash_bros.draw_window (
+                    window, state, background=background, renderer=used
+                )
+                results[name][0] += perf_counter () - start
+                results[name][1] += pixels[0]
+
+    finally:
+        pygame.display.update = original
+
+    return {
+        "full pixels per frame": results["full"][1] / frames,
+        "full ms per frame": (results["full"][0] / frames) * 1000,
+        "dirty pixels per frame": results["dirty"][1] / frames,
+        "dirty ms per frame": (results["dirty"][0] / frames) * 1000
+    }
+
+def stage_drawing (frames: int=300) -> dict:
+    """
+    Time loading every map the first and second time it is played and 
+    compare drawing the background and platforms with drawing the stage.
+
+    Args:
+        frames (int, optional): Frames to draw. Defaults to 300.
+
+    Returns:
+        dict: 
+            Load times in milliseconds and the time per frame in 
+            milliseconds for both ways of drawing.
+    """
+    import Super_smash_bros
+    import Stages
+    import Assets
+
+    window = _setup_display ()
+    imgs_path = os.path.join (os.getcwd (), "IMGS")
+    platforms = Super_smash_bros.create_platforms ()
+    maps = 3
+
+    Assets.clear ()
+    Stages.clear ()
+    loads = [0, 0]
+    for load in range (len (loads)):
+        start = perf_counter ()
+        for index in range (maps):
+            Stages.get_stage (imgs_path, index, WIN_SIZE, platforms)
+        loads[load] = perf_counter () - start
+
+    background = Super_smash_bros.get_background (imgs_path, 0)
+    start = perf_counter ()
+    for frame in range (frames):
+        window.blit (background, (0, 0))
+        for platform in platforms:
+            platform.draw (window)
+    layered = perf_counter () - start
+
+    stage = Stages.get_stage (imgs_path, 0, WIN_SIZE, platforms)
+    start = perf_counter ()
+    for frame in range (frames):
+        window.blit (stage, (0, 0))
+    staged = perf_counter () - start
+
+    return {
+        "first load ms per map": (loads[0] / maps) * 1000,
+        "later load ms per map": (loads[1] / maps) * 1000,
+        "layered ms per frame": (layered / frames) * 1000,
+        "stage ms per frame": (staged / frames) * 1000
+    }
+
+def interleaved_matches (seeds: "list[int]"=[1, 2]) -> dict:
+    """
+    Play seeded matches one after another, then all at once taking turns 
+    frame by frame, and check that every match ends the same both ways.
+
+    Args:
+        seeds (list[int], optional): 
+            Seeds of the random key presses of each match. Defaults to 
+            [1, 2].
+
+    Returns:
+        dict: 
+            How each match ended, if the results are the same both ways 
+            and the time per frame in milliseconds.
+    """
+    from Simulation import random_inputs
+    from Game_state import Game_state
+    from Pikachu import Pikachu
+    from Link import Link
+    import Super_smash_bros
+    import Entities
+
+    _setup_display ()
+    imgs_path = os.path.join (os.getcwd (), "IMGS")
+    max_frames = Super_smash_bros.FPS * 300
+
+    def create_match (seed: int) -> list:
+        store = Entities.Store ()
+        players = Super_smash_bros.create_players (2)
+        for pos, character in enumerate ([Link, Pikachu]):
+            players[pos].set_character (
+                character (imgs_path, [0, 0], pos + 1, store)
+            )
+        for player in players:
+            player.set_starting_pos (len (players), WIN_SIZE[0])
+
+        state = Game_state (
+            players, Super_smash_bros.create_platforms (), store
+        )
+        return [state, random_inputs (seed)]
+
+    def step_match (match: list) -> bool:
+        state, inputs = match
+        if (state.is_over () or state.frame >= max_frames):
+            return False
+
+        Super_smash_bros.step (state, inputs (state.frame, state.players))
+        return True
+
+    def get_result (state: Game_state) -> tuple:
+        return (
+            state.result, 
+            state.frame, 
+            [
+                (player.get_lives (), player.get_health ()) 
+                for player in state.players
+            ]
+        )
+
+    sequential = []
+    for seed in seeds:
+        match = create_match (seed)
+        while (step_match (match)):
+            pass
+        sequential.append (get_result (match[0]))
+
+    matches = [create_match (seed) for seed in seeds]
+    frames = 0
+    start = perf_counter ()
+    stepped = True
+    while (stepped):
+        stepped = False
+        for match in matches:
+            if (step_match (match)):
+                frames += 1
+                stepped = True
+    elapsed = perf_counter () - start
+    interleaved = [get_result (match[0]) for match in matches]
+
+    results = {}
+    for seed, result in zip (seeds, sequential):
+        results[f"seed {seed}"] = result
+    results["same results"] = sequential == interleaved
+    results["ms per frame"] = (elapsed / frames) * 1000
+    return results
+
+def eliminated_player (frames: int=300) -> dict:
+    """
+    Knock one player of three out of the match in the middle of an attack, 
+    then keep pressing its attack keys with it standing on another player, 
+    and check that the players left take nothing from it.
+
+    Args:
+        frames (int, optional): Frames to simulate. Defaults to 300.
+
+    Returns:
+        dict: 
+            Damage dealt and attacks made by the player out of the match 
+            and the time per frame in milliseconds.
+    """
+    from Captain_Falcon import Captain_Falcon
+    from Game_state import Game_state
+    from Pikachu import Pikachu
+    from Link import Link
+    import Super_smash_bros
+    import Entities
+
+    _setup_display ()
+    imgs_path = os.path.join (os.getcwd (), "IMGS")
+    store = Entities.Store ()
+    players = Super_smash_bros.create_players (3)
+    for pos, character in enumerate ([Link, Pikachu, Captain_Falcon]):
+        players[pos].set_character (
+            character (imgs_path, [0, 0], pos + 1, store)
+        )
+    for player in players:
+        player.set_starting_pos (len (players), WIN_SIZE[0])
+
+    state = Game_state (
+        players, Super_smash_bros.create_platforms (), store
+    )
+    eliminated, survivors = players[0], players[1:]
+    identifier = eliminated.get_identifier ()
+
+    # ---------------------------------------------------
+    #   Start the second attack then lose every life.
+    # ---------------------------------------------------
+    eliminated.press (len (eliminated.directions) + 1)
+    character = eliminated.get_character ()
+    character.adjust_lives (-character.get_lives ())
+
+    attacks = 0
+    start = perf_counter ()
+    for frame in range (frames):
+        eliminated.set_pos (list (survivors[0].get_pos ()))
+        events = [
+            pygame.event.Event (
+                pygame.KEYDOWN if (frame % 2 == 0) else pygame.KEYUP, 
+                key=key
+            ) for key in eliminated.attack_keys
+        ]
+        Super_smash_bros.step (state, events)
+        attacks += sum (
+            1 for attack in state.attacks.values () 
+            if (attack.get_identifier () == identifier)
+        )
+    elapsed = perf_counter () - start
+
+    return {
+        "damage from the eliminated player": sum (
+            player.get_damage_taken (identifier) for player in survivors
+        ),
+        "frames with its attacks out": attacks,
+        "ms per frame": (elapsed / frames) * 1000
+    }
+
+def batch_runner_exit (rounds: int=1, workers: int=4) -> dict:
+    """
+    Run the batch runner from the command line like a user would and 
+    check that it exits once every result is written.
+
+    Args:
+        rounds (int, optional): Rounds to play. Defaults to 1.
+        workers (int, optional): Processes to use. Defaults to 4.
+
+    Returns:
+        dict: 
+            If it exited within BATCH_TIMEOUT, its exit code, the results 
+            written and the seconds it took.
+    """
+    import tempfile
+
+    with tempfile.TemporaryDirectory () as folder:
+        output = os.path.join (folder, "results.jsonl")
+        command = [
+            sys.executable, "Batch_runner.py", 
+            "--rounds", str (rounds), 
+            "--workers", str (workers), 
+            "--output", output
+        ]
+
+        start = perf_counter ()
+        try:
+            code = subprocess.run (
+                command, 
+                capture_output=True, 
+                timeout=BATCH_TIMEOUT
+            ).returncode
+            exited = True
+
+        except subprocess.TimeoutExpired:
+            code = None
+            exited = False
+        elapsed = perf_counter () - start
+
+        written = 0
+        if (os.path.exists (output)):
+            with open (output) as file:
+                written = len (file.readlines ())
+
+    return {
+        "exited": exited,
+        "exit code": code,
+        "results written": written,
+        "seconds": elapsed
+    }
+
+def import_time (rounds: int=5) -> dict:
+    """
+    Time importing the game in a new interpreter and check that importing 
+    it doesn't set up the display, mixer or fonts.
+
+    Args:
+        rounds (int, optional): Times to import. Defaults to 5.
+
+    Returns:
+        dict: 
+            The time per import in milliseconds, if it is within 
+            IMPORT_BUDGET_MS and if anything was set up.
+    """
+    script = (
+        "from time import perf_counter\n"
+        "start = perf_counter ()\n"
+        "import Super_smash_bros\n"
+        "elapsed = perf_counter () - start\n"
+        "import pygame\n"
+        "print (elapsed, pygame.display.get_init () or "
+        "pygame.mixer.get_init () != None or pygame.font.get_init ())\n"
+    )
+
+    elapsed = 0
+    side_effects = False
+    for round in range (rounds):
+        output = subprocess.run (
+            [sys.executable, "-c", script],
+            capture_output=True,
+            text=True,
+            check=True
+        ).stdout.split ()
+        elapsed += float (output[-2])
+        side_effects = side_effects or output[-1] == "True"
+
+    ms = (elapsed / rounds) * 1000
+    return {
+        "ms per import": ms,
+        "within budget": ms <= IMPORT_BUDGET_MS,
+        "display, mixer or fonts set up": side_effects
+    }
+
+
+# //////////////////////
+#   Private functions.
+# //////////////////////
+
+def _setup_display () -> pygame.Surface:
+    """
+    Open a display on the dummy video driver.
+
+    Returns:
+        pygame.Surface: The window.
+    """
+    pygame.init ()
+    return pygame.display.set_mode (WIN_SIZE)
+
+def _report (name: str, results: dict) -> None:
+    """
+    Print the results of a benchmark.
+
+    Args:
+        name (str): Name of the benchmark.
+        results (dict): The results.
+    """
+    print (name)
+    for key, value in results.items ():
+        if (isinstance (value, float)):
+            value = round (value, 3)
+        print (f"\t{key}: {value}")
+
+
+def main ():
+    _report ("Draw allocations", draw_allocations ())
+    _report ("Collision masks", collision_masks ())
+    _report ("Collision scaling", collision_scaling ())
+    _report ("Hit registry", hit_registry ())
+    _report ("Character loading", character_loading ())
+    _report ("Text rendering", text_rendering ())
+    _report ("Font loading", font_loading ())
+    _report ("Entity physics", entity_physics ())
+    _report ("Projectile spam", projectile_spam ())
+    _report ("Step allocations", step_allocations ())
+    _report ("Player scaling", player_scaling ())
+    _report ("Dirty rendering", dirty_rendering ())
+    _report ("Stage drawing", stage_drawing ())
+    _report ("Interleaved matches", interleaved_matches ())
+    _report ("Eliminated player", eliminated_player ())
+    _report ("Batch runner exit", batch_runner_exit ())
+    _report ("Import time", import_time ())
+
+
+
+if (__name__ == "__main__"):
+    main ()
@@ -15,18 +15,11 @@
 import sys
 import pygame
 from Images import *
+import Fonts
 import os
 
-# ------------------------------
-#   Configuration for testing.
-# ------------------------------
-pygame.init ()
-fps = 60
-fpsClock = pygame.time.Clock ()
-width, height = 800, 800
-screen = pygame.display.set_mode ((width, height))
-
-font = pygame.font.SysFont ('Times New Roman', 30, True)
+FONT_NAME = 'Lato' # Shipped in FONTS so every machine draws the same text.
+FONT_SIZE = 30
 
 objects = []
 
@@ -40,7 +33,8 @@ class Button ():
         height: int, 
         buttonText: str='Button', 
         onclickFunction=None,
-        index: int=0
+        index: int=0,
+        onhoverFunction=None
     ):
         """
         Initialize the Button class.
@@ -55,11 +49,15 @@ class Button ():
                 Function with an int argument. Defaults to None.
             index (int, optional): 
                 Index of player. Defaults to 0.
+            onhoverFunction (_type_, optional):
+                Function with an int argument run while the mouse is over
+                the button. Defaults to None.
         """
         self.pos = [x, y]
         self.width = width
         self.height = height
         self.onclickFunction = onclickFunction
+        self.onhoverFunction = onhoverFunction
         self.buttonText = buttonText
         self.index = index
         
@@ -73,6 +71,7 @@ class Button ():
         self.buttonSurface = pygame.Surface ((self.width, self.height))
         self.buttonRect = pygame.Rect (self.pos[0], self.pos[1], self.width, self.height)
 
+        font = Fonts.get_font (FONT_NAME, FONT_SIZE, True)
         self.buttonSurf = font.render (self.buttonText, True, (20, 20, 20))
         self.alreadyPressed = False     
 
@@ -88,6 +87,8 @@ class Button ():
 
         if (self.buttonRect.collidepoint (mousePos)):
             self.buttonSurface.fill (self.fillColors['hover'])
+            if (self.onhoverFunction != None):
+                self.onhoverFunction (self.index)
 
             if (pygame.mouse.get_pressed (num_buttons = 3)[0]):
                 self.buttonSurface.fill (self.fillColors['pressed'])
@@ -126,6 +127,15 @@ class Button ():
 
 if (__name__ == "__main__"):
 
+    # ------------------------------
+    #   Configuration for testing.
+    # ------------------------------
+    pygame.init ()
+    fps = 60
+    fpsClock = pygame.time.Clock ()
+    width, height = 800, 800
+    screen = pygame.display.set_mode ((width, height))
+
     counter = 0
     widths = [50, 300, 550]
     plyr_names = ["Link", "Pikachu", "Captain Falcon"]
@@ -15,24 +15,38 @@
 # |     attack_2:                                                             |
 # |         - The second attack that Captain Falcon can use.                  |
 # |                                                                           |
-# |     draw:                                                                 |
-# |         - Used for a custom draw function.                                |
-# |                                                                           |
 # \___________________________________________________________________________/
 
 from Character import *
 import os
+import Entities
 
 class Captain_Falcon(Character):
-
-    def __init__(self, images_path: str, pos: "list[int]", text_pos: int):
+    IMAGES_FOLDER = "Captain Falcon"
+    WALK_MODIFIER = 2
+    RUN_MODIFIER = 6
+    __slots__ = (
+        "attack_counter", "attack_1_damage", "attack_2_damage", 
+        "step_modifier_x"
+    )
+
+    def __init__(
+        self, 
+        images_path: str, 
+        pos: "list[int]", 
+        text_pos: int,
+        store: Entities.Store=None
+    ):
         """
         Initialize Captain Falcon.
 
         Args:
             images_path (str): Path to all images
+            store (Entities.Store, optional): 
+                The entity store of the match. Defaults to a store of its 
+                own.
         """
-        character_images_path = os.path.join (images_path, "Captain Falcon")
+        character_images_path = os.path.join (images_path, self.IMAGES_FOLDER)
 
         # ------------------------
         #   Attacking variables.
@@ -53,7 +67,8 @@ class Captain_Falcon(Character):
             position=pos,
             knockback=[[5, .2], [7, .3]],
             name="Captain falcon",
-            player=text_pos
+            player=text_pos,
+            store=store
         )
 
 
@@ -75,106 +90,6 @@ class Captain_Falcon(Character):
         Activate attack 2.
         """
         self.attacking = 2
-    
-    def draw (self, window: pygame.Surface) -> None:
-        """
-        Draws the sprite to the screen
-
-        Args:
-            window (pygame.Surface): The main pygame window
-        """
-        if (not self.dead):
-            if (self.moving):
-                if (self.walking):
-                    self.walk_modifier = 2
-                    max_counter = len (self.sprites["WALK"]) * self.DISPLAY_TIME
-
-                    # -----------------------------
-                    #   Reset our index if we are
-                    #       at the end of the
-                    #          animation.
-                    # -----------------------------
-                    if (self.counters[0] + 1 >= max_counter):
-                        self.counters[0] = 0
-                        self.walking = False
-                        self.running = True
-
-                    index = self.counters[0] // self.DISPLAY_TIME
-
-                    # ---------------------------
-                    #   Get the image and apply
-                    #   proper transformations
-                    #         if needed.
-                    # ---------------------------
-                    sprite = self.sprites["WALK"][index]
-                    if (not self.facing_right):
-                        sprite = pygame.transform.flip (sprite, True, False)
-
-                    self.counters[0] += 1
-
-                elif (self.running):
-                    self.walk_modifier = 6
-                    max_counter = len (self.sprites["RUN"]) * self.DISPLAY_TIME
-
-                    # -----------------------------
-                    #   Reset our index if we are
-                    #       at the end of the
-                    #          animation.
-                    # -----------------------------
-                    if (self.counters[1] + 1 >= max_counter):
-                        self.counters[1] = 0
-
-                    index = self.counters[1] // self.DISPLAY_TIME
-                    sprite = self.sprites["RUN"][index]
-                    if (not self.facing_right):
-                        sprite = pygame.transform.flip (sprite, True, False)
-
-                    self.counters[1] += 1
-
-                self.attacking = 0
-
-            elif (self.attacking != 0):
-                attack_index = "ATTACK_" + str (self.attacking)
-                max_counter = len (self.sprites[attack_index]) * self.DISPLAY_TIME
-
-                # -----------------------------
-                #   Reset our index if we are
-                #       at the end of the
-                #          animation.
-                # -----------------------------
-                if (self.counters[2] + 1 >= max_counter):
-                    self.counters[2] = 0
-                    self.attacking = 0
-
-                index = self.counters[2] // self.DISPLAY_TIME
-                sprite = self.sprites[attack_index][index]
-                if (not self.facing_right):
-                    sprite = pygame.transform.flip (sprite, True, False)
-
-                self.counters[2] += 1
-
-
-            else:
-                sprite = self.sprites["WALK"][0]
-                if (not self.facing_right):
-                    sprite = pygame.transform.flip (sprite, True, False)
-
-            if (not self.moving):
-                if (not self.walking):
-                    self.counters[0] = 0
-                elif (not self.running):
-                    self.counters[1] = 0
-
-            self.current_surface = sprite
-            window.blit (
-                sprite,
-                self.pos
-            )
-
-        # --------------------------------
-        #   Draw the health information.
-        # --------------------------------
-        self._draw_health_info (window)
 
 
 
@@ -15,7 +15,12 @@
 # =======================
 from random import randint
 from Text import Text
-from time import time
+import Manifest
+import Hud
+import Assets
+from Sim_clock import Sim_clock
+import Entities
+import warnings
 import pygame
 import os
 
@@ -37,6 +42,36 @@ class Character ():
     JUMP_FORCE = GRAVITY_EFFECT * 10
     BOUNCE_RANGE = 14
     MAX_LIVES = 3
+    RECT_MARGIN = 2 # Pixels added around rectangles before comparing them
+    WALK_MODIFIER = 1 # Speed multiplier while walking
+    RUN_MODIFIER = 3  # Speed multiplier while running
+    KNOCKBACK_X_SPEED = 3 # Pixels a frame for each point of knockback force
+    KNOCKBACK_Y_SPEED = JUMP_FORCE
+    IMAGES_FOLDER = "" # Folder inside IMGS holding the animations
+
+    # -------------------------------------------------------
+    #   Every instance variable. Subclasses list their own.
+    #   __weakref__ lets the entity store free the row of 
+    #                   the character.
+    # -------------------------------------------------------
+    __slots__ = (
+        "store", "entity", "spacing", "player", "name", "text", "identifier", 
+        "lives", "last_adjust", "dead", "walk_modifier", 
+        "jump_counter", "can_move", "jumping", "walking", "running", 
+        "moving", "movement_on_attacks", "attacks", "counters", "attacking",
+        "damages", "knockback", "can_take_damage", "sprites", 
+        "flipped_sprites", "timelines", "anchors", "current_surface", 
+        "current_mask", "current_anchor", "respawn", "checks", "__weakref__"
+    )
+
+    # ---------------------------------------
+    #   Variables kept in the entity store.
+    # ---------------------------------------
+    pos = Entities.component ("pos")
+    vel = Entities.component ("vel")
+    impulse = Entities.component ("impulse")
+    facing_right = Entities.component ("facing_right", bool)
+    hp = Entities.component ("hp", int)
 
     def __init__ (
         self, images_file: str, damages: "list[int]", attacks: list, 
@@ -44,7 +79,8 @@ class Character ():
         position: "list[int]"=[0, 0],
         knockback: "list[int]"=[[0, 0], [0, 0]],
         name: str="Character",
-        player: int=1
+        player: int=1,
+        store: Entities.Store=None
     ):
         """
         Initialize the character
@@ -61,7 +97,20 @@ class Character ():
                 Defaults to [[0, 0], [0, 0]].
             name (str, optional): Used to keep track of who hit each other.
             player (int, optional): Determine where the character is at the beginning.
-        """
+            store (Entities.Store, optional): 
+                The entity store of the match the character plays in. 
+                Defaults to a store of its own.
+        """
+        if (store == None):
+            store = Entities.Store ()
+
+        self.store = store
+        self.entity = store.add (
+            self,
+            max_vel=[self.MAX_X_SPEED, self.MAX_Y_SPEED],
+            gravity=self.GRAVITY_EFFECT
+        )
+
         # -------------------
         #   Text variables.
         # -------------------
@@ -75,8 +124,7 @@ class Character ():
         # ---------------------
         self.identifier = randint (0, 1000000000000000000000000000000000000000)
         self.lives = self.MAX_LIVES
-        self.last_adjust = time ()
-        self.movement_queue = []
+        self.last_adjust = self.store.clock.time ()
         self.hp = self.MAX_HP
         self.dead = False
         
@@ -109,7 +157,11 @@ class Character ():
         #   Image variables
         # -------------------
         self.sprites = self._get_all_animations (images_file)
-        self.current_surface = self.sprites["WALK"][0]
+        self.flipped_sprites = Assets.get_flipped_animations (images_file)
+        manifest = Assets.get_manifest (images_file)
+        self.timelines = Manifest.get_timelines (manifest)
+        self.anchors = Manifest.get_anchors (manifest)
+        self._set_frame ("WALK", 0)
 
         # --------------------
         #   Other variables.
@@ -171,13 +223,16 @@ class Character ():
     #   Health related functions.
     # =============================
 
-    def adjust_health (self, amount: int) -> None:
+    def adjust_health (self, amount: int) -> bool:
         """
         Adjust the health of the character by adding an amount.
 
         Args:
             amount (int):
                 The amount to add to self.hp. Amount can be negative.
+
+        Returns:
+            bool: If the health was adjusted.
         """
         if (self.can_take_damage):
             if ((self.hp + amount) <= 0):
@@ -187,6 +242,10 @@ class Character ():
             else:
                 self.hp += amount
 
+            return True
+
+        return False
+
     def adjust_lives (self, amount: int) -> None:
         """
         Adust the amount of lives left by adding an amount.
@@ -198,13 +257,15 @@ class Character ():
         if ((self.lives + amount) <= 0):
             self.dead = True
             self.lives = 0
+            # animate stops for dead characters so stop the attack here.
+            self.attacking = 0
         
         else:
             self.dead = False
             self.lives += amount
         
         self._move_to_respawn ()
-        self.last_adjust = time ()
+        self.last_adjust = self.store.clock.time ()
 
     def get_percentage (self) -> float:
         """
@@ -281,17 +342,18 @@ class Character ():
     #   Movement related functions.
     # ===============================
 
-    def add_to_queue (self, func: str, vars: list) -> None:
+    def knock_back (self, force_x: float, force_y: float) -> None:
         """
-        Add an item to the movement queue.
+        Push the character. The push is added to its impulse which moves 
+        it and dies down every frame in Entities.Store.apply_impulses.
 
         Args:
-            func (str): The type of function to run.
-            vars (list): The arguments for the function in a list.
+            force_x (float): Knockback force to the right, negative for left.
+            force_y (float): Knockback force upwards.
         """
-        data = [func]
-        data += vars
-        self.movement_queue.append (data)
+        impulse = self.impulse
+        impulse[0] += force_x * self.KNOCKBACK_X_SPEED
+        impulse[1] -= force_y * self.KNOCKBACK_Y_SPEED
 
     def set_direction (self, direction: bool) -> None:
         """
@@ -318,6 +380,7 @@ class Character ():
                 # -----------------------------------------
                 #   Check which direction we're going in.
                 # -----------------------------------------
+                vel = self.vel
                 x_vel = 0
                 if (difference[0] > 0):
                     value = (self.MOVE_X_SPEED * self.walk_modifier)
@@ -343,15 +406,6 @@ class Character ():
                 else:
                     self.jumping = False
 
-                # -------------------------------------
-                #   Check for max speed acceleration.
-                # -------------------------------------
-                if (self.vel[0] > self.MAX_X_SPEED):
-                    self.vel[0] = self.MAX_X_SPEED
-
-                if (self.vel[1] > self.MAX_Y_SPEED):
-                    self.vel[1] = self.MAX_Y_SPEED
-
                 # -------------------------------------------
                 #   Adjust variables to draw the character.
                 # -------------------------------------------
@@ -377,13 +431,14 @@ class Character ():
                         x_move = -x_move
 
                     x_vel += x_move
-                    self.vel[1] += y_move
+                    vel[1] += y_move
 
                 # -----------------------------------
                 #   Apply velocity to the position.
                 # -----------------------------------
-                self.pos[0] += (self.vel[0] + x_vel)
-                self.pos[1] += self.vel[1]
+                pos = self.pos
+                pos[0] += (vel[0] + x_vel)
+                pos[1] += vel[1]
                 return True
 
             else:
@@ -412,6 +467,16 @@ class Character ():
         Returns:
             bool: If this character and object overlap.
         """
+        # -------------------------------------------------
+        #   Only check the masks if the rectangles around
+        #    them touch. The margin covers the rounding
+        #            of the mask offset.
+        # -------------------------------------------------
+        rect_1 = self.get_rect ().inflate (self.RECT_MARGIN, self.RECT_MARGIN)
+        rect_2 = object.get_rect ().inflate (self.RECT_MARGIN, self.RECT_MARGIN)
+        if (not rect_1.colliderect (rect_2)):
+            return False
+
         mask_1 = self.get_mask ()
         mask_2 = object.get_mask ()
         if (mask_1.overlap (mask_2, self._offset (object))):
@@ -448,13 +513,15 @@ class Character ():
         """
         Make the character stop moving.
         """
-        if (self.vel[0] > 0):
+        vel = self.vel
+        if (vel[0] > 0):
             value = -5
-        elif (self.vel[0] < 0):
+        elif (vel[0] < 0):
             value = 5
         else:
             value = 0
-        self.vel = [self.vel[0] + value, 0]
+        vel[0] += value
+        vel[1] = 0
 
     def reset_jump (self) -> None:
         """
@@ -462,22 +529,12 @@ class Character ():
         """
         self.jump_counter = 0
 
-    def move_queue (self) -> bool:
-        """
-        Run the first item of the movement queue.
-
-        Returns:
-            bool: If the movement was successful or not.
-        """
-        if (len (self.movement_queue) != 0):
-            data = self.movement_queue.pop (0)
-            return self._queue_format_dealings (data)
-
     def gravity (self) -> None:
         """
-        Apply gravity to the character.
+        Apply gravity to the character. It is added to the velocity of 
+        every character at once by Entities.Store.apply_gravity.
         """
-        self.vel[1] += self.GRAVITY_EFFECT
+        self.store.get ("gravity_steps")[self.entity] += 1
 
 
 
@@ -485,88 +542,68 @@ class Character ():
     #   Image related functions.
     # ============================
 
-    def draw (self, window: pygame.Surface) -> None:
+    def animate (self) -> None:
         """
-        Draws the character to the screen.
-
-        Args:
-            window (pygame.Surface): The main pygame window.
+        Move the animation forward one frame and pick the frame to show. 
+        Ends the attack once its animation is over.
         """
         if (not self.dead):
-            # -----------------------------------
-            #   Set a default value for sprite.
-            # -----------------------------------
-            sprite = self.sprites["WALK"][0]
-            if (not self.facing_right):
-                sprite = pygame.transform.flip (sprite, True, False)
+            # -------------------------------------
+            #   Set a default value for the frame.
+            # -------------------------------------
+            animation = "WALK"
+            index = 0
 
             if (self.moving):
                 if (self.walking):
-                    self.walk_modifier = 1
-                    max_counter = len (self.sprites["WALK"]) * self.DISPLAY_TIME
+                    self.walk_modifier = self.WALK_MODIFIER
+                    timeline = self.timelines["WALK"]
 
                     # -----------------------------
                     #   Reset our index if we are
                     #       at the end of the
                     #          animation.
                     # -----------------------------
-                    if (self.counters[0] + 1 >= max_counter):
+                    if (self.counters[0] + 1 >= len (timeline)):
                         self.counters[0] = 0
                         self.walking = False
                         self.running = True
 
-                    index = self.counters[0] // self.DISPLAY_TIME
-
-                    # ---------------------------
-                    #   Get the image and apply
-                    #   proper transformations
-                    #         if needed.
-                    # ---------------------------
-                    sprite = self.sprites["WALK"][index]
-                    if (not self.facing_right):
-                        sprite = pygame.transform.flip (sprite, True, False)
-
+                    index = timeline[self.counters[0]]
                     self.counters[0] += 1
 
                 elif (self.running):
-                    self.walk_modifier = 3
-                    max_counter = len (self.sprites["RUN"]) * self.DISPLAY_TIME
+                    self.walk_modifier = self.RUN_MODIFIER
+                    animation = "RUN"
+                    timeline = self.timelines["RUN"]
 
                     # -----------------------------
                     #   Reset our index if we are
                     #       at the end of the
                     #          animation.
                     # -----------------------------
-                    if (self.counters[1] + 1 >= max_counter):
+                    if (self.counters[1] + 1 >= len (timeline)):
                         self.counters[1] = 0
 
-                    index = self.counters[1] // self.DISPLAY_TIME
-                    sprite = self.sprites["RUN"][index]
-                    if (not self.facing_right):
-                        sprite = pygame.transform.flip (sprite, True, False)
-
+                    index = timeline[self.counters[1]]
                     self.counters[1] += 1
 
                 self.attacking = 0
 
             elif (self.attacking != 0):
-                attack_index = "ATTACK_" + str (self.attacking)
-                max_counter = len (self.sprites[attack_index]) * self.DISPLAY_TIME
+                animation = "ATTACK_" + str (self.attacking)
+                timeline = self.timelines[animation]
 
                 # -----------------------------
                 #   Reset our index if we are
                 #       at the end of the
                 #          animation.
                 # -----------------------------
-                if (self.counters[2] + 1 >= max_counter):
+                if (self.counters[2] + 1 >= len (timeline)):
                     self.counters[2] = 0
                     self.attacking = 0
 
-                index = self.counters[2] // self.DISPLAY_TIME
-                sprite = self.sprites[attack_index][index]
-                if (not self.facing_right):
-                    sprite = pygame.transform.flip (sprite, True, False)
-
+                index = timeline[self.counters[2]]
                 self.counters[2] += 1
 
             if (not self.moving):
@@ -575,17 +612,89 @@ class Character ():
                 elif (not self.running):
                     self.counters[1] = 0
 
-            self.current_surface = sprite
-            window.blit (
-                sprite,
-                self.pos
-            )
+            # ---------------------------
+            #   Get the image facing the
+            #   direction we are facing.
+            # ---------------------------
+            self._set_frame (animation, index)
+
+    def draw (self, window: pygame.Surface) -> None:
+        """
+        Draws the character to the screen. Only reads the character, the 
+        frame shown is picked by animate.
+
+        Args:
+            window (pygame.Surface): The main pygame window.
+        """
+        if (not self.dead):
+            self._blit_frame (window)
 
         # --------------------------------
         #   Draw the health information.
         # --------------------------------
         self._draw_health_info (window)
 
+    def get_rect (self) -> pygame.Rect:
+        """
+        Get the rectangle around the current frame. Used to skip 
+        the mask check between objects that are far apart.
+
+        Returns:
+            pygame.Rect: The rectangle.
+        """
+        mask_pos = self.get_mask_pos ()
+        return pygame.Rect (
+            int (mask_pos[0]), 
+            int (mask_pos[1]), 
+            self.current_surface.get_width (), 
+            self.current_surface.get_height ()
+        )
+
+    def get_mask_pos (self) -> "tuple[float]":
+        """
+        Get the top left of the current frame, its anchor is placed on 
+        the position of the character. The mask, the bottom rows and the 
+        drawn frame all start here.
+
+        Returns:
+            tuple[float]: (x, y)
+        """
+        return (
+            self.pos[0] - self.current_anchor[0],
+            self.pos[1] - self.current_anchor[1]
+        )
+
+    def get_draw_rects (self) -> "list[pygame.Rect]":
+        """
+        Get the areas of the screen the last draw covered, the current 
+        frame and the health information.
+
+        Returns:
+            list[pygame.Rect]: The rectangles.
+        """
+        rects = []
+        if (not self.dead):
+            rects.append (self.get_rect ())
+
+        if (self.text != None):
+            rects.append (self.text[0].get_rect ())
+            rects.append (self.text[1].get_rect ())
+
+            image_details = self.text[2][-(self.lives + 1)]
+            rects.append (image_details[0].get_rect (topleft=image_details[1]))
+
+        return rects
+
+    def get_bottom_rows (self) -> "tuple[int or None]":
+        """
+        Get the lowest solid row of each column of the current sprite, 
+        counted from get_mask_pos.
+
+        Returns:
+            tuple[int or None]: The row for each column, None if empty.
+        """
+        return Assets.get_bottom_rows (self.current_surface)
+
     def get_mask (self) -> pygame.mask.Mask or None:
         """
         Gets the mask of the current sprite on the screen.
@@ -594,16 +703,28 @@ class Character ():
             pygame.mask.Mask or None:
                 Returns the mask if an image is on the screen.
         """
-        if (self.current_surface != None):
-            return pygame.mask.from_surface (self.current_surface)
-
-        else:
-            return None
+        return self.current_mask
 
 
     # ====================
     #   Other functions.
     # ====================
+
+    @classmethod
+    def preload (cls, images_path: str) -> None:
+        """
+        Decode the images of this character into the asset cache
+        without creating the character. Safe to run on another thread, the 
+        images are converted once the character is created on the main 
+        thread.
+
+        Args:
+            images_path (str): Path to all images.
+        """
+        cls._get_all_animations (
+            os.path.join (images_path, cls.IMAGES_FOLDER), 
+            convert=False
+        )
      
     def set_sudden_death (self, health: int) -> None:
         """
@@ -626,7 +747,7 @@ class Character ():
         self.player = value
         self._create_text ()
 
-    def set_text_pos (self, width: int) -> None:
+    def set_text_pos (self, max: int, width: int) -> None:
         """
         Set the position of the text
 
@@ -634,18 +755,7 @@ class Character ():
             max (int): The max amount of players.
             width (int): The width of the window
         """
-        basic_character_size = 190
-        # ----------------------------
-        #   Add spacing to the wall.
-        # ----------------------------
-        padding = 100
-        width -= padding * 2
-
-        # -----------------------------------------------
-        #   Find the position for this characters text.
-        # -----------------------------------------------
-        x_pos = padding + (basic_character_size * (self.player - 1))
-        self._create_text ([x_pos, 700])
+        self._create_text (Hud.get_info_pos (self.player, max, width))
        
     def get_player_value (self) -> int:
         """
@@ -663,14 +773,32 @@ class Character ():
         self.hp = self.MAX_HP
         self.lives = self.MAX_LIVES
         self.dead = False
-        self.vel = [0, 0]
-        self.movement_queue = []
+        self.vel[:] = 0
+        self.impulse[:] = 0
         self.moving = False
         self.walking = False
         self.running = False
-        self.current_surface = self.sprites["WALK"][0]
+        self._set_frame ("WALK", 0)
         self.counters = [0 for i in range (len (self.counters))]
 
+    def get_store (self) -> Entities.Store:
+        """
+        Get the entity store the character keeps its row in.
+
+        Returns:
+            Entities.Store: The store.
+        """
+        return self.store
+
+    def get_clock (self) -> Sim_clock:
+        """
+        Get the clock of the match the character plays in.
+
+        Returns:
+            Sim_clock: The clock.
+        """
+        return self.store.clock
+
     def get_identifier (self) -> int:
         """
         Get the identifier of the character.
@@ -695,62 +823,95 @@ class Character ():
     # //////////////////////////////
 
 
-    def _get_all_animations (self, character_images_path: str) -> dict:
+    @classmethod
+    def _get_all_animations (
+        cls, 
+        character_images_path: str, 
+        convert: bool=True
+    ) -> dict:
         """
         Load all of the animations into a dictionary.
 
         Args:
             character_images_path (str):
                 The path to the specific images folder for this character.
+            convert (bool, optional): 
+                Convert the frames. Only the main thread should convert. 
+                Defaults to True.
+
+        Returns:
+            dict: {ANIMATION_NAME: (frames, ...)} shared with other instances.
+        """
+        # ---------------------------------------------
+        #   Borrow the frames if another instance has
+        #         already loaded this character.
+        # ---------------------------------------------
+        all_animations = Assets.get_animations (character_images_path, convert)
+        if (all_animations != None):
+            return all_animations
+
+        # ----------------------------------------------
+        #   The manifest lists the frames in order so
+        #     there is no need to search or sort them.
+        # ----------------------------------------------
+        manifest = Manifest.load_manifest (character_images_path)
+        if (manifest == None):
+            warnings.warn (
+                f"No manifest for: {character_images_path}. "
+                "Run Manifest.py to make one."
+            )
+            manifest = Manifest.build_manifest (
+                character_images_path,
+                cls.DISPLAY_TIME
+            )
+
+        frame_paths = Manifest.get_frame_paths (character_images_path, manifest)
+        return Assets.store_animations (
+            character_images_path,
+            {
+                name: [Assets.load_image (path, convert) for path in paths]
+                for name, paths in frame_paths.items ()
+            },
+            manifest,
+            convert
+        )
+
+    def _get_frame (self, animation: str, index: int) -> pygame.Surface:
+        """
+        Get a frame of an animation facing the way the character faces.
+
+        Args:
+            animation (str): The name of the animation.
+            index (int): The index of the frame.
+
+        Returns:
+            pygame.Surface: The frame. The mirrored frames are built at load.
         """
-        # -------------------------------------------
-        #   Go through each item in the given path.
-        # -------------------------------------------
-        self.all_animations = {}
-        for path in os.listdir (character_images_path):
-            updated_path = os.path.join (character_images_path, path)
-
-            # ---------------------------------------------------
-            #   If this path is a directory and not a file then
-            #    make pygame surfaces out of all of the images
-            #           that have no spaces in them.
-            # ---------------------------------------------------
-            if (os.path.isdir (updated_path)):
-                print (F"Folder: {path}")
-                path = path.upper ()
-                self.all_animations[path] = [[], []]
-
-                # ----------------------------------------------------
-                #   Search for images and make then pygame.Surface's
-                # ----------------------------------------------------
-                for file in os.listdir (updated_path):
-                    file_path = os.path.join (updated_path, file)
-
-                    if (" " not in file and os.path.isfile (file_path)):
-                        print (f"\tImage: {file}")
-                        self.all_animations[path][0].append (
-                            pygame.image.load (file_path)
-                        )
-
-                        if (file.find (".jpg") != -1):
-                            file = file.replace (".jpg", "")
-                        else:
-                            file = file.replace (".png", "")
-
-                        number = int (file[-2:])
-                        self.all_animations[path][1].append (number)
-                print ()
-
-        character_name = character_images_path.split ("\\")[-1]
-        print (f"End of images for: {character_name}")
-
-        # ------------------------------------
-        #   Sort the list in ascending order
-        #       for animation purposes.
-        # ------------------------------------
-        self._sort_ascending_animations ()
-
-        return self.all_animations
+        if (self.facing_right):
+            return self.sprites[animation][index]
+
+        return self.flipped_sprites[animation][index]
+
+    def _set_frame (self, animation: str, index: int) -> None:
+        """
+        Show a frame, looking up its cached mask and its anchor.
+
+        Args:
+            animation (str): The name of the animation.
+            index (int): The index of the frame.
+        """
+        self.current_surface = self._get_frame (animation, index)
+        self.current_mask = Assets.get_mask (self.current_surface)
+        self.current_anchor = self.anchors[animation][index]
+
+    def _blit_frame (self, window: pygame.Surface) -> None:
+        """
+        Draw the current frame with its anchor at the character position.
+
+        Args:
+            window (pygame.Surface): The window to draw onto.
+        """
+        window.blit (self.current_surface, self.get_mask_pos ())
 
     def _check_move_after_respawn (self, start_time: float) -> bool:
         """
@@ -762,7 +923,7 @@ class Character ():
         Returns:
             bool: Is character's invulnerability over.
         """
-        if ((time () - start_time) >= self.INVULNERABLE_TIME):
+        if ((self.store.clock.time () - start_time) >= self.INVULNERABLE_TIME):
             self.can_take_damage = True
             return True
         
@@ -820,56 +981,6 @@ class Character ():
             self.vel[1] = -(self.JUMP_FORCE * jump_multiplier)
             self.jump_counter += 1
 
-    def _recursive_sort (self, lists: "list[list]") -> list:
-        """
-        Simple recursive sort to sort both of the lists in parallel.
-
-        Args:
-            lists (list[list]): A list containing multiple lists.
-
-        Returns:
-            list[list]:
-                Returns the sorted sort list and mirror list. [sort, mirror]
-        """
-        for pos in range (1, len (lists[0])):
-            if (lists[0][pos - 1] > lists[0][pos]):
-                for a_list in lists:
-                    temp = a_list[pos - 1]
-                    a_list[pos - 1] = a_list[pos]
-                    a_list[pos] = temp
-
-                return self._recursive_sort (lists)
-
-        return lists[1]
-
-    def _queue_format_dealings (self, data: list) -> bool:
-        """
-        Go through the data and depending on the 
-        function run a certain command.
-
-        Args:
-            data (list): The data that is in the queue.
-
-        Returns:
-            bool: Whether the function was successful.
-        """
-        func = data[0]
-        vars = data[1:]
-        if (func == "MOVE"):
-            return self.move (vars[0])
-
-    def _sort_ascending_animations (self) -> None:
-        """
-        Sort self.all_animations in ascending order.
-        """
-        for key in self.all_animations:
-            list_to_sort = self.all_animations[key][1]
-            list_to_mirror = self.all_animations[key][0]
-
-            results = self._recursive_sort ([list_to_sort, list_to_mirror])
-
-            self.all_animations[key] = results
-
     def _offset (self, object) -> "list[int]":
         """
         Return the offset from this character to the other.
@@ -881,21 +992,22 @@ class Character ():
         Returns:
             list[int]:
                 Returns a list with the difference in
-                x position and y position in a list.
+                x position and y position of the masks in a list.
         """
-        pos = object.get_pos ()
-        return [int (pos[0] - self.pos[0]), int (pos[1] - self.pos[1])]
+        pos = object.get_mask_pos ()
+        mask_pos = self.get_mask_pos ()
+        return [int (pos[0] - mask_pos[0]), int (pos[1] - mask_pos[1])]
 
     def _move_to_respawn (self) -> None:
         """
         Move to the respawn location.
         """
-        self.vel = [0, 0]
-        self.set_pos ([self.respawn[0], self.respawn[1]])
-        self.movement_queue = []
+        self.vel[:] = 0
+        self.set_pos (self.respawn)
+        self.impulse[:] = 0
         self.can_take_damage = False
-        self.checks.append (["RESPAWN", time ()])
-        self.current_surface = self.sprites["WALK"][0]
+        self.checks.append (["RESPAWN", self.store.clock.time ()])
+        self._set_frame ("WALK", 0)
 
     def _create_text (self, pos: "list[int]"=None) -> None:
         """
@@ -913,18 +1025,7 @@ class Character ():
                 [61, 173, 0]
             ),
             [
-                [
-                    pygame.transform.scale (
-                        pygame.image.load (
-                            os.path.join (
-                                os.path.join (os.getcwd (), "IMGS", "Health"),
-                                f"Health_{x}.png"
-                            )
-                        ),
-                        (100, 100)
-                    ), 
-                    [0, 0]
-                ] for x in range (1, 5)
+                [icon, [0, 0]] for icon in Hud.get_life_icons ()
             ]
         ]
 
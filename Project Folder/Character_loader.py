@@ -0,0 +1,76 @@
+#  ___________________________________________________________________________
+# /                             Character_loader            Date: 2026-10-18 \
+# |                                                                           |
+# |                                Description                                |
+# |                                                                           |
+# |   Loads the characters picked on the character select screen. Hovering a  |
+# |   character button starts decoding its images on a background thread so   |
+# |  that by the time it is picked creating the character only has to convert |
+# |                             the cached frames.                            |
+# |                                                                           |
+# |   Converting is left to create since SDL only promises it is safe on the  |
+# |                                main thread.                               |
+# |                                                                           |
+# | Functions:                                                                |
+# |     preload:                                                              |
+# |         - Start decoding the images of a character in the background.     |
+# |                                                                           |
+# |     create:                                                               |
+# |         - Wait for the images of a character class, then create it on the |
+# |           calling thread, converting its images.                          |
+# |                                                                           |
+# \___________________________________________________________________________/
+
+from threading import Thread
+
+
+class Character_loader ():
+    def __init__ (self, images_path: str):
+        """
+        Initialize the loader.
+
+        Args:
+            images_path (str): Path to all images.
+        """
+        self.images_path = images_path
+        self.threads = {}
+
+
+    # /////////////////////
+    #   Public functions.
+    # /////////////////////
+
+    def preload (self, character_class) -> None:
+        """
+        Start decoding the images of a character in the background.
+        Calling this again for the same class does nothing.
+
+        Args:
+            character_class (type): A subclass of Character.
+        """
+        if (character_class not in self.threads):
+            thread = Thread (
+                target=character_class.preload,
+                args=(self.images_path,),
+                daemon=True
+            )
+            self.threads[character_class] = thread
+            thread.start ()
+
+    def create (self, character_class, player: int, store=None):
+        """
+        Create a character, waiting for its images if they are still loading.
+
+        Args:
+            character_class (type): A subclass of Character.
+            player (int): The player value of the character.
+            store (Entities.Store, optional): 
+                The entity store of the match. Defaults to a store of its 
+                own.
+
+        Returns:
+            subclass of Character: The new character.
+        """
+        self.preload (character_class)
+        self.threads[character_class].join ()
+        return character_class (self.images_path, [0, 0], player, store)
@@ -0,0 +1,138 @@
+#  ___________________________________________________________________________
+# /                              Dirty_renderer             Date: 2026-10-18 \
+# |                                                                           |
+# |                                Description                                |
+# |                                                                           |
+# |    Draws the match screen by only touching the parts of the window that   |
+# |   changed. The areas every sprite and text covered on the last frame are  |
+# |  drawn over with the background and platforms, then only those areas and  |
+# |           the areas covered this frame are sent to the display.           |
+# |                                                                           |
+# |  The whole window is drawn and sent on the first frame, after invalidate  |
+# |                    and whenever the background changes.                   |
+# |                                                                           |
+# | Functions:                                                                |
+# |     restore:                                                              |
+# |         - Draw the background over everything drawn last frame.           |
+# |                                                                           |
+# |     present:                                                              |
+# |         - Send the areas that changed to the display.                     |
+# |                                                                           |
+# |     invalidate:                                                           |
+# |         - Draw and send the whole window on the next frame.               |
+# |                                                                           |
+# \___________________________________________________________________________/
+
+import pygame
+
+
+class Dirty_renderer ():
+    __slots__ = ("background", "previous")
+
+    def __init__ (self):
+        """
+        Initialize the renderer. The first frame is drawn in full.
+        """
+        self.background = None
+        self.previous = None    # The rectangles of the last frame.
+
+
+    # /////////////////////
+    #   Public functions.
+    # /////////////////////
+
+    def invalidate (self) -> None:
+        """
+        Draw and send the whole window on the next frame. Used after 
+        something else drew onto the window.
+        """
+        self.previous = None
+
+    def restore (
+        self, 
+        window: pygame.Surface, 
+        background: pygame.Surface or None, 
+        platforms: list
+    ) -> None:
+        """
+        Draw the background and the platforms over the areas covered by 
+        the sprites of the last frame, or over the whole window.
+
+        Args:
+            window (pygame.Surface): The window to draw on.
+            background (pygame.Surface or None): 
+                The background, black when None.
+            platforms (list[Platform]): The platforms of the match.
+        """
+        if (background is not self.background):
+            self.background = background
+            self.previous = None
+
+        if (self.previous == None):
+            self._draw_static (window, None, platforms)
+            return
+
+        for rect in self.previous:
+            self._draw_static (window, rect, platforms)
+
+    def present (
+        self, 
+        window: pygame.Surface, 
+        rects: "list[pygame.Rect]"
+    ) -> None:
+        """
+        Send the areas drawn on this frame and the last frame to the 
+        display and keep the areas of this frame for the next restore.
+
+        Args:
+            window (pygame.Surface): The window that was drawn on.
+            rects (list[pygame.Rect]): The areas drawn on this frame.
+        """
+        bounds = window.get_rect ()
+        rects = [rect.clip (bounds) for rect in rects]
+        rects = [rect for rect in rects if (rect.width and rect.height)]
+
+        if (self.previous == None):
+            pygame.display.update ()
+
+        else:
+            pygame.display.update (self.previous + rects)
+
+        self.previous = rects
+
+
+    # //////////////////////
+    #   Private functions.
+    # //////////////////////
+
+    def _draw_static (
+        self, 
+        window: pygame.Surface, 
+        rect: pygame.Rect or None, 
+        platforms: list
+    ) -> None:
+        """
+        Draw the background and the platforms inside of an area.
+
+        Args:
+            window (pygame.Surface): The window to draw on.
+            rect (pygame.Rect or None): The area, the whole window if None.
+            platforms (list[Platform]): The platforms of the match.
+        """
+        # --------------------------------------------
+        #   Clipping keeps the platforms from being 
+        #     blended on top of themselves outside 
+        #              of the area.
+        # --------------------------------------------
+        window.set_clip (rect)
+        if (self.background != None):
+            window.blit (self.background, (0, 0))
+
+        else:
+            window.fill ((0, 0, 0))
+
+        for platform in platforms:
+            if (rect == None or rect.colliderect (platform.get_rect ())):
+                platform.draw (window)
+
+        window.set_clip (None)
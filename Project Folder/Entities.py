@@ -0,0 +1,328 @@
+#  ___________________________________________________________________________
+# /                                 Entities                Date: 2026-10-18 \
+# |                                                                           |
+# |                                Description                                |
+# |                                                                           |
+# | Keeps the data of every character and attack in NumPy arrays, one row per |
+# |     entity, instead of in lists on each object. Positions, velocities,    |
+# | facing, health and lifetimes sit next to each other in memory so gravity, |
+# | speed limits, projectile motion and expiry are each done for every entity |
+# |                                  at once.                                 |
+# |                                                                           |
+# |   Every match has a Store of its own, with its own clock, so the passes   |
+# |   only move the entities of that match and any number of matches can be   |
+# |    played in one process. Objects get a row with Store.add and read and   |
+# |   write it through the arrays from Store.get. The row is given back when  |
+# |                      the object is garbage collected.                     |
+# |                                                                           |
+# | Functions:                                                                |
+# |     Store:                                                                |
+# |         - The rows of the entities of one match.                          |
+# |                                                                           |
+# |     Store.add:                                                            |
+# |         - Give an object a row.                                           |
+# |                                                                           |
+# |     Store.reset:                                                          |
+# |         - Put every component of a row back to its starting value.        |
+# |                                                                           |
+# |     Store.get:                                                            |
+# |         - Get the array of a component.                                   |
+# |                                                                           |
+# |     Store.apply_gravity:                                                  |
+# |         - Apply the gravity steps collected this frame.                   |
+# |                                                                           |
+# |     Store.clamp_velocities:                                               |
+# |         - Keep every velocity under its max speed.                        |
+# |                                                                           |
+# |     Store.apply_impulses:                                                 |
+# |         - Move entities by their knockback and let it die down.           |
+# |                                                                           |
+# |     Store.update_projectiles:                                             |
+# |         - Move projectiles and count down lifetimes.                      |
+# |                                                                           |
+# |     component:                                                            |
+# |         - Make a property that reads and writes a component of the row of |
+# |           an object.                                                      |
+# |                                                                           |
+# \___________________________________________________________________________/
+
+from Sim_clock import Sim_clock
+import numpy as np
+import weakref
+
+CAPACITY = 64 # Rows made at the start, doubled when full.
+IMPULSE_DECAY = .8 # Part of an impulse kept after each frame.
+IMPULSE_STOP = .5  # Impulses slower than this many pixels a frame stop.
+
+# -------------------------------------------------------
+#   The data type, shape and default of each component.
+# -------------------------------------------------------
+COMPONENTS = {
+    "pos": (np.float64, (2,), 0),
+    "vel": (np.float64, (2,), 0),
+    "impulse": (np.float64, (2,), 0),     # Knockback, pixels a frame.
+    "max_vel": (np.float64, (2,), np.inf),
+    "gravity": (np.float64, (), 0),
+    "gravity_steps": (np.int64, (), 0),
+    "facing_right": (np.bool_, (), False),
+    "hp": (np.int64, (), 0),
+    "lifetime": (np.int64, (), -1),       # Frames left, -1 for forever.
+    "x_range": (np.float64, (2,), 0),      # Projectiles stay inside this.
+    "projectile": (np.bool_, (), False),
+    "expired": (np.bool_, (), False),
+    "alive": (np.bool_, (), False)
+}
+
+# ----------------------------------------------------
+#   Scratch arrays, one value per row, reused by the
+#   passes below so a frame doesn't allocate arrays.
+# ----------------------------------------------------
+SCRATCH = {
+    "float": (np.float64, ()),
+    "next_x": (np.float64, ()),
+    "bool_1": (np.bool_, ()),
+    "bool_2": (np.bool_, ()),
+    "bool_3": (np.bool_, ()),
+    "float_pair": (np.float64, (2,)),
+    "bool_pair": (np.bool_, (2,))
+}
+
+
+class Store ():
+    # -----------------------------------------------------
+    #   __weakref__ lets the rows be freed without their
+    #      objects keeping the whole store alive.
+    # -----------------------------------------------------
+    __slots__ = (
+        "components", "scratch", "free", "pools", "clock", "__weakref__"
+    )
+
+    def __init__ (self):
+        """
+        Make an empty store. Rows are made the first time one is needed.
+        """
+        self.components = {}
+        self.scratch = {}
+        self.free = []
+        self.clock = Sim_clock () # The game time of the match.
+        # -------------------------------------------------
+        #   Pools of reusable objects keyed by the class 
+        #   they hold. Pooled objects keep their rows in 
+        #     this store so their pools live here too.
+        # -------------------------------------------------
+        self.pools = {}
+
+
+    # /////////////////////
+    #   Public functions.
+    # /////////////////////
+
+    def add (self, owner: object, **values) -> int:
+        """
+        Give an object a row. The row is freed once the object is garbage 
+        collected.
+
+        Args:
+            owner (object): The object the row belongs to.
+            **values: Starting values of components. Example: pos=[0, 0]
+
+        Returns:
+            int: The row of the object.
+        """
+        if (len (self.free) == 0):
+            self._grow ()
+
+        entity = self.free.pop ()
+        self.reset (entity, **values)
+
+        weakref.finalize (owner, _free_row, weakref.ref (self), entity)
+        return entity
+
+    def reset (self, entity: int, **values) -> None:
+        """
+        Put every component of a row back to its default, or to the value 
+        given, and mark it alive. Used when an object is reused.
+
+        Args:
+            entity (int): The row.
+            **values: Starting values of components. Example: pos=[0, 0]
+        """
+        for name, (_, _, default) in COMPONENTS.items ():
+            self.components[name][entity] = values.get (name, default)
+        self.components["alive"][entity] = True
+
+    def get (self, name: str) -> np.ndarray:
+        """
+        Get the array of a component. Index it with a row to get the value 
+        of one entity. Don't keep the array, it is replaced when the store 
+        grows.
+
+        Args:
+            name (str): The component. Example: "pos"
+
+        Returns:
+            np.ndarray: The array with a row for each entity.
+        """
+        return self.components[name]
+
+    def apply_gravity (self) -> None:
+        """
+        Add the gravity of every entity to its y velocity once for each 
+        gravity step collected this frame.
+        """
+        components = self.components
+        steps = components["gravity_steps"]
+        force = np.multiply (
+            components["gravity"], 
+            steps, 
+            out=self.scratch["float"]
+        )
+        components["vel"][:, 1] += force
+        steps[:] = 0
+
+    def clamp_velocities (self) -> None:
+        """
+        Keep the velocity of every entity at or below its max speed.
+        """
+        np.minimum (
+            self.components["vel"], 
+            self.components["max_vel"], 
+            out=self.components["vel"]
+        )
+
+    def apply_impulses (self) -> None:
+        """
+        Move every entity by its impulse and shrink the impulse, dropping 
+        the ones that have slowed below IMPULSE_STOP.
+        """
+        components = self.components
+        impulse = components["impulse"]
+        np.add (components["pos"], impulse, out=components["pos"])
+        impulse *= IMPULSE_DECAY
+
+        speed = np.absolute (impulse, out=self.scratch["float_pair"])
+        np.copyto (
+            impulse, 
+            0, 
+            where=np.less (speed, IMPULSE_STOP, out=self.scratch["bool_pair"])
+        )
+
+    def update_projectiles (self) -> None:
+        """
+        Move every projectile by its velocity, expiring the ones that would 
+        leave their range, and count down every lifetime.
+        """
+        components = self.components
+        scratch = self.scratch
+        alive = components["alive"]
+        expired = components["expired"]
+        pos = components["pos"]
+
+        moving = np.logical_and (
+            alive, 
+            components["projectile"], 
+            out=scratch["bool_1"]
+        )
+        next_x = np.add (
+            pos[:, 0], 
+            components["vel"][:, 0], 
+            out=scratch["next_x"]
+        )
+
+        x_range = components["x_range"]
+        inside = np.less_equal (x_range[:, 0], next_x, out=scratch["bool_2"])
+        inside &= np.less_equal (next_x, x_range[:, 1], out=scratch["bool_3"])
+
+        # -------------------------------------------------
+        #   Move the projectiles still inside their range
+        #         and expire the ones that left it.
+        # -------------------------------------------------
+        inside &= moving
+        np.copyto (pos[:, 0], next_x, where=inside)
+        np.logical_xor (moving, inside, out=moving)
+        expired |= moving
+
+        lifetime = components["lifetime"]
+        counting = np.greater (lifetime, 0, out=scratch["bool_1"])
+        counting &= alive
+        np.subtract (lifetime, 1, out=lifetime, where=counting)
+        counting &= np.equal (lifetime, 0, out=scratch["bool_2"])
+        expired |= counting
+
+
+    # //////////////////////
+    #   Private functions.
+    # //////////////////////
+
+    def _grow (self) -> None:
+        """
+        Make more rows, doubling the size of the store.
+        """
+        components = self.components
+        size = len (components["alive"]) if (len (components) != 0) else 0
+        new_size = max (CAPACITY, size * 2)
+
+        for name, (dtype, shape, default) in COMPONENTS.items ():
+            array = np.full ((new_size,) + shape, default, dtype=dtype)
+            if (size != 0):
+                array[:size] = components[name]
+            components[name] = array
+
+        for name, (dtype, shape) in SCRATCH.items ():
+            self.scratch[name] = np.zeros ((new_size,) + shape, dtype=dtype)
+
+        self.free.extend (range (new_size - 1, size - 1, -1))
+
+    def _remove (self, entity: int) -> None:
+        """
+        Free the row of an entity.
+
+        Args:
+            entity (int): The row.
+        """
+        self.components["alive"][entity] = False
+        self.free.append (entity)
+
+
+def component (name: str, cast=None) -> property:
+    """
+    Make a property that reads and writes a component of the row stored in 
+    self.entity of the store in self.store. Array components are read as 
+    views so changing them in place changes the store.
+
+    Args:
+        name (str): The component. Example: "pos"
+        cast (type, optional): 
+            Turn the value into this type when read. Defaults to None.
+
+    Returns:
+        property: The property.
+    """
+    def getter (self):
+        value = self.store.components[name][self.entity]
+        if (cast != None):
+            return cast (value)
+        return value
+
+    def setter (self, value) -> None:
+        self.store.components[name][self.entity] = value
+
+    return property (getter, setter)
+
+
+# //////////////////////
+#   Private functions.
+# //////////////////////
+
+def _free_row (store_reference: weakref.ref, entity: int) -> None:
+    """
+    Free the row of a garbage collected object if its store is still 
+    around.
+
+    Args:
+        store_reference (weakref.ref): The store of the row.
+        entity (int): The row.
+    """
+    store = store_reference ()
+    if (store != None):
+        store._remove (entity)
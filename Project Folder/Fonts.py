@@ -0,0 +1,81 @@
+#  ___________________________________________________________________________
+# /                                  Fonts                  Date: 2026-10-18 \
+# |                                                                           |
+# |                                Description                                |
+# |                                                                           |
+# | Every font used by the game is made here once per face, size and boldness |
+# |   and shared after that. A font file shipped with the game in the FONTS   |
+# | folder is used before asking the system, since searching the system fonts |
+# |               is slow on machines with many fonts installed.              |
+# |                                                                           |
+# |     A face is looked up in FONTS with its name in lowercase and spaces    |
+# |             replaced by underscores. Example: comic sans ms ->            |
+# |                          FONTS/comic_sans_ms.ttf                          |
+# |                                                                           |
+# | Functions:                                                                |
+# |     get_font:                                                             |
+# |         - Get the shared font for a face and size.                        |
+# |                                                                           |
+# \___________________________________________________________________________/
+
+import pygame
+import os
+
+FONTS_FOLDER = "FONTS"
+FONT_EXTENSIONS = (".ttf", ".otf")
+
+# Fonts keyed by (face, size, bold).
+_fonts = {}
+
+
+def get_font (face: str, size: int, bold: bool=False) -> pygame.font.Font:
+    """
+    Get the font for a face and size, making it the first time it is asked
+    for.
+
+    Args:
+        face (str): The name of the font. Example: "comic sans ms"
+        size (int): The size of the font.
+        bold (bool, optional): If the font is bold. Defaults to False.
+
+    Returns:
+        pygame.font.Font: The shared font.
+    """
+    key = (face.lower (), size, bold)
+    if (key not in _fonts):
+        if (not pygame.font.get_init ()):
+            pygame.font.init ()
+
+        path = _get_font_file (face)
+        if (path != None):
+            font = pygame.font.Font (path, size)
+            font.set_bold (bold)
+        else:
+            font = pygame.font.SysFont (face, size, bold)
+
+        _fonts[key] = font
+
+    return _fonts[key]
+
+
+# //////////////////////
+#   Private functions.
+# //////////////////////
+
+def _get_font_file (face: str) -> str or None:
+    """
+    Get the font file shipped with the game for a face.
+
+    Args:
+        face (str): The name of the font.
+
+    Returns:
+        str or None: The path to the file or None if there isn't one.
+    """
+    name = face.lower ().replace (" ", "_")
+    for extension in FONT_EXTENSIONS:
+        path = os.path.join (os.getcwd (), FONTS_FOLDER, name + extension)
+        if (os.path.isfile (path)):
+            return path
+
+    return None
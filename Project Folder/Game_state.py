@@ -0,0 +1,152 @@
+#  ___________________________________________________________________________
+# /                                Game_state               Date: 2026-10-18 \
+# |                                                                           |
+# |                                Description                                |
+# |                                                                           |
+# |  Everything that changes during a match: the players, the attacks on the  |
+# |       screen, the match timer, sudden death and how the match ended.      |
+# |   Super_smash_bros.step moves a state forward one frame without drawing   |
+# |                anything, and drawing only reads the state.                |
+# |                                                                           |
+# |  The platforms and the background index are stored as well since the game |
+# |                             logic needs them.                             |
+# |                                                                           |
+# |  The keymap sends every key straight to the player bound to it along with |
+# |                         the action the key starts.                        |
+# |                                                                           |
+# \___________________________________________________________________________/
+
+import Entities
+
+
+class Game_state ():
+    MATCH_MINUTES = 0
+    MATCH_SECONDS = 20
+
+    def __init__ (
+        self, 
+        players: list, 
+        platforms: list, 
+        store: Entities.Store,
+        background_index: int=0
+    ):
+        """
+        Start a match.
+
+        Args:
+            players (list[Player]): The players, with their characters set.
+            platforms (list[Platform]): The platforms of the map.
+            store (Entities.Store): 
+                The entity store every character of the match was made with.
+            background_index (int, optional): 
+                The index of the background. Defaults to 0.
+
+        Raises:
+            ValueError: A character was made with a different store.
+        """
+        for player in players:
+            if (player.has_character ()):
+                if (player.get_character ().get_store () is not store):
+                    raise ValueError (
+                        "Every character of a match has to be made with "
+                        "the store of the match."
+                    )
+
+        self.players = players
+        self.store = store
+        self.clock = store.clock # Ticked once by every step of the match.
+        self.platforms = platforms
+        self.background_index = background_index
+        self.attacks = {} # {attack identifier: Arrow or Lightning}
+        self.keymap = self._create_keymap (players)
+        self.frame = 0
+
+        # -------------------
+        #   Timer variables.
+        # -------------------
+        self.timer = [self.MATCH_MINUTES, self.MATCH_SECONDS]
+        self.timer_paused = False
+        self.time_recorded = self.clock.time ()
+
+        # -------------------------
+        #   End of game variables.
+        # -------------------------
+        self.texts = []
+        self.tie_checks = [False]
+        self.end_time = None
+        self.result = None
+        self.winner = None
+
+
+    # /////////////////////
+    #   Public functions.
+    # /////////////////////
+
+    def is_over (self) -> bool:
+        """
+        Has the match ended with a win or a draw?
+
+        Returns:
+            bool: Over or not.
+        """
+        return self.end_time != None
+
+    def get_binding (self, key: int) -> tuple or None:
+        """
+        Get the player bound to a key and the action it starts.
+
+        Args:
+            key (int): The pygame key.
+
+        Returns:
+            tuple or None: (Player, action) or None if nobody uses the key.
+        """
+        return self.keymap.get (key)
+
+    def end (self, texts: list, winner, end_time: float) -> None:
+        """
+        End the match with a win, or a draw if there is no winner.
+
+        Args:
+            texts (list[Text]): The texts that show how the match ended.
+            winner (Player or None): The player that won.
+            end_time (float): The game time the match ended at.
+        """
+        self.end_time = end_time
+        self.result = "draw" if (winner == None) else "win"
+        self.winner = winner
+        self.timer_paused = True
+        for text in texts:
+            self.texts.append (text)
+
+    def get_winner (self):
+        """
+        Get the player that won, as decided when the match ended.
+
+        Returns:
+            Player or None: The winner or None if nobody won (yet).
+        """
+        return self.winner
+
+
+    # //////////////////////
+    #   Private functions.
+    # //////////////////////
+
+    def _create_keymap (self, players: list) -> dict:
+        """
+        Make the keymap from the bindings of every player. If two players 
+        use the same key the last one gets it.
+
+        Args:
+            players (list[Player]): The players.
+
+        Returns:
+            dict: {key: (Player, action)}
+        """
+        keymap = {}
+        for player in players:
+            for key, action in player.get_bindings ().items ():
+                keymap[key] = (player, action)
+
+        return keymap
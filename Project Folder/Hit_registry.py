@@ -0,0 +1,101 @@
+#  ___________________________________________________________________________
+# /                               Hit_registry              Date: 2026-10-18 \
+# |                                                                           |
+# |                                Description                                |
+# |                                                                           |
+# |  Remembers which hits landed on a fighter recently so the same hit isn't  |
+# |   counted again every frame it overlaps. Each hit is keyed by (attacker   |
+# | identifier, attack identifier) and expires on its own after a cooldown on |
+# |                     the simulation clock of the match.                    |
+# |                                                                           |
+# |  Looking up a hit is one dictionary lookup. Expired hits are taken off a  |
+# |  heap ordered by when they expire, so many attackers and projectiles can  |
+# |           hit the same fighter without any list being searched.           |
+# |                                                                           |
+# | Functions:                                                                |
+# |     is_active:                                                            |
+# |         - Is a hit still cooling down?                                    |
+# |                                                                           |
+# |     add:                                                                  |
+# |         - Record a hit, restarting its cooldown.                          |
+# |                                                                           |
+# |     clear:                                                                |
+# |         - Forget every hit.                                               |
+# |                                                                           |
+# \___________________________________________________________________________/
+
+from Sim_clock import Sim_clock
+from itertools import count
+import heapq
+
+
+class Hit_registry ():
+    __slots__ = ("clock", "expiries", "heap", "order")
+
+    def __init__ (self, clock: Sim_clock):
+        """
+        Make an empty registry.
+
+        Args:
+            clock (Sim_clock): The clock of the match the hits land in.
+        """
+        self.clock = clock
+        self.expiries = {} # {(attacker, attack): tick the hit expires on}
+        self.heap = []     # [(tick, order, (attacker, attack)), ...]
+        self.order = count ()
+
+
+    # /////////////////////
+    #   Public functions.
+    # /////////////////////
+
+    def is_active (self, key: tuple) -> bool:
+        """
+        Is a hit still cooling down?
+
+        Args:
+            key (tuple): (attacker identifier, attack identifier)
+
+        Returns:
+            bool: If the hit was added and hasn't expired.
+        """
+        self._expire ()
+        return key in self.expiries
+
+    def add (self, key: tuple, cooldown: float) -> None:
+        """
+        Record a hit. Adding a hit that is already cooling down restarts 
+        its cooldown.
+
+        Args:
+            key (tuple): (attacker identifier, attack identifier)
+            cooldown (float): Seconds of game time until the hit expires.
+        """
+        clock = self.clock
+        expiry = clock.get_ticks () + round (cooldown * clock.TICK_RATE)
+        self.expiries[key] = expiry
+        heapq.heappush (self.heap, (expiry, next (self.order), key))
+
+    def clear (self) -> None:
+        """
+        Forget every hit.
+        """
+        self.expiries.clear ()
+        self.heap.clear ()
+
+
+    # //////////////////////
+    #   Private functions.
+    # //////////////////////
+
+    def _expire (self) -> None:
+        """
+        Remove the hits whose cooldown is over. A hit added again leaves 
+        its old entry on the heap, that entry is skipped.
+        """
+        now = self.clock.get_ticks ()
+        heap = self.heap
+        while (len (heap) != 0 and heap[0][0] <= now):
+            expiry, _, key = heapq.heappop (heap)
+            if (self.expiries.get (key) == expiry):
+                del self.expiries[key]
@@ -0,0 +1,72 @@
+#  ___________________________________________________________________________
+# /                                   Hud                   Date: 2026-10-18 \
+# |                                                                           |
+# |                                Description                                |
+# |                                                                           |
+# |   Shared resources for the information drawn at the bottom of the screen  |
+# |   during a match. The life icons are decoded and scaled once per process  |
+# |          and size and every character borrows the same surfaces.          |
+# |                                                                           |
+# |    The information of each player sits in a grid of up to INFO_COLUMNS    |
+# |   columns, centered on the screen, with a new row for every INFO_COLUMNS  |
+# |                                  players.                                 |
+# |                                                                           |
+# | Functions:                                                                |
+# |     get_life_icons:                                                       |
+# |         - Get the life icons scaled to a size.                            |
+# |                                                                           |
+# |     get_info_pos:                                                         |
+# |         - Get where the information of a player goes.                     |
+# |                                                                           |
+# \___________________________________________________________________________/
+
+import Assets
+import pygame
+import os
+
+LIFE_ICON_SIZE = (100, 100)
+LIFE_ICON_COUNT = 4
+
+INFO_TOP = 700          # The y position of the first row.
+INFO_COLUMNS = 4        # Players in one row.
+INFO_COLUMN_WIDTH = 190
+INFO_ROW_HEIGHT = 50
+
+
+def get_life_icons (size: "tuple[int]"=LIFE_ICON_SIZE) -> "tuple[pygame.Surface]":
+    """
+    Get the life icons, Health_1 to Health_4, scaled to a size.
+
+    Args:
+        size (tuple[int], optional):
+            The (width, height) of each icon. Defaults to LIFE_ICON_SIZE.
+
+    Returns:
+        tuple[pygame.Surface]: The shared icons. Do not draw onto them.
+    """
+    health_path = os.path.join (os.getcwd (), "IMGS", "Health")
+    return tuple (
+        Assets.load_scaled_image (
+            os.path.join (health_path, f"Health_{x}.png"),
+            size
+        ) for x in range (1, LIFE_ICON_COUNT + 1)
+    )
+
+def get_info_pos (player: int, count: int, width: int) -> "list[int]":
+    """
+    Get the position of the information of a player.
+
+    Args:
+        player (int): The player value, starting at 1.
+        count (int): The amount of players in the match.
+        width (int): The width of the window.
+
+    Returns:
+        list[int]: The (x, y) of the name of the player.
+    """
+    columns = max (1, min (count, INFO_COLUMNS))
+    start = (width - (columns * INFO_COLUMN_WIDTH)) // 2
+    return [
+        start + (INFO_COLUMN_WIDTH * ((player - 1) % columns)),
+        INFO_TOP + (INFO_ROW_HEIGHT * ((player - 1) // columns))
+    ]
@@ -11,6 +11,7 @@
 # ------------
 #   Imports.
 # ------------
+import Assets
 import pygame
 import os
 
@@ -40,7 +41,7 @@ class Images ():
         )
         image_path = os.path.join (main_images_path, image + ".png")
         self.image = pygame.transform.scale (
-            pygame.image.load (image_path),
+            Assets.load_image (image_path),
             (self.width, self.height)
         )
 
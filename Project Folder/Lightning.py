@@ -9,6 +9,15 @@
 # |     __init__:                                                             |
 # |         - Initializes all private variables and images.                   |
 # |                                                                           |
+# |     reset:                                                                |
+# |         - Set the lightning up for a new strike.                          |
+# |                                                                           |
+# |     release:                                                              |
+# |         - Give the lightning back to its pool.                            |
+# |                                                                           |
+# |     update:                                                               |
+# |         - Move the lightning to its next frame.                           |
+# |                                                                           |
 # |     draw:                                                                 |
 # |         - Used to draw the lightning.                                     |
 # |                                                                           |
@@ -33,14 +42,32 @@
 # |                                                                           |
 # \___________________________________________________________________________/
 
-from random import randint
+from Projectile_pool import get_pool, next_attack_identifier
+import Entities
+import Assets
 import pygame
 
 class Lightning ():
     DISPLAY_TIME = 4
 
+    # -------------------------------------------------------
+    #   Strikes are reused through the pool of their store 
+    #    so they only keep a fixed set of variables. 
+    #    __weakref__ lets the store free the row of dropped 
+    #                        strikes.
+    # -------------------------------------------------------
+    __slots__ = (
+        "identifier", "damage", "num", "images", "max_index", "store", 
+        "entity", "index", "player_pos", "width_and_height", "image", 
+        "attack_identifier", "__weakref__"
+    )
+
+    # Variables kept in the entity store.
+    pos = Entities.component ("pos")
+
     def __init__(
         self,
+        store: Entities.Store,
         x: int,
         y: int,
         damage: int,
@@ -50,40 +77,73 @@ class Lightning ():
         identifier: int,
         attack_number: int
     ):
+        self.store = store
+        self.entity = store.add (self)
+        self.reset (
+            x, y, 
+            damage, 
+            images, 
+            width_of_calling_class, 
+            height_of_calling_class, 
+            identifier, 
+            attack_number
+        )
+
+
+
+    # /////////////////////
+    #   Public functions.
+    # /////////////////////
+
+
+    def reset (
+        self,
+        x: int,
+        y: int,
+        damage: int,
+        images: "list[pygame.surface.Surface]",
+        width_of_calling_class: int,
+        height_of_calling_class: int,
+        identifier: int,
+        attack_number: int
+    ) -> None:
+        """
+        Set the lightning up for a new strike. Takes the same arguments as 
+        __init__.
+        """
         self.identifier = identifier
         self.damage = damage
         self.num = attack_number
         self.images = images
         self.max_index = len (self.images) * self.DISPLAY_TIME
+        self.store.reset (self.entity, pos=[x, y], lifetime=self.max_index)
         self.index = 0
         self.player_pos = (x, y)
-        self.width_and_height = [
+        self.width_and_height = (
             width_of_calling_class,
             height_of_calling_class
-        ]
-        self.pos = [x, y]
-        self.attack_identifier = randint (0, 100000000000000000000000000000000)
-
-
-
-    # /////////////////////
-    #   Public functions.
-    # /////////////////////
-
+        )
+        self.image = self.images[0]
+        self.attack_identifier = next_attack_identifier ()
 
-    def draw (self, window: pygame.surface.Surface) -> bool:
+    def release (self) -> None:
         """
-        Draw the lightning on the screen.
+        Give the lightning back to the pool once the strike is over.
+        """
+        get_pool (self.store, Lightning).release (self)
 
-        Args:
-            window (pygame.surface.Surface): Main window to draw lightning on.
+    def update (self) -> bool:
+        """
+        Move the lightning to its next frame.
 
         Returns:
-            bool: Delete this object or not.
+            bool: Keep this object or not.
         """
-        self.max_index = len (self.images) * self.DISPLAY_TIME
-
-        if (self.index + 1 >= self.max_index):
+        # ------------------------------------------------
+        #   Lifetimes are counted down for every entity
+        #   at once by Entities.Store.update_projectiles.
+        # ------------------------------------------------
+        if (self.store.get ("expired")[self.entity]):
             self.index = 0
             return False
 
@@ -104,15 +164,24 @@ class Lightning ():
         new_y += self.width_and_height[1] - 5
         new_y -= height
 
-        self.pos = [new_x, new_y]
+        self.pos = (new_x, new_y)
+        self.image = image
         self.index += 1
-        window.blit (
-            image,
-            [new_x, new_y]
-        )
 
         return True
 
+    def draw (self, window: pygame.surface.Surface) -> None:
+        """
+        Draw the lightning on the screen.
+
+        Args:
+            window (pygame.surface.Surface): Main window to draw lightning on.
+        """
+        window.blit (
+            self.image,
+            self.pos
+        )
+
     def get_attacking (self) -> int:
         """
         Get the attack number
@@ -153,6 +222,39 @@ class Lightning ():
         else:
             return False
 
+    def get_rect (self) -> pygame.Rect:
+        """
+        Get the rectangle around the current lightning image. Used to skip 
+        the mask check between objects that are far apart.
+
+        Returns:
+            pygame.Rect: The rectangle.
+        """
+        image = self.images[self.index // self.DISPLAY_TIME]
+        return pygame.Rect (
+            int (self.pos[0]), 
+            int (self.pos[1]), 
+            image.get_width (), 
+            image.get_height ()
+        )
+
+    def get_draw_rects (self) -> "list[pygame.Rect]":
+        """
+        Get the area of the screen the lightning is drawn on. The drawn 
+        image can be one frame behind the one used for collisions.
+
+        Returns:
+            list[pygame.Rect]: The rectangle.
+        """
+        return [
+            pygame.Rect (
+                int (self.pos[0]), 
+                int (self.pos[1]), 
+                self.image.get_width (), 
+                self.image.get_height ()
+            )
+        ]
+
     def get_mask (self) -> pygame.mask.Mask:
         """
         Gets the mask of the current image on the screen.
@@ -161,9 +263,16 @@ class Lightning ():
             pygame.mask.Mask or None:
                 Returns the mask if an image is on the screen.
         """
-        return pygame.mask.from_surface (
-            self.images[self.index // self.DISPLAY_TIME]
-        )
+        return Assets.get_mask (self.images[self.index // self.DISPLAY_TIME])
+
+    def get_mask_pos (self) -> "list[int]":
+        """
+        Get the top left of the mask, the same as the position.
+
+        Returns:
+            list[int]: The position.
+        """
+        return self.pos
 
     def get_pos (self) -> "list[int]":
         return self.pos
@@ -213,7 +322,8 @@ class Lightning ():
         Returns:
             list[int]:
                 Returns a list with the difference in
-                x position and y position in a list.
+                x position and y position of the masks in a list.
         """
-        pos = object.get_pos ()
+        pos = object.get_mask_pos ()
         return [int (self.pos[0] - pos[0]), int (self.pos[1] - pos[1])]
+
@@ -19,19 +19,38 @@
 
 
 from Character import Character
+from Projectile_pool import get_pool
 from Arrow import Arrow
+import Entities
+import Assets
 import pygame
 import os
 
 class Link (Character):
-    def __init__(self, images_path: str, pos: "list[int]", player_num: int):
+    IMAGES_FOLDER = "Link"
+    DISPLAY_TIME = Character.DISPLAY_TIME - 1
+    __slots__ = (
+        "attack_counter", "attack_1_damage", "attack_2_damage", 
+        "arrow_image", "flipped_arrow_image"
+    )
+
+    def __init__(
+        self, 
+        images_path: str, 
+        pos: "list[int]", 
+        player_num: int,
+        store: Entities.Store=None
+    ):
         """
         Initialize Pikachu.
 
         Args:
             images_path (str): Path to all images
+            store (Entities.Store, optional): 
+                The entity store of the match. Defaults to a store of its 
+                own.
         """
-        character_images_path = os.path.join (images_path, "Link")
+        character_images_path = os.path.join (images_path, self.IMAGES_FOLDER)
 
         # ------------------------
         #   Attacking variables.
@@ -45,7 +64,8 @@ class Link (Character):
         #   Get the arrow for the Link class
         # ------------------------------------
         arrow_path = os.path.join (character_images_path, "arrow_link.png")
-        self.arrow_image = pygame.image.load (arrow_path)
+        self.arrow_image = Assets.load_image (arrow_path)
+        self.flipped_arrow_image = Assets.load_flipped_image (arrow_path)
 
         # ---------------------------------------------
         #   Run the initializer for the parent class.
@@ -58,10 +78,10 @@ class Link (Character):
             position=pos,
             knockback=[[4, .3], [3, .2]],
             name="Link",
-            player=player_num
+            player=player_num,
+            store=store
         )
         self.attacks = [self.attack_1, self.attack_2]
-        self.DISPLAY_TIME -= 1
 
 
 
@@ -70,15 +90,32 @@ class Link (Character):
     # /////////////////////
 
 
+    @classmethod
+    def preload (cls, images_path: str) -> None:
+        """
+        Decode the images of Link, including the arrow, into the asset 
+        cache. The arrow is converted and mirrored once Link is created.
+
+        Args:
+            images_path (str): Path to all images.
+        """
+        super ().preload (images_path)
+        arrow_path = os.path.join (images_path, cls.IMAGES_FOLDER, "arrow_link.png")
+        Assets.load_image (arrow_path, convert=False)
+
     def attack_1 (self) -> None:
         self.attacking = 1
 
     def attack_2 (self) -> Arrow:
         self.attacking = 2
-        return Arrow (
-            self.pos.copy (),
+        image = self.arrow_image
+        if (not self.facing_right):
+            image = self.flipped_arrow_image
+
+        return get_pool (self.store, Arrow).acquire (
+            self.pos,
             self.attack_2_damage,
-            self.arrow_image,
+            image,
             self.facing_right,
             self.identifier,
             self.attacking
@@ -0,0 +1,235 @@
+#  ___________________________________________________________________________
+# /                                 Manifest                Date: 2026-10-18 \
+# |                                                                           |
+# |                                Description                                |
+# |                                                                           |
+# |  Each character images folder has a manifest.json listing its animations, |
+# |   the frame files of each animation in order, how many game frames each   |
+# | image is shown for and the anchor point of each image. The game reads the |
+# |     manifest instead of searching the folders and sorting the frames.     |
+# |                                                                           |
+# | Run this file from the folder containing the python files to generate the |
+# |   manifests after adding or renaming images. Durations and anchors that   |
+# |                       were edited by hand are kept.                       |
+# |                                                                           |
+# | Functions:                                                                |
+# |     build_manifest:                                                       |
+# |         - Search a character folder and build its manifest.               |
+# |                                                                           |
+# |     read_manifest:                                                        |
+# |         - Read the manifest file of a character folder.                   |
+# |                                                                           |
+# |     load_manifest:                                                        |
+# |         - Get the manifest from the image bundle or the manifest file.    |
+# |                                                                           |
+# |     get_timelines:                                                        |
+# |         - Turn the frame durations into a frame index for every game      |
+# |           frame.                                                          |
+# |                                                                           |
+# \___________________________________________________________________________/
+
+import Assets
+import json
+import os
+
+MANIFEST_NAME = "manifest.json"
+EXTENSIONS = (".jpg", ".png")
+
+
+def get_frame_number (file: str) -> int or None:
+    """
+    Get the frame number at the end of an animation file name.
+
+    Args:
+        file (str): The file name. Example: running_link_01.png
+
+    Returns:
+        int or None: The number or None if the file isn't a frame.
+    """
+    if (" " in file or not file.endswith (EXTENSIONS)):
+        return None
+
+    number = os.path.splitext (file)[0][-2:]
+    if (not number.isnumeric ()):
+        return None
+
+    return int (number)
+
+def build_manifest (character_images_path: str, display_time: int) -> dict:
+    """
+    Search the folders of a character and build its manifest.
+
+    Args:
+        character_images_path (str): The images folder of the character.
+        display_time (int): Game frames each new image is shown for.
+
+    Returns:
+        dict: The manifest.
+    """
+    # -------------------------------------------------
+    #   Keep anything that was edited by hand in the
+    #            manifest that is already there.
+    # -------------------------------------------------
+    old_frames = {}
+    old_manifest = read_manifest (character_images_path)
+    if (old_manifest != None):
+        for animation in old_manifest["animations"].values ():
+            for frame in animation["frames"]:
+                old_frames[frame["file"]] = frame
+
+    animations = {}
+    for folder in sorted (os.listdir (character_images_path)):
+        folder_path = os.path.join (character_images_path, folder)
+        if (not os.path.isdir (folder_path)):
+            continue
+
+        # -------------------------------------------
+        #   Frames are ordered by the number at the
+        #           end of their file name.
+        # -------------------------------------------
+        numbered = []
+        for file in sorted (os.listdir (folder_path)):
+            number = get_frame_number (file)
+            if (number != None):
+                if (os.path.isfile (os.path.join (folder_path, file))):
+                    numbered.append ((number, f"{folder}/{file}"))
+
+        numbered.sort (key=lambda frame: frame[0])
+
+        frames = []
+        for _, file in numbered:
+            frame = {"file": file, "duration": display_time, "anchor": [0, 0]}
+            if (file in old_frames):
+                frame["duration"] = old_frames[file]["duration"]
+                frame["anchor"] = old_frames[file]["anchor"]
+            frames.append (frame)
+
+        animations[folder.upper ()] = {"frames": frames}
+
+    return {
+        "name": os.path.basename (os.path.normpath (character_images_path)),
+        "animations": animations
+    }
+
+def read_manifest (character_images_path: str) -> dict or None:
+    """
+    Read the manifest file of a character.
+
+    Args:
+        character_images_path (str): The images folder of the character.
+
+    Returns:
+        dict or None: The manifest or None if there is no manifest file.
+    """
+    try:
+        path = os.path.join (character_images_path, MANIFEST_NAME)
+        with open (path, "r") as file:
+            return json.load (file)
+
+    except FileNotFoundError:
+        return None
+
+def write_manifest (character_images_path: str, manifest: dict) -> None:
+    """
+    Write the manifest file of a character.
+
+    Args:
+        character_images_path (str): The images folder of the character.
+        manifest (dict): The manifest.
+    """
+    path = os.path.join (character_images_path, MANIFEST_NAME)
+    with open (path, "w") as file:
+        json.dump (manifest, file, indent=4)
+        file.write ("\n")
+
+def load_manifest (character_images_path: str) -> dict or None:
+    """
+    Get the manifest of a character, from the image bundle if there is one 
+    and the manifest file hasn't changed since it was bundled.
+
+    Args:
+        character_images_path (str): The images folder of the character.
+
+    Returns:
+        dict or None: The manifest or None if there is no manifest.
+    """
+    manifest = Assets.get_bundled_manifest (
+        os.path.join (character_images_path, MANIFEST_NAME)
+    )
+    if (manifest == None):
+        manifest = read_manifest (character_images_path)
+
+    return manifest
+
+def get_frame_paths (character_images_path: str, manifest: dict) -> dict:
+    """
+    Get the path of every frame of every animation.
+
+    Args:
+        character_images_path (str): The images folder of the character.
+        manifest (dict): The manifest of the character.
+
+    Returns:
+        dict: {ANIMATION_NAME: [frame paths, ...]}
+    """
+    return {
+        name: [
+            os.path.join (character_images_path, *frame["file"].split ("/"))
+            for frame in animation["frames"]
+        ] for name, animation in manifest["animations"].items ()
+    }
+
+def get_timelines (manifest: dict) -> dict:
+    """
+    Get the frame index to show on each game frame of every animation.
+
+    Args:
+        manifest (dict): The manifest of a character.
+
+    Returns:
+        dict: {ANIMATION_NAME: (frame index, ...)}
+    """
+    timelines = {}
+    for name, animation in manifest["animations"].items ():
+        timeline = []
+        for index, frame in enumerate (animation["frames"]):
+            timeline += [index] * frame["duration"]
+
+        timelines[name] = tuple (timeline)
+
+    return timelines
+
+def get_anchors (manifest: dict) -> dict:
+    """
+    Get the anchor of each frame of every animation.
+
+    Args:
+        manifest (dict): The manifest of a character.
+
+    Returns:
+        dict: {ANIMATION_NAME: ((x, y), ...)}
+    """
+    return {
+        name: tuple (tuple (frame["anchor"]) for frame in animation["frames"])
+        for name, animation in manifest["animations"].items ()
+    }
+
+
+def main ():
+    from Captain_Falcon import Captain_Falcon
+    from Pikachu import Pikachu
+    from Link import Link
+
+    imgs_path = os.path.join (os.getcwd (), "IMGS")
+    for character in [Link, Pikachu, Captain_Falcon]:
+        character_images_path = os.path.join (imgs_path, character.IMAGES_FOLDER)
+        write_manifest (
+            character_images_path,
+            build_manifest (character_images_path, character.DISPLAY_TIME)
+        )
+        print (f"Wrote the manifest for: {character.IMAGES_FOLDER}")
+
+
+
+if (__name__ == "__main__"):
+    main ()
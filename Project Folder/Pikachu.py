@@ -8,20 +8,36 @@
 # \___________________________________________________________________________/
 
 from Character import Character
+from Projectile_pool import get_pool
 from Lightning import Lightning
+import Entities
+import Assets
 import pygame
 import os
 
 class Pikachu (Character):
+    IMAGES_FOLDER = "Pikachu"
+    __slots__ = (
+        "attack_counter", "attack_1_damage", "attack_2_damage", "lighting"
+    )
 
-    def __init__(self, images_path: str, pos: "list[int]", text_pos: int):
+    def __init__(
+        self, 
+        images_path: str, 
+        pos: "list[int]", 
+        text_pos: int,
+        store: Entities.Store=None
+    ):
         """
         Initialize Pikachu.
 
         Args:
             images_path (str): Path to all images
+            store (Entities.Store, optional): 
+                The entity store of the match. Defaults to a store of its 
+                own.
         """
-        character_images_path = os.path.join (images_path, "Pikachu")
+        character_images_path = os.path.join (images_path, self.IMAGES_FOLDER)
 
         # ------------------------
         #   Attacking variables.
@@ -35,7 +51,7 @@ class Pikachu (Character):
         # -------------------------------------------
         lightning_path = os.path.join (character_images_path, "lightning")
         self.lighting = [
-            pygame.image.load (
+            Assets.load_image (
                 os.path.join (
                     lightning_path,
                     "lightning_" + "0" + str (x) + ".png"
@@ -54,7 +70,8 @@ class Pikachu (Character):
             position=pos,
             knockback=[[4, .4], [6, .6]],
             name="Pikachu",
-            player=text_pos
+            player=text_pos,
+            store=store
         )
         
 
@@ -62,6 +79,26 @@ class Pikachu (Character):
     #   Public functions.
     # /////////////////////
 
+    @classmethod
+    def preload (cls, images_path: str) -> None:
+        """
+        Decode the images of Pikachu, including the lightning, into the 
+        asset cache. The lightning is converted once Pikachu is created.
+
+        Args:
+            images_path (str): Path to all images.
+        """
+        super ().preload (images_path)
+        lightning_path = os.path.join (images_path, cls.IMAGES_FOLDER, "lightning")
+        for x in range (1, 6):
+            Assets.load_image (
+                os.path.join (
+                    lightning_path,
+                    "lightning_" + "0" + str (x) + ".png"
+                ),
+                convert=False
+            )
+
     def attack_1 (self) -> None:
         """
         Activate attack 1.
@@ -76,7 +113,7 @@ class Pikachu (Character):
             Lightning: The lighting strike.
         """
         self.attacking = 2
-        return Lightning (
+        return get_pool (self.store, Lightning).acquire (
             self.pos[0],
             self.pos[1],
             self.attack_2_damage,
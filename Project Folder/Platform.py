@@ -20,6 +20,20 @@ class Platform ():
         )
         self.width = self.image.get_width ()
         self.height = self.image.get_height ()
+        self.mask = pygame.mask.from_surface (self.image)
+
+        # -------------------------------------------------
+        #   The first solid row of each column, or None,
+        #       so landing on the platform is a lookup.
+        # -------------------------------------------------
+        self.heightmap = []
+        for x in range (self.width):
+            top = None
+            for y in range (self.height):
+                if (self.mask.get_at ((x, y))):
+                    top = y
+                    break
+            self.heightmap.append (top)
 
 
     # /////////////////////
@@ -47,6 +61,65 @@ class Platform ():
         """
         self.pos = pos
     
+    def get_rect (self) -> pygame.Rect:
+        """
+        Get the rectangle around the platform. Used to skip 
+        the mask check between objects that are far apart.
+
+        Returns:
+            pygame.Rect: The rectangle.
+        """
+        return pygame.Rect (
+            int (self.pos[0]), 
+            int (self.pos[1]), 
+            self.image.get_width (), 
+            self.image.get_height ()
+        )
+
+    def get_lift (self, pos: "list[int]", bottom_rows: "tuple[int or None]") -> int:
+        """
+        Get how far an object has to move up to stand on top of the 
+        platform without overlapping it.
+
+        Args:
+            pos (list[int]): The top left of the mask of the object.
+            bottom_rows (tuple[int or None]): 
+                The lowest solid row of each column of the object.
+
+        Returns:
+            int: The pixels to move up. 0 if the object is already clear.
+        """
+        offset_x = int (self.pos[0] - pos[0])
+
+        # --------------------------------------------------
+        #   The smallest vertical offset from the object to 
+        #      the platform where no columns overlap.
+        # --------------------------------------------------
+        needed = None
+        for x, bottom in enumerate (bottom_rows):
+            column = x - offset_x
+            if (bottom == None or column < 0 or column >= self.width):
+                continue
+
+            top = self.heightmap[column]
+            if (top != None):
+                if (needed == None or bottom - top + 1 > needed):
+                    needed = bottom - top + 1
+
+        if (needed == None):
+            return 0
+
+        # -------------------------------------------------------
+        #   Offsets are truncated like in the mask checks so the
+        #     object ends up where stepping up would leave it.
+        # -------------------------------------------------------
+        distance = self.pos[1] - pos[1]
+        lift = needed - int (distance)
+        if (int (distance + lift) < needed):
+            lift += 1
+
+        return max (lift, 0)
+
     def get_mask (self) -> pygame.mask.Mask:
         """
         Get the mask of the platform.
@@ -54,7 +127,7 @@ class Platform ():
         Returns:
             pygame.mask.Mask: The mask of the platform.
         """
-        return pygame.mask.from_surface (self.image)
+        return self.mask
   
     def move(self, offset:  "list[int]"):
         """
@@ -66,6 +139,15 @@ class Platform ():
         self.pos[0] += self.STEP * offset[0]
         self.pos[1] += self.STEP * offset[1]
 
+    def get_mask_pos (self) -> "list[int]":
+        """
+        Get the top left of the mask, the same as the position.
+
+        Returns:
+            list[int]: The position of the platform.
+        """
+        return self.pos
+
     def get_pos (self) -> "list[int]":
         """
         Get the position of the platform.
@@ -11,15 +11,26 @@
 # \___________________________________________________________________________/
 
 
+from Hit_registry import Hit_registry
 from Character import Character
 from random import randint
-from time import time
 import pygame
 
 class Player ():
     GRAVITY = 1.5
     KNOCK_BACK_DELAY = .5
     ATTACK_TIME = .3
+    # ------------------------------------------------------
+    #   Attack identifiers are kept apart by their kind so 
+    #    a melee attack and a projectile never share one.
+    # ------------------------------------------------------
+    MELEE = "melee"
+    SHOT = "shot"
+    __slots__ = (
+        "directions", "attack_keys", "character", "movement", 
+        "attacking_this_frame", "knockback_hits", "damage_hits", 
+        "damage_taken", "starting_pos"
+    )
 
     def __init__ (
         self,
@@ -49,8 +60,9 @@ class Player ():
         self.character = None
         self.movement = [0, 0, 0, 0]
         self.attacking_this_frame = 0
-        self.knockback_from = []
-        self.attack_info = [0, 0]
+        self.knockback_hits = None # Made with the clock of each character.
+        self.damage_hits = None
+        self.damage_taken = {}
 
 
     # /////////////////////
@@ -91,6 +103,16 @@ class Player ():
         if (self.character != None):
             return self.character.pos
   
+    def get_mask_pos (self) -> None or "tuple[float]":
+        """
+        Get the top left of the current frame of the character.
+
+        Returns:
+            tuple[float] or None: The position of the frame.
+        """
+        if (self.character != None):
+            return self.character.get_mask_pos ()
+
     def allow_movement (self) -> None:
         """
         Allow the character to move.
@@ -131,7 +153,8 @@ class Player ():
         identifier: int, 
         force_x: int=1, 
         force_y: int=0, 
-        direction: bool=False
+        direction: bool=False,
+        attack_identifier: tuple=(MELEE, 0)
     ) -> None:
         """
         Apply a knockback force.
@@ -146,27 +169,16 @@ class Player ():
             direction (bool, optional):
                 Make the force apply in the same direction as 
                 the attack is moving.
+            attack_identifier (tuple, optional):
+                (MELEE or SHOT, identifier of the attack). Defaults to 
+                (MELEE, 0).
         """
-        # ---------------------------------------------
-        #   Find out if the object applying knockback 
-        #   to us has applied knockback to us in the 
-        #                 past second.
-        # ---------------------------------------------
-        go = True
-        if (identifier in [x[0] for x in self.knockback_from]):
-            go = False
-            for data in self.knockback_from:
-                if (identifier == data[0]):
-                    if ((time () - data[1]) >= self.KNOCK_BACK_DELAY):
-                        go = True
-                        self.knockback_from.remove (data)
-
         # -------------------------------------------------
-        #   If the object applying knockback didn't apply 
-        #      knockback in the last second then apply 
-        #                    knockback.
+        #   Only knock the character back if this attack
+        #   didn't already in the last KNOCK_BACK_DELAY.
         # -------------------------------------------------
-        if (go):
+        key = (identifier, attack_identifier)
+        if (not self.knockback_hits.is_active (key)):
             if (self.character != None):
                 if (direction):
                     direction = 1
@@ -174,21 +186,8 @@ class Player ():
                 else:
                     direction = -1
                 
-                amount_to_add = force_x // 2
-                if (amount_to_add < 1):
-                    amount_to_add = 1
-
-                for amount in range (amount_to_add * 4):
-                    self.character.add_to_queue (
-                        "MOVE",
-                        [
-                            [
-                                (force_x * direction), 
-                                -force_y
-                            ]
-                        ]
-                    )
-                self.knockback_from.append ([identifier, time ()])
+                self.character.knock_back (force_x * direction, force_y)
+                self.knockback_hits.add (key, self.KNOCK_BACK_DELAY)
 
 
     # =====================
@@ -210,6 +209,42 @@ class Player ():
 
         return False
 
+    def get_rect (self) -> pygame.Rect or None:
+        """
+        Get the rectangle around the character.
+
+        Returns:
+            pygame.Rect or None: The rectangle or None without a character.
+        """
+        if (self.character != None):
+            return self.character.get_rect ()
+
+        return None
+
+    def get_draw_rects (self) -> "list[pygame.Rect]":
+        """
+        Get the areas of the screen the character was last drawn on.
+
+        Returns:
+            list[pygame.Rect]: The rectangles, empty without a character.
+        """
+        if (self.character != None):
+            return self.character.get_draw_rects ()
+
+        return []
+
+    def get_bottom_rows (self) -> "tuple[int or None]" or None:
+        """
+        Get the lowest solid row of each column of the character.
+
+        Returns:
+            tuple[int or None] or None: The rows or None without a character.
+        """
+        if (self.character != None):
+            return self.character.get_bottom_rows ()
+
+        return None
+
     def get_attacking_update_one (self) -> int:
         """
         Did we press attack this frame?
@@ -258,6 +293,13 @@ class Player ():
     #   Draw functions.
     # ===================
 
+    def animate (self) -> None:
+        """
+        Move the animation of the character forward one frame.
+        """
+        if (self.character != None):
+            self.character.animate ()
+
     def draw (self, win: pygame.Surface) -> None:
         """
         Draw onto the screen all player details.
@@ -273,35 +315,63 @@ class Player ():
     #   Health functions.
     # =====================
 
-    def set_sudden_death (self, health: int, max: int, width: int) -> None:
+    def set_sudden_death (
+        self, 
+        health: int, 
+        max: int, 
+        width: int, 
+        slot: int=None
+    ) -> None:
         """
         Setup the character for sudden death.
 
         Args:
             health (int): The health to be set at
+            max (int): The amount of players in sudden death.
+            width (int): The width of the window.
+            slot (int, optional): 
+                Where to spawn from the left, starting at 1. Defaults to the 
+                player value.
         """
         if (self.character != None):
-            self.set_starting_pos (
-                max, 
-                width
-            )
+            if (slot == None):
+                slot = self.character.get_player_value ()
+
+            self._spawn (max, width, slot)
             self.character.set_sudden_death (health)
 
-    def adjust_health (self, amount: int, identifier: int) -> None:
+    def adjust_health (
+        self, 
+        amount: int, 
+        identifier: int, 
+        attack_identifier: tuple=(MELEE, 0)
+    ) -> None:
         """
-        Adjust the health of the character.
+        Adjust the health of the character. The same attack only adjusts it 
+        again once it stopped touching the character for ATTACK_TIME.
 
         Args:
             amount (int): Adjust by this amount.
+            identifier (int): The identifier of what adjusted the health.
+            attack_identifier (tuple, optional): 
+                (MELEE or SHOT, identifier of the attack). Defaults to 
+                (MELEE, 0).
         """
         if (self.character != None):
-            if (self.attack_info[0] == identifier):
-                if (time () - self.attack_info[1] > self.ATTACK_TIME):
-                    self.character.adjust_health (amount)
-            else:
-                self.character.adjust_health (amount)
+            adjusted = False
+            key = (identifier, attack_identifier)
+            if (not self.damage_hits.is_active (key)):
+                adjusted = self.character.adjust_health (amount)
             
-            self.attack_info = [identifier, time ()]
+            # ----------------------------------------------------
+            #   Keep track of the damage taken from each thing.
+            # ----------------------------------------------------
+            if (adjusted and amount < 0):
+                self.damage_taken[identifier] = (
+                    self.damage_taken.get (identifier, 0) - amount
+                )
+
+            self.damage_hits.add (key, self.ATTACK_TIME)
 
     def get_health (self) -> int:
         """
@@ -314,6 +384,18 @@ class Player ():
             return self.character.get_health ()
         return 0
 
+    def get_damage_taken (self, identifier: int) -> int:
+        """
+        Get the damage taken from something since the character was set.
+
+        Args:
+            identifier (int): The identifier of what dealt the damage.
+
+        Returns:
+            int: The damage.
+        """
+        return self.damage_taken.get (identifier, 0)
+
     def get_lives (self) -> int:
         """
         Get the amount of lives the character has life.
@@ -351,38 +433,8 @@ class Player ():
             width (int): The width of the window.
         """
         if (self.character != None):
-            self.character.set_text_pos (width)
-            pos = self.character.get_player_value ()
-
-            # ----------------------------
-            #   Add spacing to the wall.
-            # ----------------------------
-            padding = 40
-            width -= padding * 2
-
-            # ---------------------------------
-            #   Decide where char will spawn.
-            # ---------------------------------
-            distance_between_chars = (width - (40 * max))
-            player_pos = [
-                padding + (distance_between_chars * (pos - 1)), 
-                200
-            ]
-
-            self.character.set_pos (
-                player_pos
-            )
-
-            self.starting_pos = player_pos
-
-            if (pos == 1):
-                self.character.set_direction (True)
-            
-            elif (max - pos != 0):
-                self.character.set_direction (bool (randint (0, 1)))
-            
-            else: 
-                self.character.set_direction (False)
+            self.character.set_text_pos (max, width)
+            self._spawn (max, width, self.character.get_player_value ())
 
     def set_character (self, character: Character) -> None:
         """
@@ -393,6 +445,9 @@ class Player ():
                 The character that the player has chosen.
         """
         self.character = character
+        self.damage_taken = {}
+        self.knockback_hits = Hit_registry (character.get_clock ())
+        self.damage_hits = Hit_registry (character.get_clock ())
         self._reset_character ()
         self.movement = [0 for i in range (len (self.movement))]
 
@@ -423,19 +478,43 @@ class Player ():
 
         return [x_move, y_move]
 
-    def key_event (self, event) -> None:
+    def get_bindings (self) -> "dict[int, int]":
         """
-        Decide what to do on key events.
+        Get the action of each key of the player. Actions 0 to 3 are the 
+        directions, in the order of self.directions, and the attacks come 
+        after them.
+
+        Returns:
+            dict[int, int]: {key: action}
+        """
+        bindings = {}
+        for pos, key in enumerate (self.directions + self.attack_keys):
+            bindings[key] = pos
+
+        return bindings
+
+    def press (self, action: int) -> None:
+        """
+        Start an action when its key goes down.
 
         Args:
-            event (pygame.Event): The current pygame event.
+            action (int): The action from get_bindings.
         """
-        if (event.type == pygame.KEYDOWN):
-            self._set_movement (event)
-            self._set_attack (event)
+        if (action < len (self.directions)):
+            self.movement[action] = 1
 
-        elif (event.type == pygame.KEYUP):
-            self._un_set_movement (event)
+        else:
+            self._set_attack (action - len (self.directions))
+
+    def release (self, action: int) -> None:
+        """
+        Stop an action when its key comes up.
+
+        Args:
+            action (int): The action from get_bindings.
+        """
+        if (action < len (self.directions)):
+            self.movement[action] = 0
 
     def get_identifier (self) -> int:
         """
@@ -482,42 +561,61 @@ class Player ():
     #   Private functions.
     # //////////////////////
 
-    def _un_set_movement (self, event) -> None:
+    def _set_attack (self, pos: int) -> None:
         """
-        Un-set the movement list.
+        Start an attack if the character isn't attacking already.
 
         Args:
-            event (pygame event): An event object.
+            pos (int): The position of the attack key in self.attack_keys.
         """
-        for pos, dir in enumerate (self.directions):
-            if (event.key == dir):
-                self.movement[pos] = 0
+        if (self.character != None):
+            if (self.character.get_attacking () == 0):
+                self.character.set_attacking (pos + 1)
+                self.attacking_this_frame = pos + 1
+                self.character.moving = False
 
-    def _set_movement (self, event) -> None:
+    def _spawn (self, max: int, width: int, slot: int) -> None:
         """
-        Set the movement list.
+        Move the character to its spawn point. The spawn points are spread 
+        evenly between the walls.
 
         Args:
-            event (pygame.Event): The current pygame event.
-        """
-        for pos, dir in enumerate (self.directions):
-            if (event.key == dir):
-                self.movement[pos] = 1
+            max (int): The amount of spawn points.
+            width (int): The width of the window.
+            slot (int): The spawn point from the left, starting at 1.
+        """
+        # ----------------------------
+        #   Add spacing to the wall.
+        # ----------------------------
+        padding = 40
+        width -= padding * 2
+
+        # ---------------------------------
+        #   Decide where char will spawn.
+        # ---------------------------------
+        distance_between_chars = 0
+        if (max > 1):
+            distance_between_chars = (width - (padding * 2)) // (max - 1)
+
+        player_pos = [
+            padding + (distance_between_chars * (slot - 1)), 
+            200
+        ]
 
-    def _set_attack (self, event) -> None:
-        """
-        Set the attacking value of the character.
+        self.character.set_pos (
+            player_pos
+        )
 
-        Args:
-            event (pygame.Event): The current pygame event.
-        """
-        self.attacking_this_frame = 0
-        for pos, key in enumerate (self.attack_keys):
-            if (event.key == key):
-                if (self.character.get_attacking () == 0):
-                    self.character.set_attacking (pos + 1)
-                    self.attacking_this_frame = pos + 1
-                    self.character.moving = False
+        self.starting_pos = player_pos
+
+        if (slot == 1):
+            self.character.set_direction (True)
+        
+        elif (max - slot != 0):
+            self.character.set_direction (bool (randint (0, 1)))
+        
+        else: 
+            self.character.set_direction (False)
 
     def _reset_character (self) -> None:
         """
@@ -0,0 +1,115 @@
+#  ___________________________________________________________________________
+# /                             Projectile_pool             Date: 2026-10-18 \
+# |                                                                           |
+# |                                Description                                |
+# |                                                                           |
+# |  Keeps the arrows and lightning strikes that are done flying so the next  |
+# | shot reuses one instead of making a new object. Each projectile keeps its |
+# | row in the entity store of its match while it waits in the pool, so every |
+# |            store has its own pool for each kind of projectile.            |
+# |                                                                           |
+# |  Every shot gets a small integer attack identifier counted up from 0 for  |
+# |                             the whole process.                            |
+# |                                                                           |
+# | Functions:                                                                |
+# |     get_pool:                                                             |
+# |         - Get the pool of a kind of projectile in an entity store.        |
+# |                                                                           |
+# |     acquire:                                                              |
+# |         - Reuse a waiting projectile, or make one, for a new shot.        |
+# |                                                                           |
+# |     release:                                                              |
+# |         - Stop a projectile and put it back in the pool.                  |
+# |                                                                           |
+# |     next_attack_identifier:                                               |
+# |         - Get the identifier of a new shot.                               |
+# |                                                                           |
+# \___________________________________________________________________________/
+
+from itertools import count
+import Entities
+
+_attack_identifiers = count ()
+
+
+class Projectile_pool ():
+    def __init__ (self, projectile_class: type, store: Entities.Store):
+        """
+        Make an empty pool. Use get_pool to get the pool of a store.
+
+        Args:
+            projectile_class (type): 
+                The class made when the pool is empty. It takes the store 
+                followed by the arguments of acquire, and its objects need 
+                a reset method taking the arguments of acquire.
+            store (Entities.Store): The store the projectiles keep rows in.
+        """
+        self.projectile_class = projectile_class
+        self.store = store
+        self.waiting = []
+
+
+    # /////////////////////
+    #   Public functions.
+    # /////////////////////
+
+    def acquire (self, *args):
+        """
+        Get a projectile set up for a new shot.
+
+        Args:
+            *args: The arguments of the projectile class.
+
+        Returns:
+            object: The projectile.
+        """
+        if (len (self.waiting) == 0):
+            return self.projectile_class (self.store, *args)
+
+        projectile = self.waiting.pop ()
+        projectile.reset (*args)
+        return projectile
+
+    def release (self, projectile) -> None:
+        """
+        Stop a projectile and keep it for a later shot. Don't use it 
+        again until acquire gives it back.
+
+        Args:
+            projectile (object): A projectile made by this pool.
+        """
+        self.store.get ("alive")[projectile.entity] = False
+        self.waiting.append (projectile)
+
+
+def get_pool (
+    store: Entities.Store, 
+    projectile_class: type
+) -> Projectile_pool:
+    """
+    Get the pool of a kind of projectile in a store, making it the first 
+    time it is asked for.
+
+    Args:
+        store (Entities.Store): The store of the match.
+        projectile_class (type): The kind of projectile. Example: Arrow
+
+    Returns:
+        Projectile_pool: The pool.
+    """
+    if (projectile_class not in store.pools):
+        store.pools[projectile_class] = Projectile_pool (
+            projectile_class, 
+            store
+        )
+
+    return store.pools[projectile_class]
+
+def next_attack_identifier () -> int:
+    """
+    Get the identifier of a new shot.
+
+    Returns:
+        int: The identifier.
+    """
+    return next (_attack_identifiers)
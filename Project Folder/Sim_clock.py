@@ -0,0 +1,77 @@
+#  ___________________________________________________________________________
+# /                                Sim_clock                Date: 2026-10-18 \
+# |                                                                           |
+# |                                Description                                |
+# |                                                                           |
+# | The clock every gameplay timer reads. It only moves forward when the game |
+# |       loop ticks it once per frame, so timers like knockback delays,      |
+# | invulnerability and the match timer depend on how many frames were played |
+# |                 instead of how much real time has passed.                 |
+# |                                                                           |
+# |   A headless simulation can tick it as fast as the CPU allows and a slow  |
+# | frame doesn't change what happens in the game. Every match has a clock of |
+# |  its own, kept in its entity store, so matches played side by side don't  |
+# |                       speed up each other's timers.                       |
+# |                                                                           |
+# | Functions:                                                                |
+# |     tick:                                                                 |
+# |         - Move the clock forward.                                         |
+# |                                                                           |
+# |     get_ticks:                                                            |
+# |         - Get the ticks since the clock started.                          |
+# |                                                                           |
+# |     time:                                                                 |
+# |         - Get the seconds since the clock started.                        |
+# |                                                                           |
+# |     reset:                                                                |
+# |         - Move the clock back to the start.                               |
+# |                                                                           |
+# \___________________________________________________________________________/
+
+class Sim_clock ():
+    TICK_RATE = 30 # Ticks in one second of game time.
+    __slots__ = ("ticks",)
+
+    def __init__ (self):
+        """
+        Start a clock at 0 ticks.
+        """
+        self.ticks = 0
+
+
+    # /////////////////////
+    #   Public functions.
+    # /////////////////////
+
+    def tick (self, amount: int=1) -> None:
+        """
+        Move the clock forward.
+
+        Args:
+            amount (int, optional): Ticks to move forward by. Defaults to 1.
+        """
+        self.ticks += amount
+
+    def get_ticks (self) -> int:
+        """
+        Get the ticks since the clock started.
+
+        Returns:
+            int: The ticks.
+        """
+        return self.ticks
+
+    def time (self) -> float:
+        """
+        Get the game time in seconds. Used in place of time.time for gameplay.
+
+        Returns:
+            float: The seconds since the clock started.
+        """
+        return self.ticks / self.TICK_RATE
+
+    def reset (self) -> None:
+        """
+        Move the clock back to the start.
+        """
+        self.ticks = 0
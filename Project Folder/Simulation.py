@@ -0,0 +1,188 @@
+#  ___________________________________________________________________________
+# /                                Simulation               Date: 2026-10-18 \
+# |                                                                           |
+# |                                Description                                |
+# |                                                                           |
+# |      Runs matches without anyone playing them. Every frame is run by      |
+# |   Super_smash_bros.step, the same function the game uses, but nothing is  |
+# |   drawn, there is no menu or music and frames are not capped to the FPS.  |
+# |            The window is only opened on the dummy video driver.           |
+# |                                                                           |
+# | Inputs are key presses made up for each frame, either at random or from a |
+# | script. The simulation clock is ticked once per frame so every timer in a |
+# |     match lasts the same number of frames no matter how fast it runs.     |
+# |                                                                           |
+# |  Run this file from the folder containing the python files to simulate a  |
+# |           few matches and print the simulated frames per second.          |
+# |                                                                           |
+# | Functions:                                                                |
+# |     random_inputs:                                                        |
+# |         - Make random key presses for every player.                       |
+# |                                                                           |
+# |     scripted_inputs:                                                      |
+# |         - Make the key presses written in a script.                       |
+# |                                                                           |
+# |     run_match:                                                            |
+# |         - Simulate one match and get its result.                          |
+# |                                                                           |
+# \___________________________________________________________________________/
+
+import os
+
+os.environ.setdefault ("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault ("SDL_AUDIODRIVER", "dummy")
+
+from Super_smash_bros import *
+from time import perf_counter
+import random
+
+PRESS_CHANCE = .1       # Chance of a random key press each frame.
+RELEASE_CHANCE = .1     # Chance of a random key release each frame.
+
+
+def random_inputs (seed: int=None):
+    """
+    Make random key presses for every player.
+
+    Args:
+        seed (int, optional): Seed for the presses. Defaults to None.
+
+    Returns:
+        function:
+            Takes the frame and the players and returns the key events 
+            of that frame.
+    """
+    rng = random.Random (seed)
+    held = {}
+
+    def inputs (frame: int, players: "list[Player]") -> list:
+        events = []
+        for pos, player in enumerate (players):
+            held.setdefault (pos, set ())
+            keys = player.directions + player.attack_keys
+            if (rng.random () < PRESS_CHANCE):
+                key = rng.choice (keys)
+                held[pos].add (key)
+                events.append (pygame.event.Event (pygame.KEYDOWN, key=key))
+
+            if (len (held[pos]) != 0 and rng.random () < RELEASE_CHANCE):
+                key = rng.choice (sorted (held[pos]))
+                held[pos].remove (key)
+                events.append (pygame.event.Event (pygame.KEYUP, key=key))
+
+        return events
+
+    return inputs
+
+def scripted_inputs (script: "dict[int, list[tuple]]"):
+    """
+    Make the key presses written in a script.
+
+    Args:
+        script (dict[int, list[tuple]]): 
+            {frame: [(key, pressed), ...]} where pressed is True for a key 
+            going down and False for a key coming up.
+
+    Returns:
+        function:
+            Takes the frame and the players and returns the key events 
+            of that frame.
+    """
+    def inputs (frame: int, players: "list[Player]") -> list:
+        return [
+            pygame.event.Event (
+                pygame.KEYDOWN if (pressed) else pygame.KEYUP, 
+                key=key
+            ) for key, pressed in script.get (frame, [])
+        ]
+
+    return inputs
+
+def run_match (
+    characters: list, 
+    inputs=None, 
+    background_index: int=0,
+    max_frames: int=FPS * 300
+) -> dict:
+    """
+    Simulate one match.
+
+    Args:
+        characters (list): 
+            The character class of each player. Example: [Link, Pikachu]
+        inputs (function, optional): 
+            Made by random_inputs or scripted_inputs. Defaults to random 
+            presses.
+        background_index (int, optional): 
+            The background the match is on. Defaults to 0.
+        max_frames (int, optional): 
+            Frames to give up after. Defaults to FPS * 300.
+
+    Returns:
+        dict: 
+            How the match ended, who won, how many frames it lasted and 
+            the lives, health and damage dealt of every player.
+    """
+    if (inputs == None):
+        inputs = random_inputs ()
+
+    if (pygame.display.get_surface () == None):
+        initialize (music=False)
+
+    imgs_path = os.path.join (os.getcwd (), "IMGS")
+    platforms = create_platforms ()
+    store = Entities.Store ()
+    players = create_players ()[:len (characters)]
+    for pos, player in enumerate (players):
+        player.set_character (
+            characters[pos] (imgs_path, [0, 0], pos + 1, store)
+        )
+    for player in players:
+        player.set_starting_pos (len (players), WIN_SIZE[0])
+
+    state = Game_state (players, platforms, store, background_index)
+    while (not state.is_over () and state.frame < max_frames):
+        step (state, inputs (state.frame, players))
+
+    winner = state.get_winner ()
+    if (winner != None):
+        winner = winner.get_character ().get_player_value ()
+
+    return {
+        "result": state.result if (state.is_over ()) else "timeout",
+        "winner": winner,
+        "frames": state.frame,
+        "players": [
+            {
+                "character": type (player.get_character ()).__name__,
+                "lives": player.get_lives (),
+                "health": player.get_health (),
+                "damage_dealt": sum (
+                    other.get_damage_taken (player.get_identifier ())
+                    for other in players if (other != player)
+                )
+            } for player in players
+        ]
+    }
+
+
+def main ():
+    matches = 10
+    characters = [Link, Pikachu, Captain_Falcon]
+
+    frames = 0
+    start = perf_counter ()
+    for match in range (matches):
+        picks = [characters[match % 3], characters[(match + 1) % 3]]
+        result = run_match (picks, random_inputs (match))
+        frames += result["frames"]
+        print (result)
+    elapsed = perf_counter () - start
+
+    print (f"Simulated {frames} frames in {round (elapsed, 2)} seconds")
+    print (f"Simulated FPS: {round (frames / elapsed)}")
+
+
+
+if (__name__ == "__main__"):
+    main ()
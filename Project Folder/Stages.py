@@ -0,0 +1,102 @@
+#  ___________________________________________________________________________
+# /                                  Stages                 Date: 2026-10-18 \
+# |                                                                           |
+# |                                Description                                |
+# |                                                                           |
+# |  The background of a map and its platforms never move during a match, so  |
+# |   they are drawn together once onto one converted surface per map. Every  |
+# |     frame of a match then only has to draw that one surface, and later    |
+# |   matches on the same map reuse it without loading or scaling anything.   |
+# |                                                                           |
+# | Functions:                                                                |
+# |     get_background:                                                       |
+# |         - Get the background of a map scaled to the window.               |
+# |                                                                           |
+# |     get_stage:                                                            |
+# |         - Get the background of a map with the platforms drawn on top.    |
+# |                                                                           |
+# |     clear:                                                                |
+# |         - Forget every stage.                                             |
+# |                                                                           |
+# \___________________________________________________________________________/
+
+import Assets
+import pygame
+import os
+
+# -------------------------------------------------------
+#   Stages keyed by the map index. Each value is 
+#   [platforms, surface] and is drawn again if the
+#   map is asked for with different platforms.
+# -------------------------------------------------------
+_stages = {}
+
+
+def get_background (
+    imgs: str, 
+    index: int, 
+    size: "tuple[int]"
+) -> pygame.Surface:
+    """
+    Get the background of a map scaled to a size.
+
+    Args:
+        imgs (str): The images path.
+        index (int): The index of the map.
+        size (tuple[int]): The (width, height) to scale to.
+
+    Returns:
+        pygame.Surface: The shared background. Do not draw onto it.
+    """
+    return Assets.load_scaled_image (
+        os.path.join (
+            imgs,
+            "Maps",
+            "Backgrounds",
+            f"Background_{index + 1}.png"
+        ),
+        size
+    )
+
+def get_stage (
+    imgs: str, 
+    index: int, 
+    size: "tuple[int]", 
+    platforms: list
+) -> pygame.Surface:
+    """
+    Get the background of a map with the platforms drawn on top, drawing 
+    it the first time the map is played.
+
+    Args:
+        imgs (str): The images path.
+        index (int): The index of the map.
+        size (tuple[int]): The (width, height) of the window.
+        platforms (list[Platform]): The platforms of the map.
+
+    Returns:
+        pygame.Surface: The shared stage. Do not draw onto it.
+    """
+    platforms = tuple (platforms)
+    if (index not in _stages or _stages[index][0] != platforms):
+        stage = pygame.Surface (size)
+        stage.blit (get_background (imgs, index, size), (0, 0))
+        for platform in platforms:
+            platform.draw (stage)
+
+        # -----------------------------------------
+        #   The stage has no see through pixels 
+        #     so it is converted without alpha.
+        # -----------------------------------------
+        if (pygame.display.get_surface () != None):
+            stage = stage.convert ()
+
+        _stages[index] = [platforms, stage]
+
+    return _stages[index][1]
+
+def clear () -> None:
+    """
+    Forget every stage.
+    """
+    _stages.clear ()
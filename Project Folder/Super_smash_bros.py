@@ -36,6 +36,10 @@
 # |        anything thats supposed to be behind everything does so.           |
 # |                                                                           |
 # \___________________________________________________________________________/
+from Character_loader import Character_loader
+from Dirty_renderer import Dirty_renderer
+from Character import Character
+from Game_state import Game_state
 from Captain_Falcon import Captain_Falcon
 from Lightning import Lightning
 from Platform import Platform
@@ -48,11 +52,56 @@ from Link import Link
 from Text import Text
 from time import time
 from pygame import mixer
+from Sim_clock import Sim_clock
+import Entities
+import Stages
+import Assets
 import pygame
 import os
 
-WIN_SIZE = (800, 800) # The size of the game window.
-FPS = 30              # A cap to the amount of fps.
+WIN_SIZE = (800, 800)     # The size of the game window.
+FPS = Sim_clock.TICK_RATE # A cap to the amount of fps.
+MUSIC_FILE = "bg_music_02.mp3"
+MAX_PLAYERS = 8
+
+# ----------------------------------------------------------
+#   The keys of each player: (up, down, left, right, 
+#                  [attack 1, attack 2])
+# ----------------------------------------------------------
+KEYBINDINGS = [
+    (
+        pygame.K_w, pygame.K_s, pygame.K_a, pygame.K_d, 
+        [pygame.K_q, pygame.K_e]
+    ),
+    (
+        pygame.K_p, pygame.K_SEMICOLON, pygame.K_l, pygame.K_QUOTE, 
+        [pygame.K_o, pygame.K_LEFTBRACKET]
+    ),
+    (
+        pygame.K_UP, pygame.K_DOWN, pygame.K_LEFT, pygame.K_RIGHT, 
+        [pygame.K_RSHIFT, pygame.K_RCTRL]
+    ),
+    (
+        pygame.K_t, pygame.K_g, pygame.K_f, pygame.K_h, 
+        [pygame.K_r, pygame.K_y]
+    ),
+    (
+        pygame.K_KP8, pygame.K_KP5, pygame.K_KP4, pygame.K_KP6, 
+        [pygame.K_KP7, pygame.K_KP9]
+    ),
+    (
+        pygame.K_HOME, pygame.K_END, pygame.K_DELETE, pygame.K_PAGEDOWN, 
+        [pygame.K_INSERT, pygame.K_PAGEUP]
+    ),
+    (
+        pygame.K_3, pygame.K_2, pygame.K_1, pygame.K_4, 
+        [pygame.K_5, pygame.K_6]
+    ),
+    (
+        pygame.K_c, pygame.K_x, pygame.K_z, pygame.K_v, 
+        [pygame.K_b, pygame.K_n]
+    )
+]
 
 def collision (players: "list[Player]", attcks: list, platforms: list) -> None:
     """
@@ -64,29 +113,57 @@ def collision (players: "list[Player]", attcks: list, platforms: list) -> None:
         platforms (list): The list of platforms in the game.
     """
     def checks (player: Player, attack) -> bool:
-        if (player.has_character ()):
+        if (player.has_character () and attack.get_identifier () in owners):
             if (player.get_identifier () != attack.get_identifier ()):
                 if (player.check_collision (attack)):
                     return True
         
         return False
 
+    # ---------------------------------------------------
+    #   The character that made each attack and the 
+    #    rectangles around the attacks for the broad 
+    #   phase below. Attacks left behind by a player 
+    #         that is out of the match do nothing.
+    # ---------------------------------------------------
+    owners = {
+        player.get_identifier (): player.get_character () 
+        for player in players 
+        if (player.has_character () and not player.is_dead ())
+    }
+    attack_rects = [
+        attack.get_rect ().inflate (Character.RECT_MARGIN, Character.RECT_MARGIN)
+        for attack in attcks
+    ]
+
     for player in players:
         if (player.has_character ()):
         
             # -------------------------------------------------
             #   Check collisions against players and attacks.
+            #    Only the attacks whose rectangles touch the
+            #         player get their masks checked.
             # -------------------------------------------------
-            for attack in attcks:
+            player_rect = player.get_rect ().inflate (
+                Character.RECT_MARGIN, 
+                Character.RECT_MARGIN
+            )
+            for index in player_rect.collidelistall (attack_rects):
+                attack = attcks[index]
                 if (checks (player, attack)):
                     damage = attack.get_attack_damage ()
-                    player.adjust_health (-damage, attack.get_identifier ())
+                    attack_identifier = (
+                        Player.SHOT, 
+                        attack.get_attack_identifier ()
+                    )
+                    player.adjust_health (
+                        -damage, 
+                        attack.get_identifier (), 
+                        attack_identifier
+                    )
 
-                    knockback = [[0, 0], [0, 0]]
-                    for other_player in players:
-                        player_2 = other_player.character
-                        if (attack.get_identifier () == player_2.get_identifier ()):
-                            knockback = player_2.get_knockback ()
+                    owner = owners[attack.get_identifier ()]
+                    knockback = owner.get_knockback ()
 
                     player_pos = player.get_pos ()
                     attack_pos = attack.get_pos ()
@@ -98,7 +175,8 @@ def collision (players: "list[Player]", attcks: list, platforms: list) -> None:
                             attack.get_identifier (),
                             force_x=knockback[attack.num - 1][0],
                             force_y=knockback[attack.num - 1][1], 
-                            direction=direction
+                            direction=direction,
+                            attack_identifier=attack_identifier
                         )
 
             # ---------------------------------------------------
@@ -116,39 +194,43 @@ def collision (players: "list[Player]", attcks: list, platforms: list) -> None:
                     #   Put the player a little below the top of the platform.
                     # ----------------------------------------------------------
                     pos = player.get_pos ()
-                    if (pos != None):
-                        while (player.check_collision (platform)):
-                            pos[1] -= 1
-                            player.set_pos (pos)
+                    if (pos is not None):
+                        pos[1] -= platform.get_lift (
+                            player.get_mask_pos (), 
+                            player.get_bottom_rows ()
+                        )
                         pos[1] += 3
                         player.set_pos (pos)
 
             # -------------------------------------------------
             #   Check collisions against players and players.
+            #     Only a player that is attacking can hit the
+            #                   other players.
             # -------------------------------------------------
-            for player_two in players:
-                if (player_two != player):
-                    if (player_two.has_character ()):
+            attack = player.get_attacking ()
+            if (attack != 0 and not player.is_dead ()):
+                attack -= 1
+                p1_character = player.get_character ()
+                for player_two in players:
+                    if (player_two != player and player_two.has_character ()):
                         p2_character = player_two.get_character ()
-                        p1_character = player.get_character ()
                         if (player.check_collision (p2_character)):
-                            attack = player.get_attacking ()
-                            if (attack != 0):
-                                attack -= 1
-
-                                damages = p1_character.get_attack_damages ()
-                                player_two.adjust_health (
-                                    -damages[attack], 
-                                    player.get_identifier ()
-                                )
-
-                                knockback = p1_character.get_knockback ()
-                                player_two.apply_knockback (
-                                    p1_character.get_identifier (),
-                                    force_x=knockback[attack][0],
-                                    force_y=knockback[attack][1], 
-                                    direction=p1_character.is_facing_right ()
-                                )
+                            damages = p1_character.get_attack_damages ()
+                            attack_identifier = (Player.MELEE, attack + 1)
+                            player_two.adjust_health (
+                                -damages[attack], 
+                                player.get_identifier (),
+                                attack_identifier
+                            )
+
+                            knockback = p1_character.get_knockback ()
+                            player_two.apply_knockback (
+                                p1_character.get_identifier (),
+                                force_x=knockback[attack][0],
+                                force_y=knockback[attack][1], 
+                                direction=p1_character.is_facing_right (),
+                                attack_identifier=attack_identifier
+                            )
 
             # --------------------------------------
             #   Check if player fell off the edge.
@@ -165,57 +247,43 @@ def get_background (imgs: str, index: int) -> pygame.Surface:
         index (int): The index of the background.
 
     Returns:
-        pygame.Surface: The background image
+        pygame.Surface: The shared background image. Do not draw onto it.
     """
-    backgrounds = os.path.join (
-        imgs,
-        "Maps", 
-        "Backgrounds"
-    )
-
-    return pygame.transform.scale (
-        pygame.image.load (
-            os.path.join (
-                backgrounds,
-                f"Background_{index+1}.png"
-            )
-        ),
-        WIN_SIZE
-    )
+    return Stages.get_background (imgs, index, WIN_SIZE)
 
-def attack (players: "list[Player]", attacks) -> list:
+def attack (players: "list[Player]", attacks: dict) -> dict:
     """
     Check if the players are attacking
-    if so add it to the return list.
+    if so add it to the attacks.
 
     Args:
         players (list[Player]): The list of players.
-        attacks (list[Attack]): The list of Attacks
+        attacks (dict): The attacks on the screen by attack identifier.
 
     Returns:
-        list:
-            The return from all attacks if the attack doesn't return None.
+        dict:
+            The attacks with the return from all attacks added if the 
+            attack doesn't return None.
     """
     for player in players:
         value = None
         attack_value = player.get_attacking_update_one ()
         player.reset_attacking_update ()
 
-        if (attack_value != 0):
+        if (attack_value != 0 and not player.is_dead ()):
             value = player.attack (attack_value)
             # ------------------------------
             #   Special cases for attacks.
             # ------------------------------
             if (isinstance (value, Lightning)):
-                attack_instances = [
-                    isinstance (attack, Lightning)
-                    for attack in attacks
-                ]
-                if (True in attack_instances):
-                    value = None
+                for attack_item in attacks.values ():
+                    if (isinstance (attack_item, Lightning)):
+                        value.release ()
+                        value = None
+                        break
 
         if (value != None):
-            attacks.append (value)
+            attacks[value.get_attack_identifier ()] = value
 
     return attacks
 
@@ -242,52 +310,209 @@ def get_time (minutes: int, seconds: int) -> str:
     
     return f"{minutes}:{seconds}"
 
+def step (state: Game_state, inputs: list) -> Game_state:
+    """
+    Move a match forward one frame. Nothing is drawn.
+
+    Args:
+        state (Game_state): The match.
+        inputs (list): The pygame events of this frame.
+
+    Returns:
+        Game_state: The same state moved forward one frame.
+    """
+    state.clock.tick ()
+    now = state.clock.time ()
+    players = state.players
+
+    # ---------------
+    #   Game timer.
+    # ---------------
+    if (not state.timer_paused):
+        if ((now - state.time_recorded) >= 1):
+            if ((state.timer[1] - 1) < 0):
+                state.timer[1] = 59
+                state.timer[0] -= 1
+            
+            else:
+                state.timer[1] -= 1
+
+            # ----------------------
+            #   End of game check.
+            # ----------------------
+            if (state.timer == [0, 0] and not state.is_over ()):
+                text = check_end_game (
+                    players, 
+                    state.background_index,
+                    state.tie_checks[0],
+                    now
+                )
+                if (text != None):
+                    if (isinstance (text[-1], list)):
+                        state.tie_checks = [
+                            True, 
+                            text,
+                            now
+                        ]
+                        state.texts.append (text[0])
+                        state.timer_paused = True
+                        
+                    else:
+                        state.end (text[:-2], text[-2], text[-1])
+
+            state.time_recorded = now
+
+    # ----------------------------------------------
+    #   Send each key event to the player it's for.
+    #     Players out of the match ignore theirs.
+    # ----------------------------------------------
+    for event in inputs:
+        if (event.type == pygame.KEYDOWN or event.type == pygame.KEYUP):
+            binding = state.get_binding (event.key)
+            if (binding != None and not binding[0].is_dead ()):
+                player, action = binding
+                if (event.type == pygame.KEYDOWN):
+                    player.press (action)
+
+                else:
+                    player.release (action)
+
+    # --------------------------------------
+    #   Run game checks and player checks.
+    # --------------------------------------
+    state.attacks = attack (players, state.attacks)
+    collision (players, list (state.attacks.values ()), state.platforms)
+
+    # ------------------------------------------
+    #   Gravity, speed limits and knockback for 
+    #        everyone at once before moving.
+    # ------------------------------------------
+    state.store.apply_gravity ()
+    state.store.clamp_velocities ()
+    state.store.apply_impulses ()
+
+    alive = 0
+    for player in players:
+        player.move_character (player.get_offset ())
+        player.run_checks ()
+        if (not player.is_dead ()):
+            alive += 1
+
+    # -----------------------------------------
+    #   Once one player or nobody is left see 
+    #          if there is a winner.
+    # -----------------------------------------
+    if (alive <= 1 and len (players) > 1 and not state.is_over ()):
+        text = check_end_game (
+            players,
+            state.background_index,
+            state.tie_checks[0],
+            now
+        )
+        if (text != None):
+            if (isinstance (text[-1], list) == False):
+                state.end (text[:-2], text[-2], text[-1])
+
+    # ------------------------
+    #   Sudden death checks.
+    # ------------------------
+    tie_checks = state.tie_checks
+    if (tie_checks[0]):
+        if (now - tie_checks[2] > tie_checks[1][1][0]):
+            if (not tie_checks[1][1][1]):
+                state.texts.remove (tie_checks[1][0])
+                for player in players:
+                    player.allow_movement ()
+                
+                state.timer = [tie_checks[1][1][2], tie_checks[1][1][3]]
+                state.timer_paused = False
+                tie_checks[1][1][1] = True
+
+    # -----------------------------------------
+    #   Move the attacks and the animations 
+    #    forward and give finished attacks
+    #          back to their pools.
+    # -----------------------------------------
+    state.store.update_projectiles ()
+    finished = [
+        attack_identifier 
+        for attack_identifier, attack_item in state.attacks.items () 
+        if (not attack_item.update ())
+    ]
+    for attack_identifier in finished:
+        state.attacks.pop (attack_identifier).release ()
+
+    for player in players:
+        player.animate ()
+
+    state.frame += 1
+    return state
+
 def draw_window (
     window: pygame.Surface,
-    players: list,
-    attacks: list,
-    platforms: "list[Platform]",
+    state: Game_state,
     background: pygame.Surface=None,
-    texts: list=[]
-) -> "list":
+    texts: list=[],
+    renderer: Dirty_renderer=None,
+    stage: pygame.Surface=None
+) -> None:
     """
-    Draw the window.
+    Draw the window. Only reads the state.
 
     Args:
         window (pygame.Surface): Window to draw on top.
-        players (list): The players to draw.
-        attacks (list): The attacks to draw.
-        platforms (list[Platform]): The platforms to draw.
+        state (Game_state): The match to draw.
         background (pygame.Surface, optional): 
             The background to draw. Defaults to None.
-        texts (list, optional): Text to draw. Defaults to [].
-
-    Returns:
-        list: Attacks left.
+        texts (list, optional): 
+            Text to draw along with the text of the match. Defaults to [].
+        renderer (Dirty_renderer, optional): 
+            Only redraws and sends the areas that changed. Defaults to 
+            None, drawing and sending the whole window.
+        stage (pygame.Surface, optional): 
+            The background with the platforms already drawn on, from 
+            Stages.get_stage. Used instead of background. Defaults to None.
     """
-    if (background != None):
-        window.blit (background, (0, 0))
+    platforms = state.platforms
+    if (stage != None):
+        background = stage
+        platforms = []
+
+    if (renderer != None):
+        renderer.restore (window, background, platforms)
 
     else:
-        window.fill ((0, 0, 0))
+        if (background != None):
+            window.blit (background, (0, 0))
 
-    for platform in platforms:
-        platform.draw (window)
+        else:
+            window.fill ((0, 0, 0))
 
-    for attack in attacks:
-        if (attack.draw (window) != True):
-            attacks.remove (attack)
+        for platform in platforms:
+            platform.draw (window)
 
-    for player in players:
+    # ----------------------------------------------
+    #   The areas are read after drawing since the 
+    #      health text is updated while drawing.
+    # ----------------------------------------------
+    rects = []
+    for attack in state.attacks.values ():
+        attack.draw (window)
+        rects += attack.get_draw_rects ()
+
+    for player in state.players:
         player.draw (window)
-        if (player.character != None):
-            player.character.move_queue ()
+        rects += player.get_draw_rects ()
 
-    for text in texts:
+    for text in state.texts + texts:
         text.draw (window)
+        rects.append (text.get_rect ())
 
-    pygame.display.update ()
-    return attacks
+    if (renderer != None):
+        renderer.present (window, rects)
+
+    else:
+        pygame.display.update ()
 
 
 # -------------------------
@@ -309,11 +534,12 @@ def activate_tie (players: "list[Player]", background: int) -> "list[Text]":
     #   Set the characters to sudden death mode.
     # --------------------------------------------
     sudden_death_health = 400
-    for player in players:
+    for slot, player in enumerate (players):
         player.set_sudden_death (
             sudden_death_health,
             len (players),
-            WIN_SIZE[0]
+            WIN_SIZE[0],
+            slot + 1
         )
     
     # ---------------------------------------------
@@ -347,16 +573,21 @@ def activate_tie (players: "list[Player]", background: int) -> "list[Text]":
         ]
     ]
 
-def activate_win (player: Player, background: int) -> "list[Text]":
+def activate_win (
+    player: Player, 
+    background: int, 
+    now: float
+) -> list:
     """
     Activate the win condition of the game.
 
     Args:
         player (Player): The winning player.
         background (int): The background index.
+        now (float): The game time of the match.
 
     Returns:
-        list[Text]: Text to be displayed.
+        list: [text, text, the winning player, time the match ended]
     """
     player_character = player.get_character ()
     player_value = player_character.get_player_value ()
@@ -406,14 +637,18 @@ def activate_win (player: Player, background: int) -> "list[Text]":
     text_1.set_pos (text_1_pos)
     text_2.set_pos (text_2_pos)
 
-    return [text_1, text_2, time ()]
+    return [text_1, text_2, player, now]
 
-def activate_draw (background: int):
+def activate_draw (background: int, now: float) -> list:
     """
     Activate the draw condition of the game.
 
     Args:
         background (int): The background index
+        now (float): The game time of the match.
+
+    Returns:
+        list: [text, None as nobody won, time the match ended]
     """
     black_bgrnds = [1]
     text_color = (255, 255, 255)
@@ -433,12 +668,13 @@ def activate_draw (background: int):
             (WIN_SIZE[1] // 2) - 100 
         ]
     )
-    return [text, time ()]
+    return [text, None, now]
 
 def check_end_game (
     players: "list[Player]", 
     background: int,
-    sudden_death: bool
+    sudden_death: bool,
+    now: float
 ) -> "list[Text]" or None:
     """
     Check all end game conditions.
@@ -447,9 +683,12 @@ def check_end_game (
         players (list[Player]): All players.
         background (int): The background index.
         sudden_death (bool): Are we in sudden death.
+        now (float): The game time of the match.
     
     Returns:
-        list or None: None or [text, text, ..., time or list]
+        list or None: 
+            None, [text, ..., winner or None, time] when the match ended 
+            or [text, list] for sudden death.
     """
     # ----------------------------------
     #   Get the health of all players.
@@ -493,10 +732,13 @@ def check_end_game (
                     if (player[0] > highest[0]):
                         highest = [player[0], player[1]]
                 
-                return activate_win (highest[1], background)
-            return activate_tie ([player[1] for player in ranks[rank]], background)
+                return activate_win (highest[1], background, now)
+            return activate_tie (
+                [player[1] for player in ranks[rankings[0]]], 
+                background
+            )
         else:
-            return activate_win (ranks[rankings[0]][0][1], background)
+            return activate_win (ranks[rankings[0]][0][1], background, now)
     
     else:
         # -------------------------------------
@@ -530,11 +772,86 @@ def check_end_game (
                         count += 1
                 
                 if (count != 0):
-                    return activate_draw (background)
-                return activate_win (highest[1], background)
+                    return activate_draw (background, now)
+                return activate_win (highest[1], background, now)
             return activate_tie ([player[1] for player in ranks[rank]], background)
         else:
-            return activate_win (ranks[rank][ranking][0], background)
+            return activate_win (ranks[rank][0][1], background, now)
+
+
+# --------------------
+#   Setup functions.
+# --------------------
+
+def initialize (music: bool=True) -> pygame.Surface:
+    """
+    Set up pygame, open the game window and start the music. Nothing in the 
+    game touches the display, mixer or fonts when it is imported so this 
+    has to be called before anything is drawn.
+
+    Args:
+        music (bool, optional): Play the music. Defaults to True.
+
+    Returns:
+        pygame.Surface: The game window.
+    """
+    pygame.init ()
+    window = pygame.display.set_mode (WIN_SIZE)
+
+    if (music):
+        music_file = os.path.join (os.getcwd (), "SOUNDS", MUSIC_FILE)
+        mixer.init ()
+        mixer.music.load (music_file)
+        mixer.music.play (loops=-1)
+
+    return window
+
+def create_platforms () -> "list[Platform]":
+    """
+    Create the platforms of the map.
+
+    Returns:
+        list[Platform]: The platforms.
+    """
+    platforms = [
+        Platform (
+            0, 0,
+            Assets.load_image (
+                os.path.join (
+                    os.getcwd (), 
+                    "IMGS", 
+                    "Maps", 
+                    "Platforms",
+                    "Platform_2.png"
+                )
+            )
+        )
+    ]
+
+    platforms[0].set_pos (
+        [
+            # Offset by 10
+            (WIN_SIZE[0] // 2) - (platforms[0].get_width () // 2) - 10,
+            400
+        ]
+    )
+    return platforms
+
+def create_players (count: int=MAX_PLAYERS) -> "list[Player]":
+    """
+    Create the players with their keybindings.
+
+    Args:
+        count (int, optional): 
+            The amount of players, up to MAX_PLAYERS. Defaults to MAX_PLAYERS.
+
+    Returns:
+        list[Player]: The players without characters.
+    """
+    return [
+        Player (up, down, left, right, list (attacks)) 
+        for up, down, left, right, attacks in KEYBINDINGS[:count]
+    ]
 
 
 # ------------------
@@ -548,6 +865,7 @@ def main ():
 
         Args:
             win (pygame.Surface): The window to draw on.
+            plyrs (list): The character classes that can be picked.
 
         Returns:
             list: The players and if the user quit
@@ -562,6 +880,61 @@ def main ():
         padding = 20
         button_width = 200
         button_height = 100
+        count_button_width = 80
+
+        def player_count (_: int=0) -> list:
+            """
+            The screen to pick how many players are playing.
+
+            Args:
+                _ (int): Unused variable.
+
+            Returns:
+                list: [[buttons], [images], [texts], data]
+            """
+            counts = list (range (2, MAX_PLAYERS + 1))
+            count_text = Text (
+                text="Select players", pos=[0, 0], 
+                text_color=(255, 255, 255), font_size=30
+            )
+            count_text.set_pos (
+                [
+                    (WIN_SIZE[0] // 2) - (count_text.get_width () // 2),
+                    10
+                ]
+            )
+            x = WIN_SIZE[0] - (2 * padding)
+            x -= len (counts) * count_button_width
+            x //= len (counts) - 1
+            return [
+                [
+                    Button (
+                        x=padding + (count_button_width * pos) + (x * pos), 
+                        y=350, width=count_button_width, height=button_height,
+                        buttonText=str (count), 
+                        onclickFunction=set_player_count, index=count
+                    ) for pos, count in enumerate (counts)
+                ],
+                [],
+                [
+                    count_text
+                ],
+                None
+            ]
+
+        def set_player_count (count: int) -> list:
+            """
+            Keep the amount of players picked and go to the character select.
+
+            Args:
+                count (int): The amount of players.
+
+            Returns:
+                list: [[buttons], [images], [texts], data]
+            """
+            nonlocal max_players
+            max_players = count
+            return player_select ()
 
 
         def player_select (_: int=0, data_in=None) -> list:
@@ -594,7 +967,8 @@ def main ():
                         x=padding + (button_width * pos) + (x * pos), 
                         y=100, width=button_width, height=button_height,
                         buttonText=plyr_names[pos], 
-                        onclickFunction=detail_checker, index=pos
+                        onclickFunction=detail_checker, index=pos,
+                        onhoverFunction=preload
                     ) for pos in range (len (plyrs))
                 ],
                 [
@@ -652,6 +1026,15 @@ def main ():
                 data_in
             ]
 
+        def preload (index: int) -> None:
+            """
+            Start loading a character as soon as its button is hovered.
+
+            Args:
+                index (int): The index of the character.
+            """
+            loader.preload (plyrs[index])
+
         def detail_checker (index: int) -> list:
             global players_selected
             """
@@ -682,7 +1065,7 @@ def main ():
                 width=button_width,
                 height=button_height,
                 buttonText="Start",
-                onclickFunction=player_select,
+                onclickFunction=player_count,
                 index=0
             )
         ]
@@ -739,235 +1122,103 @@ def main ():
         return data + [quit]
 
     global win
-    win = pygame.display.set_mode (WIN_SIZE)
+    win = initialize ()
     clock = pygame.time.Clock ()
 
-    music_file = r"C:\Users\munta\Downloads\Project Folder\Project Folder\SOUNDS\bg_music_02.mp3"
-    mixer.init ()
-    mixer.music.load (music_file)
-    mixer.music.play (loops=-1)
-
     imgs_path = os.path.join (
         os.getcwd (),
-        "Project Folder"
         "IMGS"
     )
+
+    # --------------------------------------------------
+    #   Characters are only loaded once they are being
+    #        picked on the character select screen.
+    # --------------------------------------------------
+    loader = Character_loader (imgs_path)
     players_classes = [
-        Link (imgs_path, [0, 0], 0),
-        Pikachu (imgs_path, [0, 0], 0),
-        Captain_Falcon (imgs_path, [0, 0], 0)
+        Link,
+        Pikachu,
+        Captain_Falcon
     ]
 
     run = True
-    timer_minutes = 5
-    timer_seconds = 0
-
-    platforms = [
-        Platform (
-            0, 0,
-            pygame.image.load (
-                os.path.join (
-                    os.getcwd (), 
-                    "IMGS", 
-                    "Maps", 
-                    "Platforms",
-                    "Platform_2.png"
-                )
-            )
-        )
-    ]
-
-    platforms[0].set_pos (
-        [
-            # Offset by 10
-            (WIN_SIZE[0] // 2) - (platforms[0].get_width () // 2) - 10,
-            400
-        ]
-    )
-
-    players = [
-        Player (
-            pygame.K_w, # Up
-            pygame.K_s, # Down
-            pygame.K_a, # Left
-            pygame.K_d, # Right
-            [
-                pygame.K_q, # Attack 1
-                pygame.K_e  # Attack 2
-            ]
-        ),
-        Player (
-            pygame.K_p,             # Up
-            pygame.K_SEMICOLON,     # Down
-            pygame.K_l,             # Left
-            pygame.K_QUOTE,         # Right
-            [
-                pygame.K_o,             # Attack 1
-                pygame.K_LEFTBRACKET    # Attack 2
-            ]
-        )
-    ]
-    attacks = []
-    
-    tie_checks = [False]
-    timer_paused = False
-    time_recorded = time ()
-    move_screen = -1
+    platforms = create_platforms ()
+    players = create_players ()
+    state = None
     while (run):
         clock.tick (FPS)
 
-        # ---------------------
-        #   Changing screens.
-        # ---------------------
-        if (move_screen != 0 or move_screen == -1):
-            if (time () - move_screen > 10 or move_screen == -1):
-                move_screen = 0
-
-                data = main_menu (win, players_classes)
-                if (data[-1]):
-                    return
-
-                timer_minutes = 0
-                timer_seconds = 20
-                tie_checks = [False]
-
-                background = get_background (imgs_path, data[-2])
-                background_index = data[-2]
-                data = data[:-2]
-
-                timer = get_time (timer_minutes, timer_seconds)
-                texts = [
-                    Text (
-                        timer,
-                        (WIN_SIZE[1] - len (timer) * 9, 0),
-                        (255, 255, 255)
-                    )
-                ]
+        # ----------------------------------------
+        #   Changing screens once a match ended 
+        #       10 seconds ago or at the start.
+        # ----------------------------------------
+        if (state == None or (
+            state.is_over () and state.clock.time () - state.end_time > 10
+        )):
+            data = main_menu (win, players_classes)
+            if (data[-1]):
+                return
+
+            background_index = data[-2]
+            stage = Stages.get_stage (
+                imgs_path, 
+                background_index, 
+                WIN_SIZE, 
+                platforms
+            )
+            data = data[:-2]
+
+            # -----------------------------------------------
+            #   Assign the correct character to the player.
+            # -----------------------------------------------
+            store = Entities.Store ()
+            match_players = players[:len (data)]
+            for pos, player in enumerate (match_players):
+                player.set_character (
+                    loader.create (players_classes[data[pos]], pos + 1, store)
+                )
 
-                # -----------------------------------------------
-                #   Assign the correct character to the player.
-                # -----------------------------------------------
-                for pos, player in enumerate (players):
-                    if (pos < len (data)):
-                        players_classes[data[pos]].set_player_value (pos + 1)
-                        player.set_character (players_classes[data[pos]])
-
-                # ------------------------------------------------------
-                #   Get the players to spawn in relatively nice areas.
-                # ------------------------------------------------------
-                for player in players:
-                    player.set_starting_pos (len (players), WIN_SIZE[0])
-                
-                timer_paused = False
-
-        # ---------------
-        #   Game timer.
-        # ---------------
-        if (not timer_paused):
-            if ((time () - time_recorded) >= 1):
-                if ((timer_seconds - 1) < 0):
-                    timer_seconds = 59
-                    timer_minutes -= 1
-                
-                else:
-                    timer_seconds -= 1
-
-                # ----------------------
-                #   End of game check.
-                # ----------------------
-                if (timer_minutes == 0 and move_screen == 0):
-                    if (timer_seconds == 0):
-                        text = check_end_game (
-                            players, 
-                            background_index,
-                            tie_checks[0]
-                        )
-                        if (text != None):
-                            if (isinstance (text[-1], list)):
-                                tie_checks = [
-                                    True, 
-                                    text,
-                                    time ()
-                                ]
-                                texts.append (text[0])
-                                timer_paused = True
-                                
-                            else:
-                                move_screen = text[-1]
-                                timer_paused = True
-                                for text_item in text[:-1]:
-                                    texts.append (text_item)          
-
-                time_recorded = time ()
-                texts[0].set_text (get_time (timer_minutes, timer_seconds))
+            # ------------------------------------------------------
+            #   Get the players to spawn in relatively nice areas.
+            # ------------------------------------------------------
+            for player in match_players:
+                player.set_starting_pos (len (match_players), WIN_SIZE[0])
+
+            state = Game_state (
+                match_players, 
+                platforms, 
+                store, 
+                background_index
+            )
+            renderer = Dirty_renderer ()
+
+            timer = get_time (*state.timer)
+            timer_text = Text (
+                timer,
+                (WIN_SIZE[1] - len (timer) * 9, 0),
+                (255, 255, 255)
+            )
 
         # ----------------------------
         #   Check for event updates.
         # ----------------------------
-        for event in pygame.event.get ():
+        events = pygame.event.get ()
+        for event in events:
             if (event.type == pygame.QUIT):
                 run = False
 
-            # ----------------------------------
-            #   Process all player key events.
-            # ----------------------------------
-            for player in players:
-                player.key_event (event)
-
-        # --------------------------------------
-        #   Run game checks and player checks.
-        # --------------------------------------
-        attacks = attack (players, attacks)
-        collision (players, attacks, platforms)
-
-        for player in players:
-            player.move_character (player.get_offset ())
-            player.run_checks ()
-
-            # --------------------------------
-            #   If a player is dead check to 
-            #    see if there is a winner.
-            # --------------------------------
-            if (player.is_dead () and move_screen == 0):
-                text = check_end_game (
-                    players,
-                    background_index,
-                    tie_checks[0]
-                )
-                if (text != None):
-                    if (isinstance (text[-1], list) == False):
-                        move_screen = text[-1]
-                        timer_paused = True
-                        for text_item in text[:-1]:
-                            texts.append (text_item)
-
-
-        # ------------------------
-        #   Sudden death checks.
-        # ------------------------
-        if (tie_checks[0]):
-            if (time () - tie_checks[2] > tie_checks[1][1][0]):
-                if (not tie_checks[1][1][1]):
-                    texts.remove (tie_checks[1][0])
-                    for player in players:
-                        player.allow_movement ()
-                    
-                    timer_minutes = tie_checks[1][1][2]
-                    timer_seconds = tie_checks[1][1][3]
-                    timer_paused = False
-                    tie_checks[1][1][1] = True
-                
+        # -------------------------------------
+        #   Run the game logic then draw it.
+        # -------------------------------------
+        state = step (state, events)
 
-        # --------------------
-        #   Draw the window.
-        # --------------------
-        attacks = draw_window (
+        timer_text.set_text (get_time (*state.timer))
+        draw_window (
             win, 
-            players, 
-            attacks, 
-            platforms, 
-            background=background,
-            texts=texts
+            state, 
+            texts=[timer_text], 
+            renderer=renderer,
+            stage=stage
         )
 
 
@@ -8,9 +8,23 @@
 # \___________________________________________________________________________/
 
 
+from collections import OrderedDict
 import pygame
+import Fonts
+
+FONT_NAME = "lato" # Shipped in FONTS so every machine draws the same text.
+RENDER_CACHE_SIZE = 256
+
+# ---------------------------------------------------------
+#   Rendered text shared by every Text, least recently
+#   used first. Keyed by (font name, size, text, color).
+# ---------------------------------------------------------
+_rendered = OrderedDict ()
+
 
 class Text ():
+    __slots__ = ("text", "pos", "text_color", "font_size", "font", "image")
+
     def __init__ (
         self, 
         text: str, 
@@ -18,12 +32,12 @@ class Text ():
         text_color: "tuple[int]", 
         font_size:int=18
     ):
-        pygame.font.init ()
         self.text = text
         self.pos = pos
-        self.text_color = text_color
+        self.text_color = tuple (text_color)
+        self.font_size = font_size
 
-        self.font = pygame.font.SysFont ("comic sans ms", font_size)
+        self.font = Fonts.get_font (FONT_NAME, font_size)
         self._update_image ()
 
 
@@ -39,6 +53,10 @@ class Text ():
             color (tuple[int]): 
                 An RGB value for the text to be assigned to.
         """
+        color = tuple (color)
+        if (color == self.text_color):
+            return
+
         self.text_color = color
         self._update_image ()
     
@@ -70,6 +88,9 @@ class Text ():
         Args:
             text (str): The text to assign.
         """
+        if (text == self.text):
+            return
+
         self.text = text
         self._update_image ()
 
@@ -100,6 +121,20 @@ class Text ():
         """
         return self.image.get_width ()
 
+    def get_rect (self) -> pygame.Rect:
+        """
+        Get the area of the screen the text is drawn on.
+
+        Returns:
+            pygame.Rect: The rectangle.
+        """
+        return pygame.Rect (
+            int (self.pos[0]), 
+            int (self.pos[1]), 
+            self.image.get_width (), 
+            self.image.get_height ()
+        )
+
 
     # //////////////////////////////
     #       Private functions.
@@ -107,9 +142,21 @@ class Text ():
 
     def _update_image(self) -> None:
         """
-        Update the image variable.
-        """
-        self.image = self.font.render (self.text, False, self.text_color)
+        Update the image variable, reusing the rendered text if the same 
+        text was rendered recently.
+        """
+        key = (FONT_NAME, self.font_size, self.text, self.text_color)
+        if (key in _rendered):
+            _rendered.move_to_end (key)
+        
+        else:
+            _rendered[key] = self.font.render (
+                self.text, False, self.text_color
+            )
+            if (len (_rendered) > RENDER_CACHE_SIZE):
+                _rendered.popitem (last=False)
+
+        self.image = _rendered[key]
 
 
 
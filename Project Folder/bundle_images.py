@@ -0,0 +1,126 @@
+#  ___________________________________________________________________________
+# /                              bundle_images              Date: 2026-10-18 \
+# |                                                                           |
+# |                                Description                                |
+# |                                                                           |
+# |  Offline tool that packs every image in IMGS into one file (IMGS.bundle). |
+# | The file holds a JSON index followed by the raw RGBA pixels of each image |
+# |  so the game can memory-map it instead of decoding PNG and JPG files. The |
+# |     manifest of every character folder is stored in the index as well.    |
+# |                                                                           |
+# |  The modified time and size of every bundled file are stored too, so the  |
+# |            game reads any file changed since from disk instead.           |
+# |                                                                           |
+# |     Run it from the folder containing the python files after adding or    |
+# |              renaming images and after running Manifest.py.               |
+# |                                                                           |
+# \___________________________________________________________________________/
+
+from Assets import BUNDLE_NAME, BUNDLE_MAGIC, BUNDLE_HEADER, DATA_ALIGN
+import Manifest
+import Assets
+import pygame
+import json
+import os
+
+
+def build_bundle (root: str) -> str:
+    """
+    Write the bundle for every image inside root/IMGS.
+
+    Args:
+        root (str): The folder containing IMGS.
+
+    Returns:
+        str: The path to the bundle.
+    """
+    imgs = os.path.join (root, "IMGS")
+
+    # ---------------------------------------
+    #   Decode every image and lay out the
+    #       raw pixels one after another.
+    # ---------------------------------------
+    images = {}
+    sources = {}
+    pixels = []
+    offset = 0
+    for folder, _, files in sorted (os.walk (imgs)):
+        for file in sorted (files):
+            if (not file.lower ().endswith (Manifest.EXTENSIONS)):
+                continue
+
+            path = os.path.join (folder, file)
+            image = pygame.image.load (path)
+            data = pygame.image.tobytes (image, "RGBA")
+
+            key = _get_key (root, path)
+            images[key] = [
+                offset,
+                image.get_width (),
+                image.get_height ()
+            ]
+            sources[key] = Assets.get_source_stamp (path)
+            padding = -len (data) % DATA_ALIGN
+            pixels.append (data + bytes (padding))
+            offset += len (data) + padding
+
+    # --------------------------------------------
+    #   Character folders are the ones that have
+    #     a manifest. Store it with the images.
+    # --------------------------------------------
+    manifests = {}
+    for character in sorted (os.listdir (imgs)):
+        character = os.path.join (imgs, character)
+        if (os.path.isdir (character)):
+            manifest = Manifest.read_manifest (character)
+            if (manifest != None):
+                path = os.path.join (character, Manifest.MANIFEST_NAME)
+                key = _get_key (root, path)
+                manifests[key] = manifest
+                sources[key] = Assets.get_source_stamp (path)
+
+    # -------------------
+    #   Write the file.
+    # -------------------
+    index = json.dumps (
+        {"images": images, "manifests": manifests, "sources": sources}
+    ).encode ()
+    start = len (BUNDLE_MAGIC) + BUNDLE_HEADER.size + len (index)
+
+    bundle_path = os.path.join (root, BUNDLE_NAME)
+    with open (bundle_path, "wb") as file:
+        file.write (BUNDLE_MAGIC)
+        file.write (BUNDLE_HEADER.pack (len (index)))
+        file.write (index)
+        file.write (bytes (-start % DATA_ALIGN))
+        for data in pixels:
+            file.write (data)
+
+    print (f"Bundled {len (images)} images into {bundle_path}")
+    return bundle_path
+
+
+def _get_key (root: str, path: str) -> str:
+    """
+    Get the name a path is stored under in the bundle.
+
+    Args:
+        root (str): The folder containing IMGS.
+        path (str): The path.
+
+    Returns:
+        str: The path relative to root using "/".
+    """
+    return os.path.relpath (
+        os.path.realpath (path),
+        os.path.realpath (root)
+    ).replace (os.sep, "/")
+
+
+def main ():
+    build_bundle (os.getcwd ())
+
+
+
+if (__name__ == "__main__"):
+    main ()